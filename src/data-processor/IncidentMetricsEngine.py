@@ -0,0 +1,275 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Optional, Union
+
+
+class IncidentMetricsEngine:
+    """
+    Engine computing the Production Stability and Production Reactivity metrics from an incident table.
+
+    All aggregations are done with integer codes and np.bincount, so the cost is linear in the number
+    of incidents and does not depend on the number of (application, month) pairs.
+
+    Usage:
+        engine = IncidentMetricsEngine()
+        engine.set_data(incidents_df).set_season('2024-09-01', '2025-08-31')
+        blocker_critical = engine.compute_monthly_counts(engine.BLOCKER_CRITICAL_PRIORITIES)
+        mttr = engine.compute_mttr()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # Incident table columns (see doc/data-dictionary.md - Incident entity)
+    CREATION_DATE_COLUMN = 'incident_creation_date'
+    RESOLUTION_DATE_COLUMN = 'resolution_date'
+    PRIORITY_COLUMN = 'priority'
+    APPLICATION_COLUMN = 'faulty_application'
+    NOT_AN_INCIDENT_COLUMN = 'flagged_as_not_an_incident'
+
+    REQUIRED_COLUMNS = [CREATION_DATE_COLUMN, RESOLUTION_DATE_COLUMN, PRIORITY_COLUMN, APPLICATION_COLUMN]
+
+    # Priority groups used by the metrics workbook
+    BLOCKER_CRITICAL_PRIORITIES = ['Blocker', 'Critical']
+    MAJOR_PRIORITIES = ['Major']
+    MTTR_PRIORITIES = ['Blocker', 'Critical']
+
+    # Mean Time To Restore unit
+    MTTR_UNIT = pd.Timedelta(hours=1)
+    MTTR_DECIMALS = 1
+
+    # Name of the month index in the monthly frames
+    MONTH_INDEX_NAME = 'Month'
+
+    def __init__(self):
+        self._incidents: Optional[pd.DataFrame] = None
+        self._app_codes: Optional[np.ndarray] = None
+        self._applications: Optional[pd.Index] = None
+        self._month_codes: Optional[np.ndarray] = None
+        self._season_start: Optional[pd.Timestamp] = None
+        self._season_end: Optional[pd.Timestamp] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_data(self, data: Union[pd.DataFrame, Dict]) -> 'IncidentMetricsEngine':
+        """
+        Set the incident table.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain the creation date, resolution date, priority and faulty application columns.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        if isinstance(data, dict):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data
+        else:
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        self._validate_data_frame(df)
+        self._incidents = self._prepare_incidents(df)
+
+        # Factorize once, every aggregation below reuses these codes
+        self._app_codes, self._applications = pd.factorize(self._incidents[self.APPLICATION_COLUMN], sort=True)
+        self._month_codes = self._to_month_codes(self._incidents[self.CREATION_DATE_COLUMN])
+
+        return self
+
+    def set_season(self, start: Union[str, pd.Timestamp], end: Union[str, pd.Timestamp]) -> 'IncidentMetricsEngine':
+        """
+        Restrict the computations to a season (e.g. 01-09-2024 - 31-08-2025 for Season 2025).
+
+        Args:
+            start: First day of the season (inclusive)
+            end: Last day of the season (inclusive)
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the season end is before its start
+        """
+        season_start = pd.Timestamp(start)
+        season_end = pd.Timestamp(end)
+        if season_end < season_start:
+            raise ValueError(f"Season end '{season_end.date()}' is before season start '{season_start.date()}'")
+
+        self._season_start = season_start
+        self._season_end = season_end
+
+        return self
+
+    def compute_monthly_counts(self, priorities: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Count the incidents per application and per month.
+
+        Args:
+            priorities: Priorities to count (e.g. BLOCKER_CRITICAL_PRIORITIES). If None, counts all priorities.
+
+        Returns:
+            DataFrame indexed by month (first day of month) with one column per application.
+            Months without incident are present with a 0 count.
+
+        Raises:
+            ValueError: If data is not set
+        """
+        self._check_data()
+
+        months = self._get_months()
+        num_months = len(months)
+        num_apps = len(self._applications)
+
+        mask = self._get_selection_mask(priorities)
+        first_month_code = months[0].year * 12 + months[0].month - 1 if num_months else 0
+        month_idx = self._month_codes[mask] - first_month_code
+
+        flat_idx = month_idx * num_apps + self._app_codes[mask]
+        counts = np.bincount(flat_idx, minlength=num_months * num_apps).reshape(num_months, num_apps)
+
+        return pd.DataFrame(
+            counts,
+            index=pd.DatetimeIndex(months, name=self.MONTH_INDEX_NAME),
+            columns=self._applications
+        )
+
+    def compute_mttr(self, priorities: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Compute the Mean Time To Restore per priority and per application.
+
+        Unresolved incidents are ignored. Applications without resolved incident for a priority get NaN.
+
+        Args:
+            priorities: Priorities to report, one row each. If None, uses MTTR_PRIORITIES.
+
+        Returns:
+            DataFrame with a 'Category' column (the priority) and one column per application,
+            expressed in MTTR_UNIT.
+
+        Raises:
+            ValueError: If data is not set
+        """
+        self._check_data()
+
+        if priorities is None:
+            priorities = self.MTTR_PRIORITIES
+
+        priority_codes = pd.Index(priorities).get_indexer(self._incidents[self.PRIORITY_COLUMN])
+        durations = (
+            self._incidents[self.RESOLUTION_DATE_COLUMN] - self._incidents[self.CREATION_DATE_COLUMN]
+        ).to_numpy() / self.MTTR_UNIT.to_timedelta64()
+
+        mask = self._get_selection_mask(None) & (priority_codes >= 0) & ~np.isnan(durations)
+        num_apps = len(self._applications)
+        size = len(priorities) * num_apps
+        flat_idx = priority_codes[mask].astype(np.int64) * num_apps + self._app_codes[mask]
+
+        sums = np.bincount(flat_idx, weights=durations[mask], minlength=size)
+        counts = np.bincount(flat_idx, minlength=size)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan).reshape(len(priorities), num_apps)
+
+        mttr = pd.DataFrame(means.round(self.MTTR_DECIMALS), columns=self._applications)
+        mttr.insert(0, 'Category', priorities)
+
+        return mttr
+
+    def get_applications(self) -> List[str]:
+        """
+        Get the applications found in the incident table.
+
+        Returns:
+            Sorted list of faulty applications
+        """
+        self._check_data()
+        return self._applications.tolist()
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        """Validate that the DataFrame has the required columns"""
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"Incident table is missing columns: {missing_columns}")
+
+    def _check_data(self) -> None:
+        if self._incidents is None:
+            raise ValueError("Data must be set before computing metrics. Call set_data() first.")
+
+    # ========== DATA PROCESSING METHODS ==========
+
+    def _prepare_incidents(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the useful columns, parse the dates, drop the rows flagged as not an incident or without application"""
+        columns = list(self.REQUIRED_COLUMNS)
+        if self.NOT_AN_INCIDENT_COLUMN in df.columns:
+            columns.append(self.NOT_AN_INCIDENT_COLUMN)
+
+        incidents = df[columns].copy()
+        incidents[self.CREATION_DATE_COLUMN] = pd.to_datetime(incidents[self.CREATION_DATE_COLUMN])
+        incidents[self.RESOLUTION_DATE_COLUMN] = pd.to_datetime(incidents[self.RESOLUTION_DATE_COLUMN])
+
+        if self.NOT_AN_INCIDENT_COLUMN in incidents.columns:
+            not_an_incident = incidents.pop(self.NOT_AN_INCIDENT_COLUMN).fillna(False).astype(bool)
+            incidents = incidents[~not_an_incident.to_numpy()]
+
+        # A missing application would get the factorize code -1 and be counted in the neighbouring cell
+        return incidents.dropna(subset=[self.CREATION_DATE_COLUMN, self.APPLICATION_COLUMN]).reset_index(drop=True)
+
+    def _get_selection_mask(self, priorities: Optional[List[str]]) -> np.ndarray:
+        """Boolean mask of the incidents matching the priorities and the season"""
+        mask = np.ones(len(self._incidents), dtype=bool)
+
+        if priorities is not None:
+            mask &= self._incidents[self.PRIORITY_COLUMN].isin(priorities).to_numpy()
+
+        if self._season_start is not None:
+            created = self._incidents[self.CREATION_DATE_COLUMN]
+            mask &= ((created >= self._season_start) & (created < self._season_end + pd.Timedelta(days=1))).to_numpy()
+
+        return mask
+
+    def _get_months(self) -> pd.DatetimeIndex:
+        """All months covered by the season, or by the incident table if no season is set"""
+        if self._season_start is not None:
+            start, end = self._season_start, self._season_end
+        elif len(self._incidents) > 0:
+            start = self._incidents[self.CREATION_DATE_COLUMN].min()
+            end = self._incidents[self.CREATION_DATE_COLUMN].max()
+        else:
+            return pd.DatetimeIndex([])
+
+        return pd.date_range(start.to_period('M').to_timestamp(), end, freq='MS')
+
+    # ========== HELPER METHODS ==========
+
+    @staticmethod
+    def _to_month_codes(dates: pd.Series) -> np.ndarray:
+        """Convert dates to a monotonic month number (year * 12 + month)"""
+        return (dates.dt.year.to_numpy() * 12 + dates.dt.month.to_numpy() - 1).astype(np.int64)
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    incidents = {
+        'jira_id': ['INC-1', 'INC-2', 'INC-3', 'INC-4', 'INC-5', 'INC-6'],
+        'incident_creation_date': ['2024-09-03 08:00', '2024-10-12 10:00', '2024-10-20 14:00',
+                                   '2025-01-07 09:00', '2025-02-08 16:00', '2025-02-10 11:00'],
+        'resolution_date': ['2024-09-03 09:00', '2024-10-12 14:00', None,
+                            '2025-01-07 11:00', '2025-02-09 16:00', '2025-02-10 12:30'],
+        'priority': ['Blocker', 'Critical', 'Major', 'Critical', 'Blocker', 'Major'],
+        'faulty_application': ['AAA', 'BBB', 'BBB', 'DDD', 'AAA', 'CCC']
+    }
+
+    engine = IncidentMetricsEngine()
+    engine.set_data(incidents).set_season('2024-09-01', '2025-08-31')
+
+    print(engine.compute_monthly_counts(engine.BLOCKER_CRITICAL_PRIORITIES))
+    print(engine.compute_monthly_counts(engine.MAJOR_PRIORITIES))
+    print(engine.compute_mttr())
@@ -0,0 +1,246 @@
+import pandas as pd
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Union, Callable, Tuple, Any
+
+from QSnapDataStore import QSnapDataStore
+
+
+# Fetch callable of a datasource: gets the high-water mark (None on the first run), returns the records
+# changed since then, each one carrying its extraction date
+FetchFunction = Callable[[Optional[pd.Timestamp]], Union[pd.DataFrame, List[Dict[str, Any]]]]
+
+
+@dataclass
+class FetchSource:
+    """Registration of a datasource: how to fetch its changed records and where to merge them"""
+    datasource: str
+    fetch: FetchFunction
+    table: str
+
+
+class IncrementalFetcher:
+    """
+    Incremental refresh of the local store from the datasources of the application data model.
+
+    Every field of the model carries its datasource and extractionDate (see
+    src/fetchers-interfaces/application_data_model_schema.json). The fetcher keeps, per datasource, the
+    latest extraction date merged in the store (its high-water mark) and only asks the source for the
+    records changed since then. The deltas are merged on the natural key of their table
+    (QSnapDataStore.upsert_frame), then the mark moves forward: a daily refresh only moves the changed data.
+
+    The mark is saved after the merge. If a run stops in between, the next one fetches the same records again
+    and the merge, keyed, stays idempotent. Records of applications not in the store yet (orphans) are not
+    merged but kept in the store, and retried on every refresh until their application is known. Orphans still
+    unknown after ORPHAN_MAX_AGE are dropped and reported (get_expired_orphans()). For sources committing records
+    late, with an earlier extraction date, the requested mark can be moved back by WATERMARK_OVERLAP (re-merging
+    the overlap).
+
+    Usage:
+        fetcher = IncrementalFetcher(QSnapDataStore('qsnap.db'))
+        fetcher.register('jira.com', fetch_jira_incidents, 'incident')
+        fetcher.register('sonar.io', fetch_sonar_snapshots, 'static_quality')
+        stats = fetcher.refresh()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # Datasource enum of the application data model
+    DATASOURCES = ['jira.com', 'jira.io', 'sonar.io', 'product_catalogue', 'snapshot_formular']
+
+    # Provenance column of the fetched records (extractionDate of the data model)
+    EXTRACTION_DATE_COLUMN = 'extraction_date'
+    EXTRACTION_DATE_FIELD = 'extractionDate'
+
+    # Records may reference their application by trigram: resolved to the id column of their table
+    TRIGRAM_COLUMN = 'trigram'
+    APPLICATION_REFERENCES = {
+        'incident': 'faulty_application',
+        'release': 'application_id',
+        'static_quality': 'application_id',
+        'interview': 'application_id',
+        'snapshot': 'application_id'
+    }
+
+    # Safety margin for records committed late at the source. Everything in the margin is fetched again.
+    WATERMARK_OVERLAP = pd.Timedelta(0)
+
+    # How long an orphan is retried before being dropped (e.g. a deleted application or a typo in a trigram)
+    ORPHAN_MAX_AGE = pd.Timedelta(days=30)
+
+    def __init__(self, store: QSnapDataStore):
+        self._store = store
+        self._sources: Dict[str, FetchSource] = {}
+        self._expired_orphans: List[pd.DataFrame] = []
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def register(self, datasource: str, fetch: FetchFunction, table: str) -> 'IncrementalFetcher':
+        """
+        Register the fetch of a datasource.
+
+        Args:
+            datasource: Datasource name, one of DATASOURCES
+            fetch: Callable returning the records changed since the given mark (None: all records)
+            table: Store table the records are merged in, on its natural key
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the datasource or the table is unknown
+        """
+        if datasource not in self.DATASOURCES:
+            raise ValueError(f"Unknown datasource '{datasource}'. Supported: {self.DATASOURCES}")
+        if table not in QSnapDataStore.TABLES:
+            raise ValueError(f"Unknown table '{table}'. Available tables: {list(QSnapDataStore.TABLES)}")
+
+        self._sources[datasource] = FetchSource(datasource, fetch, table)
+        return self
+
+    def refresh(self, datasources: Optional[List[str]] = None, full: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch and merge the records changed since the mark of each datasource.
+
+        Args:
+            datasources: Datasources to refresh. Defaults to all the registered ones.
+            full: True ignores the marks and fetches everything again
+
+        Returns:
+            Per datasource: 'fetched', 'inserted', 'updated', 'orphans' (unknown trigram, kept) and 'expired'
+            (orphans dropped) row counts, and the new 'watermark'
+
+        Raises:
+            ValueError: If a datasource is not registered or its records have no extraction date
+        """
+        stats = {}
+        for datasource in datasources or list(self._sources):
+            if datasource not in self._sources:
+                raise ValueError(f"Datasource '{datasource}' is not registered")
+            stats[datasource] = self._refresh_source(self._sources[datasource], full)
+        return stats
+
+    def get_watermarks(self) -> Dict[str, Optional[pd.Timestamp]]:
+        return {datasource: self._store.get_watermark(datasource) for datasource in self._sources}
+
+    def get_expired_orphans(self) -> pd.DataFrame:
+        """
+        Get the orphans dropped by the refreshes of this fetcher, after ORPHAN_MAX_AGE without their application.
+
+        Returns:
+            The dropped records, with their datasource and first fetch date
+        """
+        return pd.concat(self._expired_orphans, ignore_index=True) if self._expired_orphans else pd.DataFrame()
+
+    # ========== REFRESH METHODS ==========
+
+    def _refresh_source(self, source: FetchSource, full: bool) -> Dict[str, Any]:
+        watermark = None if full else self._store.get_watermark(source.datasource)
+        since = watermark - self.WATERMARK_OVERLAP if watermark is not None else None
+
+        records = pd.DataFrame(source.fetch(since))
+        stats = {'fetched': len(records), 'inserted': 0, 'updated': 0, 'orphans': 0, 'expired': 0,
+                 'watermark': watermark}
+
+        latest = pd.NaT
+        if not records.empty:
+            records = records.rename(columns={self.EXTRACTION_DATE_FIELD: self.EXTRACTION_DATE_COLUMN})
+            if self.EXTRACTION_DATE_COLUMN not in records.columns:
+                raise ValueError(f"Records of '{source.datasource}' must carry their '{self.EXTRACTION_DATE_FIELD}'")
+
+            # ISO date-times with offsets, compared as naive UTC like the stored dates
+            extraction_dates = pd.to_datetime(records[self.EXTRACTION_DATE_COLUMN], utc=True).dt.tz_localize(None)
+            if since is not None:
+                # Sources filtering on a coarser date may send back already merged records
+                is_changed = (extraction_dates > since).to_numpy()
+                records, extraction_dates = records[is_changed], extraction_dates[is_changed]
+            latest = extraction_dates.max()
+
+        # The orphans kept by the previous runs are retried first, so that a newer fetch of a record wins
+        now = pd.Timestamp.now()
+        pending = pd.concat([self._store.get_orphans(source.datasource),
+                             records.assign(**{QSnapDataStore.FIRST_SEEN_COLUMN: now})], ignore_index=True)
+        if not pending.empty:
+            stats.update(self._merge_records(source, pending, now))
+
+        if pd.notna(latest) and (watermark is None or latest > watermark):
+            self._store.set_watermark(source.datasource, latest)
+            stats['watermark'] = latest
+        return stats
+
+    def _merge_records(self, source: FetchSource, records: pd.DataFrame, now: pd.Timestamp) -> Dict[str, int]:
+        """Upsert the records of known applications, keep the orphans, report the ones kept too long"""
+        first_seen = QSnapDataStore.FIRST_SEEN_COLUMN
+        keys = [key for key in QSnapDataStore.NATURAL_KEYS.get(source.table, []) if key in records.columns]
+        if keys:
+            # A record kept as orphan and fetched again keeps its first fetch date
+            records = records.assign(**{first_seen: records.groupby(keys, dropna=False)[first_seen].transform('min')})
+            records = records.drop_duplicates(keys, keep='last')
+
+        resolved, is_known = self._resolve_applications(source.table, records)
+        is_known = is_known.to_numpy()
+        stats = {'inserted': 0, 'updated': 0}
+        if is_known.any():
+            stats.update(self._store.upsert_frame(source.table, resolved[is_known]))
+
+        # Kept as fetched, without the unresolved reference, so that they are resolved again next time
+        orphans = records[~is_known]
+        is_expired = (now - orphans[first_seen] > self.ORPHAN_MAX_AGE).to_numpy()
+        self._store.set_orphans(source.datasource, orphans[~is_expired])
+        if is_expired.any():
+            self._expired_orphans.append(orphans[is_expired].assign(datasource=source.datasource))
+
+        stats['orphans'], stats['expired'] = int((~is_expired).sum()), int(is_expired.sum())
+        return stats
+
+    def _resolve_applications(self, table: str, records: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        """Map the trigram references to application ids, flag the records of known applications"""
+        reference = self.APPLICATION_REFERENCES.get(table)
+        if reference is None or self.TRIGRAM_COLUMN not in records.columns or reference in records.columns:
+            return records, pd.Series(True, index=records.index)
+
+        application_ids = self._store.get_application_ids(records[self.TRIGRAM_COLUMN].dropna().tolist())
+        records = records.assign(**{reference: records[self.TRIGRAM_COLUMN].map(application_ids)})
+        return records, records[reference].notna()
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    # Stand-in for the Jira incident export: an 'updated' date per issue, filtered by the mark
+    jira_issues = pd.DataFrame({
+        'jira_id': ['INC-1', 'INC-2', 'INC-3'],
+        'trigram': ['AAA', 'BBB', 'AAA'],
+        'incident_creation_date': ['2025-01-07 09:00', '2025-02-11 14:00', '2025-03-02 08:30'],
+        'priority': ['Critical', 'Blocker', 'Major'],
+        'extractionDate': ['2025-03-10T06:00:00Z', '2025-03-10T06:00:00Z', '2025-03-10T06:00:00Z']
+    })
+
+    def fetch_jira_incidents(since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        if since is None:
+            return jira_issues
+        changed = pd.to_datetime(jira_issues['extractionDate'], utc=True).dt.tz_localize(None) > since
+        return jira_issues[changed]
+
+    catalogue = [
+        {'trigram': 'AAA', 'name': 'Alpha', 'extractionDate': '2025-03-10T05:00:00Z'},
+        {'trigram': 'BBB', 'name': 'Bravo', 'extractionDate': '2025-03-10T05:00:00Z'}
+    ]
+
+    def fetch_catalogue(since: Optional[pd.Timestamp]) -> List[Dict[str, Any]]:
+        return [item for item in catalogue
+                if since is None or pd.Timestamp(item['extractionDate']).tz_localize(None) > since]
+
+    store = QSnapDataStore()
+    fetcher = IncrementalFetcher(store)
+    fetcher.register('product_catalogue', fetch_catalogue, 'application')
+    fetcher.register('jira.com', fetch_jira_incidents, 'incident')
+
+    print(fetcher.refresh())
+
+    # Next day: one incident changed at the source
+    jira_issues.loc[1, ['priority', 'extractionDate']] = ['Critical', '2025-03-11T06:00:00Z']
+    print(fetcher.refresh())
+    print(store.get_incidents())
+    print(fetcher.get_watermarks())
+    store.close()
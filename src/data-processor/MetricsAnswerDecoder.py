@@ -0,0 +1,362 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+
+class MetricsAnswerDecoder:
+    """
+    Decoder of the metrics workbook answers into compact typed columns.
+
+    The questionnaire answers come as strings ("Yes/No/NA/UN", Sonar ratings "A-E/NA/UN", "%/NA/UN", 1 to 10
+    scores, ...). QUESTION_FIELDS declares, for every (section, question), the field it fills and its answer
+    type; the decoder turns the long answer table of MetricsWorkbookReader into one row per application and
+    one column per field:
+        - enumerated answers become pandas categoricals (int8 codes), NA and UN being explicit categories
+        - numeric answers become float32, NA and UN being the NOT_APPLICABLE / UNKNOWN sentinels
+
+    Usage:
+        reader = MetricsWorkbookReader().read('data/2025-metrics-v2.xlsx')
+        decoder = MetricsAnswerDecoder().set_answers(reader.get_answers()).decode()
+        fields = decoder.get_fields()
+        applications = decoder.decode_applications(reader.get_applications())
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    NOT_APPLICABLE = 'NA'
+    UNKNOWN = 'UN'
+
+    # Sentinels of the numeric fields, every valid answer being positive
+    NOT_APPLICABLE_VALUE = -1.0
+    UNKNOWN_VALUE = -2.0
+
+    # Enumerated answer types and their ordered categories (NA and UN are appended)
+    CATEGORIES = {
+        'yes_no': ['Yes', 'No'],
+        'rating': ['A', 'B', 'C', 'D', 'E'],
+        'rto': ['A0', 'A1', 'A2', 'A3'],
+        'enterprise_service': ['Yes', 'No', 'Both'],
+        'make_or_buy': ['M', 'B', 'BM', 'Both']
+    }
+
+    # Numeric answer types and their valid range
+    NUMERIC_RANGES = {
+        'score': (1.0, 10.0),
+        'percent': (0.0, 1.0),
+        'count': (0.0, np.inf),
+        'duration': (0.0, np.inf),
+        'amount': (0.0, np.inf)
+    }
+
+    # Spelling variants found in the workbooks
+    ALIASES = {
+        'yes': 'Yes', 'y': 'Yes', 'oui': 'Yes',
+        'no': 'No', 'n': 'No', 'non': 'No',
+        'na': NOT_APPLICABLE, 'n/a': NOT_APPLICABLE,
+        'un': UNKNOWN, 'u': UNKNOWN, 'unknown': UNKNOWN
+    }
+
+    # (section, question) -> (field, answer type). Questions with details (months, sub-metrics)
+    # give one field per detail, named "<field> <detail>".
+    QUESTION_FIELDS = {
+        ('User Satisfaction', 'Functional User Satisfaction'): ('functional_user_satisfaction', 'score'),
+        ('User Satisfaction', 'Non Functional User Satisfaction'): ('non_functional_user_satisfaction', 'score'),
+        ('Production Stability', 'Blocker or critical incidents (faulty CI) counts per month'):
+            ('critical_incidents', 'count'),
+        ('Production Stability', 'Major incidents (faulty CI) counts per month'): ('major_incidents', 'count'),
+        ('Production Stability', 'Median of blocker or critical incidents (faulty CI) counts per release'):
+            ('release_incidents', 'count'),
+        ('Cost of lack of quality', 'User reported incidents'): ('user_reported_incidents', 'count'),
+        ('Cost of lack of quality', 'Pro-active alerting (outside jobs)'): ('proactive_alerting_incidents', 'count'),
+        ('Cost of lack of quality', 'Jobs failure'): ('job_failure_incidents', 'count'),
+        ('Cost of lack of quality', 'Kaizen reporting'): ('kaizen_reports', 'count'),
+        ('Cost of lack of quality', 'Incidents total estimated fix workload'): ('incident_fix_workload', 'duration'),
+        ('Cost of lack of quality', 'Reported financial impacts'): ('financial_impact', 'amount'),
+        ('Production documentation',
+         'Is there an up-to-date feature map (or equivalent) of the critical features available?'):
+            ('has_feature_map', 'yes_no'),
+        ('Production documentation', 'Is there an up-to-date dependency map (or equivalent) available?'):
+            ('has_dependency_map', 'yes_no'),
+        ('Production documentation', 'Is there an up-to-date consumers /clients list available?'):
+            ('has_consumer_list', 'yes_no'),
+        ('Production documentation',
+         'Is an up-to-date API contract published (at least in a public GIT REPO) [FOR PRODUCTS "SERVICE ONLY"]'):
+            ('has_api_contract', 'yes_no'),
+        ('Production Reactivity', 'Mean Time To Restore - Blocker'): ('mttr_blocker', 'duration'),
+        ('Production Reactivity', 'Mean Time To Restore - Critical'): ('mttr_critical', 'duration'),
+        ('Production Data Quality Control', 'Do you have data quality controls on your inputs (in prod)?'):
+            ('has_input_data_controls', 'yes_no'),
+        ('Production Data Quality Control', 'Do you have data quality controls on your outputs (in prod)?'):
+            ('has_output_data_controls', 'yes_no'),
+        ('Production Data Quality Control',
+         'Are a significant amount (>10%) of all your incidents related to data quality?'):
+            ('has_data_quality_incidents', 'yes_no'),
+        ('DORA metrics', 'Stability - Change fail percentage'): ('change_fail_percentage', 'percent'),
+        ('DORA metrics', 'Stability - Failed deployment recovery time'): ('failed_deployment_recovery_time', 'duration'),
+        ('DORA metrics', 'Reliability - Uptime - Technical'): ('technical_uptime', 'duration'),
+        ('DORA metrics', 'Reliability - Uptime - Functional'): ('functional_uptime', 'duration'),
+        ('DORA metrics', 'Reliability - Response time'): ('response_time', 'duration'),
+        ('DORA metrics', 'Reliability - Mean Time Between Failture (MTBF)'): ('mtbf', 'duration'),
+        ('DORA metrics', 'Throughput - Change lead time - Features requests'): ('lead_time_features', 'duration'),
+        ('DORA metrics', 'Throughput - Change lead time - Bug fixes'): ('lead_time_bug_fixes', 'duration'),
+        ('DORA metrics', 'Throughput - Change lead time - Technical improvements'):
+            ('lead_time_technical_improvements', 'duration'),
+        ('DORA metrics', 'Throughput - Deployment frequency'): ('deployment_frequency', 'count'),
+        ('Quality policy adherance & risk mitigation', 'Is an up-to-date test strategy for the product available?'):
+            ('has_test_strategy', 'yes_no'),
+        ('Quality policy adherance & risk mitigation',
+         'Is there an up-to-date RCSA matrix available (even if the product is not compliant)?'):
+            ('has_rcsa_matrix', 'yes_no'),
+        ('Quality policy adherance & risk mitigation', 'Is there a risk analysis performed on each release?'):
+            ('has_release_risk_analysis', 'yes_no'),
+        ('Quality policy adherance & risk mitigation', 'Release average size/complexity'): ('release_size', 'count'),
+        ('Quality policy adherance & risk mitigation',
+         'Do we document & formalize each FAT/UAT campaigns in a central public page?'):
+            ('has_documented_campaigns', 'yes_no'),
+        ('FAT', 'Do we plan and execute FAT campaign systematically for every release?'):
+            ('fat_systematic_campaign', 'yes_no'),
+        ('FAT', 'Do we execute regression tests?'): ('fat_regression_tests', 'yes_no'),
+        ('FAT', 'Are the test steps described (i.e., scripted)?'): ('fat_scripted_tests', 'yes_no'),
+        ('FAT', 'Do we execute contract tests? [FOR PRODUCTS "SERVICE ONLY"]'): ('fat_contract_tests', 'yes_no'),
+        ('FAT', 'Do we execute load tests?'): ('fat_load_tests', 'yes_no'),
+        ('UAT', 'Do we plan and execute UAT campaign systematically for every release?'):
+            ('uat_systematic_campaign', 'yes_no'),
+        ('UAT', 'Do we execute regression tests?'): ('uat_regression_tests', 'yes_no'),
+        ('UAT', 'Are they executed by the consumers/end users?'): ('uat_executed_by_users', 'yes_no'),
+        ('Static Quality', 'Sonar - Maintainability (code smells/technical debt)'): ('sonar_maintainability', 'rating'),
+        ('Static Quality', 'Sonar - Reliability (bug issues)'): ('sonar_reliability', 'rating'),
+        ('Static Quality', 'Sonar - Security (vulnerability issues)'): ('sonar_security', 'rating'),
+        ('Static Quality', 'Sonar - Security review'): ('sonar_security_review', 'rating'),
+        ('Automation', 'Unit coverage'): ('unit_coverage', 'percent'),
+        ('Automation', 'Functional coverage'): ('functional_coverage', 'percent'),
+        ('Automation', 'UI coverage'): ('ui_coverage', 'percent'),
+        ('Automation', 'User end-to-end coverage'): ('end_to_end_coverage', 'percent'),
+        ('Automation practices', 'Have we automated the functional regression tests?'):
+            ('automated_regression_tests', 'yes_no'),
+        ('Automation practices',
+         'Do we automate contracts implementation with a "contract first" approach?  [FOR PRODUCTS "SERVICE ONLY"]'):
+            ('contract_first', 'yes_no'),
+        ('Automation practices',
+         'Have we automated the retro-compatibility contract tests? [FOR PRODUCTS "SERVICE ONLY"]'):
+            ('automated_contract_tests', 'yes_no')
+    }
+
+    # Application header fields and their answer type
+    APPLICATION_FIELDS = {
+        'criticality': 'rto',
+        'crown_jewel': 'yes_no',
+        'enterprise_service': 'enterprise_service',
+        'make_or_buy': 'make_or_buy'
+    }
+
+    TRIGRAM_COLUMN = 'trigram'
+
+    def __init__(self, question_fields: Optional[Dict[Tuple[str, str], Tuple[str, str]]] = None):
+        self._question_fields = question_fields if question_fields is not None else self.QUESTION_FIELDS
+        self._validate_question_fields()
+        self._answers: Optional[pd.DataFrame] = None
+        self._fields: Optional[pd.DataFrame] = None
+        self._invalid_answers: Optional[pd.DataFrame] = None
+        self._unmapped_questions: Optional[pd.DataFrame] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_answers(self, answers: pd.DataFrame) -> 'MetricsAnswerDecoder':
+        """
+        Set the answers to decode.
+
+        Args:
+            answers: Long answer table of MetricsWorkbookReader.get_answers()
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If a required column is missing
+        """
+        missing = [col for col in (self.TRIGRAM_COLUMN, 'section', 'question', 'detail', 'value')
+                   if col not in answers.columns]
+        if missing:
+            raise ValueError(f"Answers are missing columns: {missing}")
+
+        self._answers = answers
+        self._fields = None
+        return self
+
+    def decode(self) -> 'MetricsAnswerDecoder':
+        """
+        Decode all the answers: one vectorized pass per answer type, then one pivot.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If answers are not set
+        """
+        if self._answers is None:
+            raise ValueError("Answers must be set first. Call set_answers() first.")
+
+        mapping = pd.DataFrame(
+            [(section, question, field, answer_type)
+             for (section, question), (field, answer_type) in self._question_fields.items()],
+            columns=['section', 'question', 'field', 'answer_type']
+        )
+        answers = self._answers.merge(mapping, on=['section', 'question'], how='left')
+
+        unmapped = answers['field'].isna()
+        self._unmapped_questions = answers.loc[unmapped, ['section', 'question']].drop_duplicates().reset_index(drop=True)
+        answers = answers[~unmapped]
+
+        has_detail = answers['detail'].notna()
+        answers = answers.assign(field=answers['field'].where(~has_detail, answers['field'] + ' ' + answers['detail']))
+
+        # Field order follows the workbook, answer type is per field
+        field_types = answers.drop_duplicates('field').set_index('field')['answer_type']
+        wide = answers.pivot(index=self.TRIGRAM_COLUMN, columns='field', values='value')[field_types.index]
+
+        invalid = []
+        columns = {}
+        for answer_type, fields in field_types.groupby(field_types, sort=False):
+            block = wide[fields.index]
+            decoded, invalid_mask = self._decode_block(block, answer_type)
+            columns.update(decoded)
+            invalid.append(block.stack(future_stack=True)[invalid_mask.stack(future_stack=True)])
+
+        self._fields = pd.DataFrame(columns, index=wide.index)[list(field_types.index)]
+        self._invalid_answers = pd.concat(invalid).rename('value').reset_index() if invalid else pd.DataFrame()
+
+        return self
+
+    def get_fields(self) -> pd.DataFrame:
+        """
+        Get the decoded answers.
+
+        Returns:
+            DataFrame indexed by trigram with one categorical or float32 column per field
+        """
+        self._check_decoded()
+        return self._fields
+
+    def get_invalid_answers(self) -> pd.DataFrame:
+        """
+        Get the answers outside of their field domain; they are decoded as missing.
+
+        Returns:
+            DataFrame with trigram, field and raw value
+        """
+        self._check_decoded()
+        return self._invalid_answers
+
+    def get_unmapped_questions(self) -> pd.DataFrame:
+        """
+        Get the questions of the workbook missing from QUESTION_FIELDS.
+
+        Returns:
+            DataFrame with section and question
+        """
+        self._check_decoded()
+        return self._unmapped_questions
+
+    def decode_applications(self, applications: pd.DataFrame) -> pd.DataFrame:
+        """
+        Decode the enumerated header fields of the applications (criticality, crown jewel, ...).
+
+        Args:
+            applications: Application table of MetricsWorkbookReader.get_applications()
+
+        Returns:
+            Copy of the table with categorical header fields
+        """
+        applications = applications.copy()
+        for field, answer_type in self.APPLICATION_FIELDS.items():
+            if field in applications.columns:
+                decoded, _ = self._decode_block(applications[[field]], answer_type)
+                applications[field] = decoded[field]
+        return applications
+
+    @classmethod
+    def to_nan(cls, values: pd.Series) -> pd.Series:
+        """
+        Replace the NA/UN sentinels of a numeric field by NaN, before averaging for instance.
+
+        Args:
+            values: Decoded numeric field
+
+        Returns:
+            float32 Series without sentinels
+        """
+        return values.where(values >= 0)
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_question_fields(self) -> None:
+        types = set(self.CATEGORIES) | set(self.NUMERIC_RANGES)
+        unknown = {answer_type for _, answer_type in self._question_fields.values()} - types
+        if unknown:
+            raise ValueError(f"Unknown answer types: {sorted(unknown)}. Supported: {sorted(types)}")
+
+        fields = [field for field, _ in self._question_fields.values()]
+        duplicates = sorted({field for field in fields if fields.count(field) > 1})
+        if duplicates:
+            raise ValueError(f"Fields mapped by several questions: {duplicates}")
+
+    def _check_decoded(self) -> None:
+        if self._fields is None:
+            raise ValueError("Answers must be decoded first. Call decode() first.")
+
+    # ========== DECODING METHODS ==========
+
+    def _decode_block(self, block: pd.DataFrame, answer_type: str) -> Tuple[Dict[str, pd.Series], pd.DataFrame]:
+        """Decode all the columns of one answer type together, returns the columns and the invalid cell mask"""
+        flat = pd.Series(block.to_numpy().ravel(order='F'), dtype=object)
+        text = flat.astype('string').str.strip()
+        normalized = text.str.lower().map(self.ALIASES).fillna(text)
+
+        if answer_type in self.CATEGORIES:
+            categories = self.CATEGORIES[answer_type] + [self.NOT_APPLICABLE, self.UNKNOWN]
+            codes = pd.Index(categories).get_indexer(normalized.fillna(''))
+            values = pd.Categorical.from_codes(codes, categories=categories,
+                                               ordered=answer_type in ('rating', 'rto'))
+            invalid = (codes < 0) & flat.notna().to_numpy()
+            columns = {
+                field: values[i * len(block):(i + 1) * len(block)]
+                for i, field in enumerate(block.columns)
+            }
+        else:
+            low, high = self.NUMERIC_RANGES[answer_type]
+            numbers = pd.to_numeric(flat.where(~normalized.isin([self.NOT_APPLICABLE, self.UNKNOWN])),
+                                    errors='coerce').to_numpy(dtype=np.float32)
+            out_of_range = (numbers < low) | (numbers > high)
+            numbers[out_of_range] = np.nan
+            numbers[(normalized == self.NOT_APPLICABLE).fillna(False).to_numpy()] = self.NOT_APPLICABLE_VALUE
+            numbers[(normalized == self.UNKNOWN).fillna(False).to_numpy()] = self.UNKNOWN_VALUE
+            invalid = np.isnan(numbers) & flat.notna().to_numpy()
+            columns = {
+                field: numbers[i * len(block):(i + 1) * len(block)]
+                for i, field in enumerate(block.columns)
+            }
+
+        invalid_mask = pd.DataFrame(invalid.reshape(block.shape, order='F'), index=block.index, columns=block.columns)
+        return {field: pd.Series(values, index=block.index) for field, values in columns.items()}, invalid_mask
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    answers = pd.DataFrame({
+        'trigram': ['AAA', 'BBB', 'AAA', 'BBB', 'AAA', 'BBB', 'AAA', 'BBB'],
+        'section': ['FAT', 'FAT', 'Static Quality', 'Static Quality', 'Automation', 'Automation',
+                    'User Satisfaction', 'User Satisfaction'],
+        'question': ['Do we execute load tests?'] * 2 + ['Sonar - Reliability (bug issues)'] * 2
+                    + ['Unit coverage'] * 2 + ['Functional User Satisfaction'] * 2,
+        'detail': [None] * 8,
+        'value': ['Yes', 'UN', 'B', 'NA', 0.42, 'UN', 7.5, 12]
+    })
+
+    decoder = MetricsAnswerDecoder().set_answers(answers).decode()
+    fields = decoder.get_fields()
+
+    print(fields)
+    print(fields.dtypes)
+    print(decoder.get_invalid_answers())
@@ -0,0 +1,329 @@
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Optional, Union, Tuple, Iterable, Any
+
+from MetricsWorkbookReader import MetricsWorkbookReader
+from MetricsAnswerDecoder import MetricsAnswerDecoder
+
+
+def parse_workbook(path: str, expected_questions: Optional[List[Tuple[str, str]]],
+                   strict: bool = False) -> Dict[str, Any]:
+    """
+    Parse, check and decode one workbook. Runs in the worker processes, hence a module function.
+
+    Args:
+        path: Workbook path
+        expected_questions: Expected (section, question) layout, None to skip the check
+        strict: True also rejects a workbook missing expected questions
+
+    Returns:
+        'path' and either 'error', or 'season', 'applications', 'answers', 'fields', 'invalid_answers' and
+        'missing_questions'
+    """
+    try:
+        reader = MetricsWorkbookReader().read(path)
+        missing = []
+        if expected_questions is not None:
+            missing = check_layout(reader.get_questions(), expected_questions, strict)
+
+        decoder = MetricsAnswerDecoder().set_answers(reader.get_answers()).decode()
+        season = reader.get_season()
+        return {
+            'path': path,
+            'season': season['season'] if season else None,
+            'applications': decoder.decode_applications(reader.get_applications()),
+            'answers': reader.get_answers(),
+            'fields': decoder.get_fields(),
+            'invalid_answers': len(decoder.get_invalid_answers()),
+            'missing_questions': missing
+        }
+    except Exception as error:
+        # Any unreadable file (layout, corrupt archive, missing sheet, ...) is reported, not raised
+        return {'path': path, 'error': f"{type(error).__name__}: {error}"}
+
+
+def check_layout(questions: pd.DataFrame, expected_questions: List[Tuple[str, str]],
+                 strict: bool = False) -> List[Tuple[str, str]]:
+    """
+    Check that a workbook only holds expected questions.
+
+    Workbooks may hold a subset of the questionnaire (e.g. a lighter one for small teams): missing questions are
+    returned, and only rejected in strict mode.
+
+    Returns:
+        The expected questions missing from the workbook
+
+    Raises:
+        ValueError: If questions are unexpected, or missing in strict mode
+    """
+    found = list(dict.fromkeys(zip(questions['section'], questions['question'])))
+    found_set, expected_set = set(found), set(expected_questions)
+    missing = [question for question in expected_questions if question not in found_set]
+    unexpected = [question for question in found if question not in expected_set]
+    if unexpected or (strict and missing):
+        raise ValueError(f"Questionnaire layout differs: {len(missing)} missing question(s) {missing[:3]}, "
+                         f"{len(unexpected)} unexpected question(s) {unexpected[:3]}")
+    return missing
+
+
+class MetricsWorkbookIngestor:
+    """
+    Parallel ingestion of the per-team "Data collect" workbooks of a season.
+
+    Every workbook is read, checked against the expected questionnaire layout and decoded
+    (MetricsAnswerDecoder) in a process pool: Excel parsing is CPU bound and holds the GIL, so processes
+    rather than threads make the throughput scale with the cores. The results are merged into one typed
+    table, one row per application. A file that cannot be ingested does not abort the run: its error is
+    collected and the other files go on. Questions of the expected layout missing from a workbook are reported
+    as warnings, unless the strict layout check is on.
+
+    Usage:
+        ingestor = MetricsWorkbookIngestor(max_workers=8).add_directory('collect/2025').ingest()
+        fields = ingestor.get_fields()
+        errors = ingestor.get_errors()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    WORKBOOK_PATTERN = '*.xlsx'
+
+    # Excel lock files of the workbooks opened at the time of the run
+    LOCK_FILE_PREFIX = '~$'
+
+    FILE_COLUMN = 'file'
+    SEASON_COLUMN = 'season'
+    TRIGRAM_COLUMN = 'trigram'
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._paths: List[Path] = []
+        self._expected_questions: Optional[List[Tuple[str, str]]] = list(MetricsAnswerDecoder.QUESTION_FIELDS)
+        self._strict_layout: bool = False
+        self._results: Optional[List[Dict[str, Any]]] = None
+        self._file_count: int = 0
+        self._errors: Optional[pd.DataFrame] = None
+        self._warnings: Optional[pd.DataFrame] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def add_files(self, *paths: Union[str, Path]) -> 'MetricsWorkbookIngestor':
+        """
+        Add workbooks to ingest.
+
+        Args:
+            *paths: Workbook paths
+
+        Returns:
+            Self for method chaining
+        """
+        self._paths.extend(Path(path) for path in paths)
+        return self
+
+    def add_directory(self, directory: Union[str, Path],
+                      pattern: str = WORKBOOK_PATTERN) -> 'MetricsWorkbookIngestor':
+        """
+        Add every workbook of a directory.
+
+        Args:
+            directory: Directory to scan (not recursive)
+            pattern: File name pattern
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the directory does not exist
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise ValueError(f"Directory not found: {directory}")
+
+        self._paths.extend(sorted(
+            path for path in directory.glob(pattern) if not path.name.startswith(self.LOCK_FILE_PREFIX)
+        ))
+        return self
+
+    def set_expected_layout(self, questions: Optional[Iterable[Tuple[str, str]]],
+                            strict: bool = False) -> 'MetricsWorkbookIngestor':
+        """
+        Set the questions a workbook may hold. Defaults to the questions of MetricsAnswerDecoder.
+
+        Args:
+            questions: (section, question) pairs, or None to skip the layout check
+            strict: True rejects the workbooks missing some of the questions, instead of a warning
+
+        Returns:
+            Self for method chaining
+        """
+        self._expected_questions = list(questions) if questions is not None else None
+        self._strict_layout = strict
+        return self
+
+    def ingest(self) -> 'MetricsWorkbookIngestor':
+        """
+        Parse all the added workbooks, in parallel.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If no workbook was added
+        """
+        if not self._paths:
+            raise ValueError("No workbook to ingest. Call add_files() or add_directory() first.")
+
+        paths = [str(path) for path in dict.fromkeys(self._paths)]
+        if self._max_workers == 1 or len(paths) == 1:
+            results = [parse_workbook(path, self._expected_questions, self._strict_layout) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self._max_workers, len(paths))) as executor:
+                futures = [executor.submit(parse_workbook, path, self._expected_questions, self._strict_layout)
+                           for path in paths]
+                # Completion order is irrelevant: results are merged in file order
+                results = [future.result() for future in as_completed(futures)]
+            order = {path: index for index, path in enumerate(paths)}
+            results.sort(key=lambda result: order[result['path']])
+
+        self._file_count = len(paths)
+        self._results = [result for result in results if 'error' not in result]
+        errors = [(result['path'], result['error']) for result in results if 'error' in result]
+        errors.extend(self._find_duplicate_trigrams())
+        self._errors = pd.DataFrame(errors, columns=[self.FILE_COLUMN, 'error'])
+        self._warnings = pd.DataFrame(
+            [(result['path'], f"{len(result['missing_questions'])} missing question(s) "
+                              f"{result['missing_questions'][:3]}")
+             for result in self._results if result['missing_questions']],
+            columns=[self.FILE_COLUMN, 'warning']
+        )
+
+        return self
+
+    def get_fields(self) -> pd.DataFrame:
+        """
+        Get the merged decoded answers.
+
+        Returns:
+            DataFrame indexed by trigram with the source file, season and one categorical or float32
+            column per field. A trigram found in several files is kept from the first one.
+        """
+        return self._merge('fields')
+
+    def get_applications(self) -> pd.DataFrame:
+        """
+        Get the merged application header rows (enumerated fields decoded).
+
+        Returns:
+            DataFrame of the applications with their source file and season
+        """
+        return self._merge('applications').reset_index(drop=True)
+
+    def get_answers(self) -> pd.DataFrame:
+        """
+        Get the merged raw answers, in the long format of MetricsWorkbookReader.get_answers().
+
+        Returns:
+            DataFrame of the answers with their source file and season
+        """
+        return self._merge('answers').reset_index(drop=True)
+
+    def get_errors(self) -> pd.DataFrame:
+        """
+        Get the files that could not be ingested and the duplicated applications.
+
+        Returns:
+            DataFrame with the file and the error message
+        """
+        self._check_ingested()
+        return self._errors
+
+    def get_warnings(self) -> pd.DataFrame:
+        """
+        Get the ingested files missing some questions of the expected layout.
+
+        Returns:
+            DataFrame with the file and the warning message
+        """
+        self._check_ingested()
+        return self._warnings
+
+    def get_summary(self) -> Dict[str, int]:
+        self._check_ingested()
+        return {
+            'files': self._file_count,
+            'ingested_files': len(self._results),
+            'failed_files': self._file_count - len(self._results),
+            'files_with_warnings': len(self._warnings),
+            'applications': sum(len(result['fields']) for result in self._results),
+            'answers': sum(len(result['answers']) for result in self._results),
+            'invalid_answers': sum(result['invalid_answers'] for result in self._results)
+        }
+
+    # ========== HELPER METHODS ==========
+
+    def _check_ingested(self) -> None:
+        if self._results is None:
+            raise ValueError("Workbooks must be ingested first. Call ingest() first.")
+
+    def _merge(self, part: str) -> pd.DataFrame:
+        self._check_ingested()
+        if not self._results:
+            return pd.DataFrame()
+
+        files = pd.CategoricalDtype([result['path'] for result in self._results])
+        frames = [
+            result[part].assign(**{
+                self.FILE_COLUMN: pd.Series(result['path'], index=result[part].index, dtype=files),
+                self.SEASON_COLUMN: result['season']
+            })
+            for result in self._results
+        ]
+        # Identical categories in every file: categoricals survive the concatenation
+        merged = pd.concat(frames)
+        merged = merged[[self.FILE_COLUMN, self.SEASON_COLUMN] + [c for c in merged.columns
+                                                                   if c not in (self.FILE_COLUMN, self.SEASON_COLUMN)]]
+
+        if part == 'fields':
+            merged = merged[~merged.index.duplicated(keep='first')]
+        elif part == 'applications':
+            merged = merged.drop_duplicates(self.TRIGRAM_COLUMN, keep='first')
+        return merged
+
+    def _find_duplicate_trigrams(self) -> List[Tuple[str, str]]:
+        first_files: Dict[str, str] = {}
+        duplicates = []
+        for result in self._results:
+            for trigram in result['fields'].index:
+                if trigram in first_files:
+                    duplicates.append((result['path'], f"Duplicate application '{trigram}', "
+                                                       f"kept from {first_files[trigram]}"))
+                else:
+                    first_files[trigram] = result['path']
+        return duplicates
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import sys
+    import time
+
+    # python MetricsWorkbookIngestor.py <workbook or directory> ...
+    paths = sys.argv[1:] or ['../../data/2025-metrics-v2.xlsx', '../../data/2025-metrics-tiny.xlsx',
+                             '../../data/2025-metrics-tiny-processed.xlsx']
+
+    ingestor = MetricsWorkbookIngestor()
+    for path in paths:
+        if Path(path).is_dir():
+            ingestor.add_directory(path)
+        else:
+            ingestor.add_files(path)
+
+    start = time.perf_counter()
+    ingestor.ingest()
+    print(f"{ingestor.get_summary()} in {time.perf_counter() - start:.2f}s")
+    print(ingestor.get_fields().iloc[:5, :6])
+    print(ingestor.get_errors().to_string())
+    print(ingestor.get_warnings().to_string())
@@ -0,0 +1,289 @@
+import re
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+from openpyxl.utils import get_column_letter
+
+
+class MetricsWorkbookReader:
+    """
+    Reader for the "Data collection - Full" metrics workbook filled in by the teams.
+
+    The sheet holds one column per application: a header block (platform, team, trigram, criticality, ...)
+    followed by the questionnaire, grouped by quality (Product/Process) and section (User Satisfaction,
+    Production Stability, ...). The reader turns it into an application table and a long answer table.
+
+    Usage:
+        reader = MetricsWorkbookReader().read('data/2025-metrics-tiny.xlsx')
+        applications = reader.get_applications()
+        answers = reader.get_answers()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    SHEET_NAME = 'Data collection - Full'
+
+    # Column positions of the layout
+    GROUP_COLUMN = 0
+    QUESTION_COLUMN = 1
+    GATHERING_COLUMN = 2
+    LABEL_COLUMN = 3
+    FIRST_APPLICATION_COLUMN = 4
+
+    # Marker closing the application columns
+    COLUMN_END_MARKER = '.'
+
+    # Label of the row opening the questionnaire
+    QUESTIONNAIRE_START_LABEL = 'Description/legend'
+
+    # Header block labels and the matching application fields
+    HEADER_FIELDS = {
+        'Platform': 'platform',
+        'Platform head': 'platform_head',
+        'Quality Champion': 'quality_champion',
+        'Team': 'team',
+        'Team head': 'team_head',
+        'Trigram': 'trigram',
+        'Criticality': 'criticality',
+        'Crown jewel': 'crown_jewel',
+        'Enterprise service or Front-end': 'enterprise_service',
+        'Make or Buy': 'make_or_buy'
+    }
+
+    # Header fields spread over several applications through merged cells
+    MERGED_HEADER_FIELDS = ['platform', 'platform_head', 'quality_champion', 'team', 'team_head']
+
+    # Question rows start with one of these characters
+    QUESTION_PREFIXES = ('*', '"')
+
+    # Title cell, e.g. "Quality Snapshot 2025\n01-09-2024 - 31-08-2025"
+    TITLE_PATTERN = re.compile(r'(?P<season>\d{4})\s+(?P<start>\d{2}-\d{2}-\d{4})\s*-\s*(?P<end>\d{2}-\d{2}-\d{4})')
+    TITLE_DATE_FORMAT = '%d-%m-%Y'
+
+    DETAIL_MONTH_FORMAT = '%Y %b'
+
+    ANSWER_COLUMNS = ['trigram', 'group', 'section', 'question', 'detail', 'gathering', 'legend', 'value']
+
+    def __init__(self):
+        self._path: Optional[Path] = None
+        self._sheet: Optional[pd.DataFrame] = None
+        self._applications: Optional[pd.DataFrame] = None
+        self._answers: Optional[pd.DataFrame] = None
+        self._questions: Optional[pd.DataFrame] = None
+        self._season: Optional[Dict[str, Union[int, pd.Timestamp]]] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def read(self, path: Union[str, Path]) -> 'MetricsWorkbookReader':
+        """
+        Read and parse a metrics workbook.
+
+        Args:
+            path: Path to the .xlsx workbook
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the workbook does not follow the expected layout
+        """
+        self._path = Path(path)
+        sheet = pd.read_excel(self._path, sheet_name=self.SHEET_NAME, header=None)
+        return self.set_sheet(sheet)
+
+    def set_sheet(self, sheet: pd.DataFrame) -> 'MetricsWorkbookReader':
+        """
+        Parse an already loaded sheet (read with header=None).
+
+        Args:
+            sheet: Raw sheet content
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the sheet does not follow the expected layout
+        """
+        self._validate_layout(sheet)
+        self._sheet = sheet
+
+        application_columns = self._get_application_columns()
+        self._season = self._parse_title()
+        self._applications = self._parse_header(application_columns)
+        self._answers = self._parse_questionnaire(application_columns)
+
+        return self
+
+    def get_applications(self) -> pd.DataFrame:
+        """
+        Get the application header block.
+
+        Returns:
+            DataFrame with one row per application column and one column per header field.
+            Applications without trigram are identified by their Excel column letter.
+        """
+        self._check_read()
+        return self._applications
+
+    def get_answers(self) -> pd.DataFrame:
+        """
+        Get all the answers in long format.
+
+        Returns:
+            DataFrame with the trigram, group, section, question, detail (month or sub-metric label),
+            gathering mode, legend and raw value of every answered cell
+        """
+        self._check_read()
+        return self._answers
+
+    def get_questions(self) -> pd.DataFrame:
+        """
+        Get the questionnaire layout, answered or not.
+
+        Returns:
+            DataFrame with the sheet row, group, section, question and detail of every questionnaire row,
+            in sheet order
+        """
+        self._check_read()
+        return self._questions
+
+    def get_season(self) -> Optional[Dict[str, Union[int, pd.Timestamp]]]:
+        """
+        Get the season described in the title cell.
+
+        Returns:
+            Dictionary with 'season', 'start' and 'end', or None if the title cannot be parsed
+        """
+        self._check_read()
+        return self._season
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_layout(self, sheet: pd.DataFrame) -> None:
+        if sheet.shape[1] <= self.FIRST_APPLICATION_COLUMN:
+            raise ValueError("Metrics sheet has no application column")
+
+        labels = sheet[self.LABEL_COLUMN].astype('string').str.strip()
+        missing_labels = [label for label in self.HEADER_FIELDS if not (labels == label).any()]
+        if missing_labels:
+            raise ValueError(f"Metrics sheet header is missing rows: {missing_labels}")
+        if not (labels == self.QUESTIONNAIRE_START_LABEL).any():
+            raise ValueError(f"Metrics sheet has no '{self.QUESTIONNAIRE_START_LABEL}' row")
+
+    def _check_read(self) -> None:
+        if self._sheet is None:
+            raise ValueError("Workbook must be read first. Call read() first.")
+
+    # ========== PARSING METHODS ==========
+
+    def _get_application_columns(self) -> Dict[int, str]:
+        """Application columns and their identifier (trigram or Excel column letter)"""
+        header_rows = self._get_header_rows()
+        header = self._sheet.loc[list(header_rows.values()), self.FIRST_APPLICATION_COLUMN:]
+        trigrams = self._sheet.loc[header_rows['trigram'], self.FIRST_APPLICATION_COLUMN:]
+
+        columns = {}
+        for column in header.columns:
+            values = header[column]
+            if (values.astype('string').str.strip() == self.COLUMN_END_MARKER).any():
+                break
+            if values.isna().all():
+                continue
+            trigram = trigrams[column]
+            columns[column] = str(trigram).strip() if pd.notna(trigram) else get_column_letter(column + 1)
+
+        return columns
+
+    def _get_header_rows(self) -> Dict[str, int]:
+        labels = self._sheet[self.LABEL_COLUMN].astype('string').str.strip()
+        start_row = self._get_questionnaire_start_row()
+        return {
+            field: int(labels[labels == label].index[0])
+            for label, field in self.HEADER_FIELDS.items()
+            if int(labels[labels == label].index[0]) < start_row
+        }
+
+    def _get_questionnaire_start_row(self) -> int:
+        labels = self._sheet[self.LABEL_COLUMN].astype('string').str.strip()
+        return int(labels[labels == self.QUESTIONNAIRE_START_LABEL].index[0])
+
+    def _parse_title(self) -> Optional[Dict[str, Union[int, pd.Timestamp]]]:
+        title = self._sheet.iat[0, self.GROUP_COLUMN]
+        match = self.TITLE_PATTERN.search(str(title)) if pd.notna(title) else None
+        if match is None:
+            return None
+
+        return {
+            'season': int(match['season']),
+            'start': pd.Timestamp(datetime.strptime(match['start'], self.TITLE_DATE_FORMAT)),
+            'end': pd.Timestamp(datetime.strptime(match['end'], self.TITLE_DATE_FORMAT))
+        }
+
+    def _parse_header(self, application_columns: Dict[int, str]) -> pd.DataFrame:
+        header_rows = self._get_header_rows()
+        columns = list(application_columns)
+
+        header = self._sheet.loc[list(header_rows.values()), self.FIRST_APPLICATION_COLUMN:]
+        header.index = list(header_rows)
+
+        # Merged cells only hold their value in the first column
+        merged = [field for field in self.MERGED_HEADER_FIELDS if field in header.index]
+        header.loc[merged] = header.loc[merged].ffill(axis=1)
+
+        applications = header[columns].T.reset_index(drop=True)
+        applications['trigram'] = list(application_columns.values())
+        applications.insert(0, 'column', [get_column_letter(column + 1) for column in columns])
+
+        return applications
+
+    def _parse_questionnaire(self, application_columns: Dict[int, str]) -> pd.DataFrame:
+        """Classify every questionnaire row, then melt all application columns at once"""
+        start_row = self._get_questionnaire_start_row()
+        body = self._sheet.iloc[start_row + 1:]
+
+        rows = []
+        group = self._sheet.iat[start_row, self.GROUP_COLUMN]
+        group = str(group).strip() if pd.notna(group) else None
+        section = question = gathering = None
+        for index, row in body.iterrows():
+            cell = row[self.QUESTION_COLUMN]
+            label = row[self.LABEL_COLUMN]
+            if pd.notna(row[self.GROUP_COLUMN]):
+                group = str(row[self.GROUP_COLUMN]).strip()
+
+            if isinstance(cell, str) and cell.strip().startswith(self.QUESTION_PREFIXES):
+                question = cell.strip().lstrip(''.join(self.QUESTION_PREFIXES)).strip()
+                gathering = row[self.GATHERING_COLUMN]
+                rows.append((index, group, section, question, None, gathering, label))
+            elif isinstance(cell, (datetime, pd.Timestamp)):
+                rows.append((index, group, section, question, pd.Timestamp(cell).strftime(self.DETAIL_MONTH_FORMAT),
+                             gathering, label))
+            elif pd.isna(cell) and pd.notna(label):
+                rows.append((index, group, section, question, str(label).strip(), gathering, label))
+            elif isinstance(cell, str):
+                section = cell.strip()
+
+        row_info = pd.DataFrame(rows, columns=['row', 'group', 'section', 'question', 'detail', 'gathering', 'legend'])
+        self._questions = row_info[['row', 'group', 'section', 'question', 'detail']]
+        values = body.loc[row_info['row'], list(application_columns)]
+        values.columns = list(application_columns.values())
+
+        answers = row_info.join(values.reset_index(drop=True)).melt(
+            id_vars=['row', 'group', 'section', 'question', 'detail', 'gathering', 'legend'],
+            var_name='trigram',
+            value_name='value'
+        ).dropna(subset=['value'])
+
+        return answers.sort_values(['row', 'trigram'], kind='stable')[self.ANSWER_COLUMNS].reset_index(drop=True)
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    reader = MetricsWorkbookReader().read('../../data/2025-metrics-tiny.xlsx')
+
+    print(reader.get_season())
+    print(reader.get_applications())
+    print(reader.get_answers())
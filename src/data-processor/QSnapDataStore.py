@@ -0,0 +1,675 @@
+import json
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import List, Dict, Optional, Union, Iterable
+
+from MetricsWorkbookReader import MetricsWorkbookReader
+
+
+class QSnapDataStore:
+    """
+    Local embedded store (SQLite) for the entities of doc/data-dictionary.md.
+
+    Workbooks and exports are loaded once in bulk, then report generation runs indexed queries
+    instead of re-reading the spreadsheets.
+
+    Usage:
+        store = QSnapDataStore('qsnap.db')
+        store.load_metrics_workbook('data/2025-metrics-tiny.xlsx')
+        store.load_product_export('data/ProductExport.xlsx')
+        answers = store.get_snapshot_answers(season=2025, section='Production Stability')
+        store.close()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    IN_MEMORY = ':memory:'
+
+    # Table definitions: entity name -> columns (see doc/data-dictionary.md)
+    TABLES = {
+        'application': {
+            'application_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'trigram': 'VARCHAR(3)',
+            'name': 'VARCHAR(255)',
+            'eacode': 'VARCHAR(10)',
+            'crown_jewels_level': 'VARCHAR(5)',
+            'priority_level': 'VARCHAR(2)',
+            'enterprise_service': 'BOOL',
+            'web_exposure': 'BOOL',
+            'make_or_buy': 'VARCHAR(10)',
+            'product_owner': 'VARCHAR(255)',
+            'product_manager': 'VARCHAR(255)',
+            'flagged_for_deletion': 'BOOL',
+            'wiki_main_url': 'VARCHAR(255)',
+            'jira_main_url': 'VARCHAR(255)',
+            'git_main_urls': 'VARCHAR(255)',
+            'sonar_main_urls': 'VARCHAR(255)',
+            'domain': 'VARCHAR(255)',
+            'platform': 'VARCHAR(255)',
+            'team': 'VARCHAR(255)'
+        },
+        'incident': {
+            'incident_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'jira_id': 'VARCHAR(10)',
+            'incident_creation_date': 'DATE',
+            'resolution_date': 'DATE',
+            'priority': 'VARCHAR(10)',
+            'resolution_category': 'VARCHAR(255)',
+            'financial_impact': 'INT',
+            'faulty_application': 'INT REFERENCES application(application_id)',
+            'reporter': 'VARCHAR(255)',
+            'assignee': 'VARCHAR(255)',
+            'impacted_application': 'TEXT',
+            'flagged_as_not_an_incident': 'BOOL'
+        },
+        'problem': {
+            'problem_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'jira_id': 'VARCHAR(10)',
+            'problem_creation_date': 'DATE',
+            'resolution_date': 'DATE',
+            'priority': 'VARCHAR(10)',
+            'reporter': 'VARCHAR(255)',
+            'assignee': 'VARCHAR(255)',
+            'impacted_application': 'TEXT'
+        },
+        'release': {
+            'release_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'application_id': 'INT REFERENCES application(application_id)',
+            'version_number': 'VARCHAR(255)',
+            'release_date': 'DATE',
+            'scope': 'TEXT',
+            'change_request_id': 'VARCHAR(10)'
+        },
+        'static_quality': {
+            'static_quality_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'application_id': 'INT REFERENCES application(application_id)',
+            'maintainability_score': 'VARCHAR(1)',
+            'reliability_score': 'VARCHAR(1)',
+            'security_score': 'VARCHAR(1)',
+            'security_review_score': 'VARCHAR(1)',
+            'coverage': 'REAL',
+            'gate_level': 'VARCHAR(255)',
+            'branch': 'VARCHAR(255)',
+            'repository': 'VARCHAR(255)',
+            'number_of_lines': 'INT'
+        },
+        'interview': {
+            'interview_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'application_id': 'INT REFERENCES application(application_id)',
+            'functional_statisfaction_score': 'INT',
+            'non_functional_statisfaction_score': 'INT',
+            'feature_map': 'VARCHAR(10)',
+            'dependency_diagram': 'VARCHAR(10)',
+            'consumer_list': 'VARCHAR(10)',
+            'inflow_data_quality_control': 'VARCHAR(10)',
+            'outflow_data_quality_control': 'VARCHAR(10)',
+            'incidents_on_data_quality': 'VARCHAR(10)',
+            'test_strategy': 'VARCHAR(10)',
+            'rcsa_matrix': 'VARCHAR(10)',
+            'risk_analysis': 'VARCHAR(10)',
+            'formal_test_campaigns': 'VARCHAR(10)',
+            'functional_acceptance_tests': 'VARCHAR(10)',
+            'fat_regression': 'VARCHAR(10)',
+            'scripted_tests': 'VARCHAR(10)',
+            'test_contracts': 'VARCHAR(10)',
+            'load_tests': 'VARCHAR(10)',
+            'user_acceptance_tests': 'VARCHAR(10)',
+            'uat_regression': 'VARCHAR(10)',
+            'uat_business_testers': 'VARCHAR(10)',
+            'automated_regression': 'VARCHAR(10)',
+            'automated_contract_first': 'VARCHAR(10)',
+            'automated_contract_tests': 'VARCHAR(10)'
+        },
+        # One row per answered cell of a "Data collect" workbook
+        'snapshot': {
+            'snapshot_id': 'INTEGER PRIMARY KEY',
+            'creation_date': 'DATE',
+            'season': 'INT',
+            'application_id': 'INT REFERENCES application(application_id)',
+            'quality_group': 'VARCHAR(255)',
+            'section': 'VARCHAR(255)',
+            'question': 'TEXT',
+            'detail': 'VARCHAR(255)',
+            'value': 'TEXT'
+        },
+        # High-water mark of the incremental fetches: latest extractionDate merged per datasource
+        'watermark': {
+            'datasource': 'VARCHAR(255) PRIMARY KEY',
+            'extraction_date': 'DATE',
+            'update_date': 'DATE'
+        },
+        # Fetched records of applications not in the store yet, kept as JSON to be merged on a later fetch
+        'orphan': {
+            'orphan_id': 'INTEGER PRIMARY KEY',
+            'datasource': 'VARCHAR(255)',
+            'record': 'TEXT',
+            'first_seen': 'DATE'
+        }
+    }
+
+    # Indexes: name -> (table, columns)
+    INDEXES = {
+        'idx_application_trigram': ('application', ['trigram']),
+        'idx_application_eacode': ('application', ['eacode']),
+        'idx_application_creation_date': ('application', ['creation_date']),
+        'idx_incident_application': ('incident', ['faulty_application', 'incident_creation_date']),
+        'idx_incident_creation_date': ('incident', ['creation_date']),
+        'idx_incident_jira_id': ('incident', ['jira_id']),
+        'idx_problem_creation_date': ('problem', ['creation_date']),
+        'idx_problem_jira_id': ('problem', ['jira_id']),
+        'idx_release_application': ('release', ['application_id', 'release_date']),
+        'idx_release_creation_date': ('release', ['creation_date']),
+        'idx_static_quality_application': ('static_quality', ['application_id', 'creation_date']),
+        'idx_static_quality_creation_date': ('static_quality', ['creation_date']),
+        'idx_interview_application': ('interview', ['application_id', 'creation_date']),
+        'idx_interview_creation_date': ('interview', ['creation_date']),
+        'idx_snapshot_application': ('snapshot', ['application_id', 'season']),
+        'idx_snapshot_season_section': ('snapshot', ['season', 'section', 'question']),
+        'idx_snapshot_creation_date': ('snapshot', ['creation_date']),
+        'idx_orphan_datasource': ('orphan', ['datasource'])
+    }
+
+    # Natural keys, enforced by a unique index: rows merged by upsert_frame() replace the stored row with the same key
+    NATURAL_KEYS = {
+        'application': ['trigram'],
+        'incident': ['jira_id'],
+        'problem': ['jira_id'],
+        'release': ['application_id', 'version_number'],
+        'static_quality': ['application_id', 'repository', 'branch', 'creation_date'],
+        'interview': ['application_id', 'creation_date'],
+        'snapshot': ['season', 'application_id', 'section', 'question', 'detail']
+    }
+
+    # Natural key parts that may be null, indexed as '' so that null values match each other
+    NULLABLE_KEYS = {
+        'snapshot': ['detail']
+    }
+    NATURAL_KEY_INDEX_TEMPLATE = 'uq_{table}_natural_key'
+
+    # Metrics workbook header fields -> application columns
+    WORKBOOK_APPLICATION_FIELDS = {
+        'trigram': 'trigram',
+        'platform': 'platform',
+        'team': 'team',
+        'criticality': 'priority_level',
+        'crown_jewel': 'crown_jewels_level',
+        'enterprise_service': 'enterprise_service',
+        'make_or_buy': 'make_or_buy'
+    }
+
+    # ProductExport.xlsx columns -> application columns
+    PRODUCT_EXPORT_FIELDS = {
+        'Trigram': 'trigram',
+        'Name': 'name',
+        'EA code': 'eacode',
+        'Product Manager': 'product_manager',
+        'Business Owner': 'product_owner',
+        'Crown Jewel': 'crown_jewels_level',
+        'Criticality': 'priority_level',
+        'Enterprise Service': 'enterprise_service',
+        'External Exposure': 'web_exposure',
+        'Make-or-Buy Decision': 'make_or_buy',
+        'Jira Project Link': 'jira_main_url'
+    }
+
+    # Date an orphan record was first fetched, added to the records of get_orphans()
+    FIRST_SEEN_COLUMN = 'first_seen'
+
+    # Date columns stored as ISO strings
+    DATE_COLUMN_TYPE = 'DATE'
+
+    def __init__(self, path: Union[str, Path] = IN_MEMORY):
+        self._path = str(path)
+        self._connection = sqlite3.connect(self._path)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        if self._path != self.IN_MEMORY:
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._create_schema()
+
+    # ========== PUBLIC API ==========
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._connection.close()
+
+    def insert_frame(self, table: str, data: Union[pd.DataFrame, List[Dict]]) -> int:
+        """
+        Bulk insert rows in a table within a single transaction.
+
+        Args:
+            table: Entity table name (e.g. 'incident')
+            data: Rows to insert. Unknown columns are ignored, missing ones are NULL.
+
+        Returns:
+            Number of inserted rows
+
+        Raises:
+            ValueError: If the table does not exist or no known column is given
+        """
+        self._validate_table(table)
+        df = pd.DataFrame(data)
+        columns = [col for col in self.TABLES[table] if col in df.columns]
+        if not columns:
+            raise ValueError(f"No column of table '{table}' found. Expected some of: {list(self.TABLES[table])}")
+
+        rows = self._to_rows(table, df[columns])
+        placeholders = ', '.join('?' * len(columns))
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+            )
+
+        return len(rows)
+
+    def upsert_applications(self, applications: pd.DataFrame) -> Dict[str, int]:
+        """
+        Insert unknown applications and update the known ones, matched on trigram.
+
+        Only the non-null fields of the given rows overwrite the stored values.
+
+        Args:
+            applications: Rows with a 'trigram' column and any application column
+
+        Returns:
+            Mapping trigram -> application_id for the given applications
+        """
+        columns = [col for col in self.TABLES['application'] if col in applications.columns and col != 'application_id']
+        applications = applications[columns].drop_duplicates('trigram', keep='last')
+
+        known_ids = self.get_application_ids(applications['trigram'].tolist())
+        is_new = ~applications['trigram'].isin(list(known_ids))
+
+        with self._connection:
+            new_rows = self._to_rows('application', applications.loc[is_new, columns])
+            self._connection.executemany(
+                f"INSERT INTO application ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", new_rows
+            )
+
+            update_columns = [col for col in columns if col != 'trigram']
+            if update_columns:
+                assignments = ', '.join(f"{col} = COALESCE(?, {col})" for col in update_columns)
+                known = applications.loc[~is_new, update_columns + ['trigram']]
+                self._connection.executemany(
+                    f"UPDATE application SET {assignments} WHERE trigram = ?",
+                    self._to_rows('application', known)
+                )
+
+        return self.get_application_ids(applications['trigram'].tolist())
+
+    def upsert_frame(self, table: str, data: Union[pd.DataFrame, List[Dict]]) -> Dict[str, int]:
+        """
+        Merge rows in a table within a single transaction: rows with a known natural key replace the stored ones,
+        the others are inserted.
+
+        Unlike upsert_applications(), the given values overwrite the stored ones, null values included:
+        merged rows are full records, e.g. the changed records of an incremental fetch. The merge relies on the
+        unique index of the natural key (see NATURAL_KEYS), so it only touches the given keys.
+
+        Args:
+            table: Entity table name (e.g. 'incident')
+            data: Rows to merge, with all the natural key columns
+
+        Returns:
+            Number of 'inserted' and 'updated' rows
+
+        Raises:
+            ValueError: If the table does not exist, has no natural key or a key column is missing
+        """
+        self._validate_table(table)
+        keys = self.NATURAL_KEYS.get(table)
+        if not keys:
+            raise ValueError(f"No natural key for table '{table}'. Rows can only be merged on a natural key.")
+
+        df = pd.DataFrame(data)
+        missing = [col for col in keys if col not in df.columns]
+        if missing:
+            raise ValueError(f"Key columns {missing} missing to merge rows in table '{table}'")
+
+        # Last occurrence wins, as if the rows were merged one after the other
+        df = df.drop_duplicates(keys, keep='last')
+        columns = [col for col in self.TABLES[table] if col in df.columns]
+        values = [col for col in columns if col not in keys]
+        rows = self._to_rows(table, df[values + keys])
+
+        update = f"UPDATE SET {', '.join(f'{col} = excluded.{col}' for col in values)}" if values else 'NOTHING'
+        with self._connection:
+            # New rows get a rowid above the current maximum, updated rows keep theirs
+            last_rowid = self._connection.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+            self._connection.executemany(
+                f"INSERT INTO {table} ({', '.join(values + keys)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT({', '.join(self._get_key_terms(table))}) DO {update}",
+                rows
+            )
+            inserted = self._connection.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE rowid > ?", (last_rowid,)
+            ).fetchone()[0]
+
+        return {'inserted': inserted, 'updated': len(rows) - inserted}
+
+    def get_watermark(self, datasource: str) -> Optional[pd.Timestamp]:
+        """
+        Get the high-water mark of a datasource: the latest extraction date merged from it.
+
+        Args:
+            datasource: Datasource name (e.g. 'jira.com')
+
+        Returns:
+            Latest merged extraction date, None if nothing was fetched yet
+        """
+        row = self._connection.execute(
+            "SELECT extraction_date FROM watermark WHERE datasource = ?", (datasource,)
+        ).fetchone()
+        return pd.Timestamp(row[0]) if row and row[0] is not None else None
+
+    def set_watermark(self, datasource: str, extraction_date: Union[str, pd.Timestamp]) -> None:
+        """
+        Persist the high-water mark of a datasource.
+
+        Args:
+            datasource: Datasource name
+            extraction_date: Latest extraction date merged from it
+        """
+        rows = self._to_rows('watermark', pd.DataFrame({
+            'extraction_date': [pd.Timestamp(extraction_date)],
+            'update_date': [pd.Timestamp.now()],
+            'datasource': [datasource]
+        }))
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO watermark (extraction_date, update_date, datasource) VALUES (?, ?, ?) "
+                "ON CONFLICT(datasource) DO UPDATE SET extraction_date = excluded.extraction_date, "
+                "update_date = excluded.update_date",
+                rows
+            )
+
+    def get_orphans(self, datasource: str) -> pd.DataFrame:
+        """
+        Get the records of a datasource kept until their application is known.
+
+        Args:
+            datasource: Datasource name
+
+        Returns:
+            One row per kept record, with its fields and the date it was first fetched (FIRST_SEEN_COLUMN)
+        """
+        rows = self._connection.execute(
+            "SELECT record, first_seen FROM orphan WHERE datasource = ? ORDER BY orphan_id", (datasource,)
+        ).fetchall()
+        orphans = pd.DataFrame([json.loads(record) for record, _ in rows])
+        orphans[self.FIRST_SEEN_COLUMN] = pd.to_datetime([first_seen for _, first_seen in rows])
+        return orphans
+
+    def set_orphans(self, datasource: str, orphans: pd.DataFrame) -> None:
+        """
+        Replace the kept records of a datasource.
+
+        Args:
+            datasource: Datasource name
+            orphans: Records with their FIRST_SEEN_COLUMN, as returned by get_orphans()
+        """
+        records = json.loads(orphans.drop(columns=self.FIRST_SEEN_COLUMN).to_json(orient='records', date_format='iso'))
+        rows = self._to_rows('orphan', pd.DataFrame({
+            'datasource': datasource,
+            'record': [json.dumps(record) for record in records],
+            'first_seen': orphans[self.FIRST_SEEN_COLUMN].to_numpy()
+        }))
+        with self._connection:
+            self._connection.execute("DELETE FROM orphan WHERE datasource = ?", (datasource,))
+            self._connection.executemany(
+                "INSERT INTO orphan (datasource, record, first_seen) VALUES (?, ?, ?)", rows
+            )
+
+    def get_application_ids(self, trigrams: Iterable[str]) -> Dict[str, int]:
+        """
+        Get the application ids of trigrams (indexed lookup).
+
+        Args:
+            trigrams: Trigrams to look up
+
+        Returns:
+            Mapping trigram -> application_id for the known trigrams
+        """
+        trigrams = list(dict.fromkeys(trigrams))
+        ids = {}
+        # Chunked to stay below the SQLite host parameter limit
+        for start in range(0, len(trigrams), 500):
+            chunk = trigrams[start:start + 500]
+            cursor = self._connection.execute(
+                f"SELECT trigram, application_id FROM application WHERE trigram IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            ids.update(dict(cursor.fetchall()))
+        return ids
+
+    def load_metrics_workbook(self, path: Union[str, Path], season: Optional[int] = None) -> int:
+        """
+        Bulk load a "Data collect" metrics workbook: its applications and all its answers.
+
+        Args:
+            path: Path to the workbook
+            season: Season of the answers. If None, read from the workbook title.
+
+        Returns:
+            Number of answers loaded
+
+        Raises:
+            ValueError: If the workbook layout is invalid or the season cannot be determined
+        """
+        reader = MetricsWorkbookReader().read(path)
+        return self.load_metrics_answers(reader.get_applications(), reader.get_answers(),
+                                         season if season is not None else self._get_season(reader))
+
+    def load_metrics_answers(self, applications: pd.DataFrame, answers: pd.DataFrame, season: int) -> int:
+        """
+        Bulk load already parsed workbook applications and answers (see MetricsWorkbookReader).
+
+        Answers are merged on the snapshot natural key: loading a workbook again updates its answers instead of
+        duplicating them. Applications without trigram (identified by their Excel column letter) are skipped.
+
+        Args:
+            applications: Application header rows
+            answers: Long answer table
+            season: Season of the answers
+
+        Returns:
+            Number of answers loaded
+        """
+        if 'column' in applications.columns:
+            # The reader identifies the applications without trigram by their column letter
+            applications = applications[applications['trigram'] != applications['column']]
+        answers = answers[answers['trigram'].isin(applications['trigram'])]
+
+        fields = {k: v for k, v in self.WORKBOOK_APPLICATION_FIELDS.items() if k in applications.columns}
+        application_ids = self.upsert_applications(applications[list(fields)].rename(columns=fields))
+
+        snapshot = pd.DataFrame({
+            'creation_date': pd.Timestamp.now().normalize(),
+            'season': season,
+            'application_id': answers['trigram'].map(application_ids).to_numpy(),
+            'quality_group': answers['group'].to_numpy(),
+            'section': answers['section'].to_numpy(),
+            'question': answers['question'].to_numpy(),
+            'detail': answers['detail'].to_numpy(),
+            'value': answers['value'].astype(str).to_numpy()
+        })
+
+        merged = self.upsert_frame('snapshot', snapshot)
+        return merged['inserted'] + merged['updated']
+
+    def load_product_export(self, path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Bulk load the applications of a product catalogue export (ProductExport.xlsx).
+
+        Args:
+            path: Path to the export workbook
+
+        Returns:
+            Mapping trigram -> application_id of the loaded applications
+        """
+        export = pd.read_excel(path)
+        fields = {k: v for k, v in self.PRODUCT_EXPORT_FIELDS.items() if k in export.columns}
+        applications = export[list(fields)].rename(columns=fields).dropna(subset=['trigram'])
+
+        for col in ['enterprise_service', 'web_exposure']:
+            if col in applications.columns:
+                applications[col] = applications[col].astype('string').str.strip().str.upper().map(
+                    {'YES': True, 'NO': False}
+                )
+
+        return self.upsert_applications(applications)
+
+    def query(self, sql: str, params: Union[List, Dict, tuple] = ()) -> pd.DataFrame:
+        """
+        Run a read query.
+
+        Args:
+            sql: SQL query with '?' or ':name' placeholders
+            params: Query parameters
+
+        Returns:
+            Query result as a DataFrame
+        """
+        return pd.read_sql_query(sql, self._connection, params=params)
+
+    def get_snapshot_answers(self, season: int, section: Optional[str] = None,
+                             trigrams: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Get the workbook answers of a season (indexed on season, section and application).
+
+        Args:
+            season: Season to read
+            section: Optional section filter (e.g. 'Production Stability')
+            trigrams: Optional application filter
+
+        Returns:
+            DataFrame with trigram, section, question, detail and raw value
+        """
+        sql = ("SELECT a.trigram, s.quality_group, s.section, s.question, s.detail, s.value "
+               "FROM snapshot s JOIN application a ON a.application_id = s.application_id WHERE s.season = ?")
+        params: List = [season]
+        if section is not None:
+            sql += " AND s.section = ?"
+            params.append(section)
+        if trigrams:
+            sql += f" AND a.trigram IN ({', '.join('?' * len(trigrams))})"
+            params.extend(trigrams)
+
+        return self.query(sql + " ORDER BY s.snapshot_id", params)
+
+    def get_incidents(self, trigrams: Optional[List[str]] = None, start: Optional[str] = None,
+                      end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get incidents with their faulty application trigram (indexed on application and creation date).
+
+        Args:
+            trigrams: Optional application filter
+            start: Optional first incident creation date (inclusive, ISO format)
+            end: Optional last incident creation date (exclusive, ISO format)
+
+        Returns:
+            DataFrame of incidents, 'faulty_application' holding the trigram
+        """
+        sql = ("SELECT i.jira_id, i.incident_creation_date, i.resolution_date, i.priority, "
+               "a.trigram AS faulty_application, i.flagged_as_not_an_incident "
+               "FROM incident i JOIN application a ON a.application_id = i.faulty_application WHERE 1 = 1")
+        params: List = []
+        if trigrams:
+            sql += f" AND a.trigram IN ({', '.join('?' * len(trigrams))})"
+            params.extend(trigrams)
+        if start is not None:
+            sql += " AND i.incident_creation_date >= ?"
+            params.append(start)
+        if end is not None:
+            sql += " AND i.incident_creation_date < ?"
+            params.append(end)
+
+        incidents = self.query(sql, params)
+        for col in ['incident_creation_date', 'resolution_date']:
+            incidents[col] = pd.to_datetime(incidents[col])
+        return incidents
+
+    # ========== SCHEMA METHODS ==========
+
+    def _create_schema(self) -> None:
+        with self._connection:
+            for table, columns in self.TABLES.items():
+                definition = ', '.join(f"{name} {sql_type}" for name, sql_type in columns.items())
+                self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definition})")
+            for index, (table, columns) in self.INDEXES.items():
+                self._connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({', '.join(columns)})")
+            for table in self.NATURAL_KEYS:
+                self._create_natural_key_index(table)
+
+    def _create_natural_key_index(self, table: str) -> None:
+        index = self.NATURAL_KEY_INDEX_TEMPLATE.format(table=table)
+        if self._connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                                    (index,)).fetchone():
+            return
+
+        # Databases created before the unique keys may hold duplicates: keep the last stored row of each key
+        key_terms = self._get_key_terms(table)
+        not_null = ''.join(f"{col} IS NOT NULL AND " for col in self.NATURAL_KEYS[table]
+                           if col not in self.NULLABLE_KEYS.get(table, []))
+        self._connection.execute(
+            f"DELETE FROM {table} WHERE {not_null}rowid NOT IN "
+            f"(SELECT MAX(rowid) FROM {table} GROUP BY {', '.join(key_terms)})"
+        )
+        self._connection.execute(f"CREATE UNIQUE INDEX {index} ON {table} ({', '.join(key_terms)})")
+
+    def _get_key_terms(self, table: str) -> List[str]:
+        """Natural key columns as indexed, the nullable ones wrapped in COALESCE"""
+        nullable = self.NULLABLE_KEYS.get(table, [])
+        return [f"COALESCE({col}, '')" if col in nullable else col for col in self.NATURAL_KEYS[table]]
+
+    def _validate_table(self, table: str) -> None:
+        if table not in self.TABLES:
+            raise ValueError(f"Unknown table '{table}'. Available tables: {list(self.TABLES)}")
+
+    # ========== HELPER METHODS ==========
+
+    def _to_rows(self, table: str, df: pd.DataFrame) -> List[tuple]:
+        """Convert a frame to SQLite-friendly tuples: ISO dates, native Python types and None for missing values"""
+        df = df.copy()
+        for col in df.columns:
+            if self.TABLES[table].get(col) == self.DATE_COLUMN_TYPE or pd.api.types.is_datetime64_any_dtype(df[col]):
+                dates = pd.to_datetime(df[col])
+                df[col] = dates.dt.strftime('%Y-%m-%d %H:%M:%S').where(dates.notna(), None)
+
+        # astype(object) turns numpy scalars into native Python values sqlite3 can bind
+        return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+    def _get_season(self, reader: MetricsWorkbookReader) -> int:
+        season = reader.get_season()
+        if season is None:
+            raise ValueError("Season cannot be read from the workbook title. Give it explicitly.")
+        return season['season']
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    store = QSnapDataStore()
+    store.load_metrics_workbook('../../data/2025-metrics-tiny.xlsx')
+    store.load_product_export('../../data/ProductExport.xlsx')
+
+    store.insert_frame('incident', {
+        'jira_id': ['INC-1', 'INC-2'],
+        'incident_creation_date': ['2024-10-03 08:00', '2025-01-07 09:00'],
+        'resolution_date': ['2024-10-03 10:00', '2025-01-07 12:00'],
+        'priority': ['Blocker', 'Critical'],
+        'faulty_application': list(store.get_application_ids(['AAA', 'BBB']).values())
+    })
+
+    print(store.query("SELECT trigram, name, platform, priority_level FROM application"))
+    print(store.get_snapshot_answers(2025, section='Production Stability', trigrams=['AAA']))
+    print(store.get_incidents(start='2024-09-01', end='2025-09-01'))
+    store.close()
@@ -0,0 +1,252 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Optional, Union
+
+
+class ReleaseIncidentAttributor:
+    """
+    Attribute every incident to the release window of its faulty application and compute the
+    "Median of incidents per release" metrics.
+
+    A release window starts at the release date and ends at the next release of the same application.
+    Both tables are sorted once and joined with an as-of join per application, so the cost is
+    O((incidents + releases) log(incidents + releases)) instead of incidents x releases.
+
+    Usage:
+        attributor = ReleaseIncidentAttributor()
+        attributor.set_releases(releases_df).set_incidents(incidents_df)
+        per_release = attributor.compute_release_counts()
+        medians = attributor.compute_medians()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # Release table columns (see doc/data-dictionary.md - Release entity)
+    RELEASE_ID_COLUMN = 'release_id'
+    RELEASE_APPLICATION_COLUMN = 'application_id'
+    RELEASE_DATE_COLUMN = 'release_date'
+
+    # Incident table columns (see doc/data-dictionary.md - Incident entity)
+    INCIDENT_APPLICATION_COLUMN = 'faulty_application'
+    INCIDENT_DATE_COLUMN = 'incident_creation_date'
+    INCIDENT_PRIORITY_COLUMN = 'priority'
+
+    # Priority groups, one count column per group (labels match the metrics workbook)
+    PRIORITY_GROUPS = {
+        '>=critical': ['Blocker', 'Critical'],
+        'major': ['Major']
+    }
+
+    RELEASE_COUNT_LABEL = '#Releases'
+    MEDIAN_LABEL_TEMPLATE = 'Median #incidents ({group})'
+
+    # Internal columns carrying the row position of the release and the application join key through the as-of join
+    _RELEASE_POSITION_COLUMN = '_release_position'
+    _APPLICATION_KEY_COLUMN = '_application_key'
+
+    def __init__(self):
+        self._releases: Optional[pd.DataFrame] = None
+        self._incidents: Optional[pd.DataFrame] = None
+        self._attributed: Optional[pd.DataFrame] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_releases(self, data: Union[pd.DataFrame, Dict]) -> 'ReleaseIncidentAttributor':
+        """
+        Set the release table.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain the release id, application id and release date columns.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        df = self._to_data_frame(data)
+        self._validate_columns(df, [self.RELEASE_ID_COLUMN, self.RELEASE_APPLICATION_COLUMN, self.RELEASE_DATE_COLUMN],
+                               'Release')
+
+        releases = df[[self.RELEASE_ID_COLUMN, self.RELEASE_APPLICATION_COLUMN, self.RELEASE_DATE_COLUMN]].copy()
+        releases[self.RELEASE_DATE_COLUMN] = pd.to_datetime(releases[self.RELEASE_DATE_COLUMN])
+        self._releases = releases.dropna(subset=[self.RELEASE_DATE_COLUMN]).sort_values(
+            self.RELEASE_DATE_COLUMN, kind='stable', ignore_index=True
+        )
+        self._attributed = None
+
+        return self
+
+    def set_incidents(self, data: Union[pd.DataFrame, Dict]) -> 'ReleaseIncidentAttributor':
+        """
+        Set the incident table.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain the faulty application, creation date and priority columns.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        df = self._to_data_frame(data)
+        self._validate_columns(
+            df, [self.INCIDENT_APPLICATION_COLUMN, self.INCIDENT_DATE_COLUMN, self.INCIDENT_PRIORITY_COLUMN], 'Incident'
+        )
+
+        incidents = df[[self.INCIDENT_APPLICATION_COLUMN, self.INCIDENT_DATE_COLUMN, self.INCIDENT_PRIORITY_COLUMN]].copy()
+        incidents[self.INCIDENT_DATE_COLUMN] = pd.to_datetime(incidents[self.INCIDENT_DATE_COLUMN])
+        self._incidents = incidents.dropna(subset=[self.INCIDENT_DATE_COLUMN]).sort_values(
+            self.INCIDENT_DATE_COLUMN, kind='stable', ignore_index=True
+        )
+        self._attributed = None
+
+        return self
+
+    def attribute(self) -> pd.DataFrame:
+        """
+        Assign each incident to the latest release of its faulty application published before it.
+
+        Incidents raised before the first release of their application, or of applications without release,
+        get a NaN release id. Application ids are matched on their text, so 42 and '42' are the same application.
+
+        Returns:
+            The incident table sorted by creation date, with the release id, release date and
+            release row position added
+
+        Raises:
+            ValueError: If releases or incidents are not set
+        """
+        if self._attributed is None:
+            self._check_data()
+            if self._releases.empty:
+                # Nothing to join with (merge_asof cannot even compare the empty key column): all unattributed
+                self._attributed = self._incidents.assign(**{
+                    self.RELEASE_ID_COLUMN: np.nan,
+                    self.RELEASE_DATE_COLUMN: pd.NaT,
+                    self._RELEASE_POSITION_COLUMN: np.nan
+                })
+                return self._attributed
+
+            # Both 'by' keys need the same dtype (e.g. int ids in one table, str in the other)
+            releases = self._releases.drop(columns=self.RELEASE_APPLICATION_COLUMN).assign(**{
+                self._APPLICATION_KEY_COLUMN: self._releases[self.RELEASE_APPLICATION_COLUMN].astype('string'),
+                self._RELEASE_POSITION_COLUMN: np.arange(len(self._releases))
+            })
+            incidents = self._incidents.assign(**{
+                self._APPLICATION_KEY_COLUMN: self._incidents[self.INCIDENT_APPLICATION_COLUMN].astype('string')
+            })
+
+            self._attributed = pd.merge_asof(
+                incidents,
+                releases,
+                left_on=self.INCIDENT_DATE_COLUMN,
+                right_on=self.RELEASE_DATE_COLUMN,
+                by=self._APPLICATION_KEY_COLUMN,
+                direction='backward',
+                allow_exact_matches=True
+            ).drop(columns=self._APPLICATION_KEY_COLUMN)
+
+        return self._attributed
+
+    def compute_release_counts(self) -> pd.DataFrame:
+        """
+        Count the incidents of every priority group for every release, including releases without incident.
+
+        Returns:
+            DataFrame with one row per release (release id, application id, release date) and one count
+            column per priority group
+        """
+        attributed = self.attribute()
+
+        release_codes = attributed[self._RELEASE_POSITION_COLUMN].fillna(-1).to_numpy(dtype=np.int64)
+        num_releases = len(self._releases)
+
+        counts = self._releases.copy()
+        for group, priorities in self.PRIORITY_GROUPS.items():
+            mask = (release_codes >= 0) & attributed[self.INCIDENT_PRIORITY_COLUMN].isin(priorities).to_numpy()
+            counts[group] = np.bincount(release_codes[mask], minlength=num_releases)
+
+        return counts
+
+    def compute_medians(self, applications: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Compute the number of releases and the median incident counts per release for all applications.
+
+        Args:
+            applications: Applications (columns) to report. If None, uses all applications having a release.
+                          Applications without release get 0 releases and NaN medians. Ids are matched on
+                          their text and the columns are named after it.
+
+        Returns:
+            DataFrame with a 'Category' column (#Releases and one median row per priority group)
+            and one numeric column per application
+        """
+        counts = self.compute_release_counts()
+        # Application ids are matched on their text, as in attribute()
+        grouped = counts.groupby(counts[self.RELEASE_APPLICATION_COLUMN].astype(str), sort=True)
+
+        summary = grouped[list(self.PRIORITY_GROUPS)].median()
+        summary.insert(0, self.RELEASE_COUNT_LABEL, grouped.size())
+        summary = summary.rename(
+            columns={group: self.MEDIAN_LABEL_TEMPLATE.format(group=group) for group in self.PRIORITY_GROUPS}
+        )
+
+        if applications is not None:
+            summary = summary.reindex([str(application) for application in applications])
+            summary[self.RELEASE_COUNT_LABEL] = summary[self.RELEASE_COUNT_LABEL].fillna(0).astype(int)
+
+        # Float columns, so that the chart builders accept them (#Releases is a whole number anyway)
+        medians = summary.T.astype(float)
+        medians.columns.name = None
+        return medians.rename_axis('Category').reset_index()
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_columns(self, df: pd.DataFrame, columns: List[str], table_name: str) -> None:
+        missing_columns = [col for col in columns if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"{table_name} table is missing columns: {missing_columns}")
+
+    def _check_data(self) -> None:
+        if self._releases is None:
+            raise ValueError("Releases must be set before attributing. Call set_releases() first.")
+        if self._incidents is None:
+            raise ValueError("Incidents must be set before attributing. Call set_incidents() first.")
+
+    # ========== HELPER METHODS ==========
+
+    @staticmethod
+    def _to_data_frame(data: Union[pd.DataFrame, Dict]) -> pd.DataFrame:
+        if isinstance(data, dict):
+            return pd.DataFrame(data)
+        if isinstance(data, pd.DataFrame):
+            return data
+        raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    releases = {
+        'release_id': [1, 2, 3, 4],
+        'application_id': ['AAA', 'AAA', 'DDD', 'DDD'],
+        'release_date': ['2024-09-15', '2025-01-10', '2024-10-01', '2025-03-01']
+    }
+
+    incidents = {
+        'faulty_application': ['AAA', 'AAA', 'AAA', 'DDD', 'DDD', 'DDD', 'BBB'],
+        'incident_creation_date': ['2024-09-01', '2024-09-20', '2025-02-01',
+                                   '2024-10-02', '2024-11-15', '2025-03-05', '2025-01-01'],
+        'priority': ['Critical', 'Blocker', 'Major', 'Critical', 'Major', 'Critical', 'Blocker']
+    }
+
+    attributor = ReleaseIncidentAttributor()
+    attributor.set_releases(releases).set_incidents(incidents)
+
+    print(attributor.compute_release_counts())
+    print(attributor.compute_medians(['AAA', 'BBB', 'CCC', 'DDD']))
@@ -0,0 +1,350 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import List, Dict, Optional, Union, Any
+
+
+class SchemaRuleChecker:
+    """
+    Dataset-wide validation of a table against the column rules of a JSON schema.
+
+    Instead of validating record by record, the checker derives one rule per constraint of the schema (required
+    field, type, pattern, enum, string length, uniqueItems) and runs every rule as a single vectorized
+    operation over the whole column. Two schema shapes are supported:
+        - an array of flat objects (product-catalogue-schema.json), checked on pd.DataFrame(items)
+        - an object whose properties carry provenance (application_data_model_schema.json), checked on
+          pd.json_normalize(objects), i.e. on 'trigram.value', 'trigram.datasource', ... columns
+
+    Usage:
+        checker = SchemaRuleChecker().load_schema('src/fetchers-interfaces/product-catalogue-schema.json')
+        checker.check(catalogue_items)
+        report = checker.get_report()
+        violations = checker.get_violations()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    VIOLATION_COLUMNS = ['rule', 'column', 'row', 'value']
+
+    # JSON types and the Python types accepted for them
+    JSON_TYPES = {
+        'string': (str,),
+        'boolean': (bool, np.bool_),
+        'array': (list, tuple, np.ndarray),
+        'object': (dict,)
+    }
+
+    # pandas inferred column types matching a JSON type, to skip the per-value type check
+    INFERRED_TYPES = {
+        'string': 'string',
+        'boolean': 'boolean'
+    }
+
+    FORMAT_PATTERNS = {
+        'uuid': r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$',
+        'date-time': r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:?\d{2})?$'
+    }
+
+    def __init__(self):
+        self._rules: List[Dict[str, Any]] = []
+        self._definitions: Dict[str, Any] = {}
+        self._violations: Optional[pd.DataFrame] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def load_schema(self, path: Union[str, Path]) -> 'SchemaRuleChecker':
+        """
+        Load a JSON schema file and derive its column rules.
+
+        Args:
+            path: Path to the JSON schema
+
+        Returns:
+            Self for method chaining
+        """
+        return self.set_schema(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def set_schema(self, schema: Dict[str, Any]) -> 'SchemaRuleChecker':
+        """
+        Derive the column rules of a schema.
+
+        Args:
+            schema: JSON schema of an array of objects or of a single object
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the schema describes neither objects nor an array of objects
+        """
+        self._definitions = schema.get('$defs', {})
+        self._rules = []
+
+        if schema.get('type') == 'array':
+            if schema.get('uniqueItems'):
+                self._add_rule('unique_rows', None, 'unique_rows')
+            item_schema = self._resolve(schema.get('items', {}))
+            required = schema.get('required', item_schema.get('required', []))
+        elif schema.get('type') == 'object':
+            item_schema = schema
+            required = schema.get('required', [])
+        else:
+            raise ValueError("Schema must describe an object or an array of objects")
+
+        # Tolerates lists written as one string, e.g. "productOwner, crownJewelsLevel"
+        required = [field.strip() for entry in required for field in entry.split(',')]
+        properties = {name: self._resolve(prop_schema) for name, prop_schema in item_schema.get('properties', {}).items()}
+
+        for name in required:
+            column = f"{name}.value" if self._has_value(properties.get(name, {})) else name
+            self._add_rule(f"{name}: required", column, 'required')
+        for name, prop_schema in properties.items():
+            self._derive_rules(name, prop_schema)
+
+        self._violations = None
+        return self
+
+    def get_rules(self) -> pd.DataFrame:
+        """
+        Get the derived rules.
+
+        Returns:
+            DataFrame with rule, column, kind and parameter
+        """
+        return pd.DataFrame(self._rules, columns=['rule', 'column', 'kind', 'parameter'])
+
+    def check(self, data: Union[pd.DataFrame, List[Dict]]) -> 'SchemaRuleChecker':
+        """
+        Run every rule over the whole table.
+
+        Args:
+            data: Records (flattened with pd.json_normalize for provenance objects) or DataFrame
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If no schema is set
+        """
+        if not self._rules:
+            raise ValueError("Schema must be set first. Call load_schema() first.")
+
+        df = pd.json_normalize(data) if isinstance(data, list) else data
+
+        # Shared by all the rules of a column
+        missing = df.isna()
+
+        violations = []
+        for rule in self._rules:
+            offending = self._apply_rule(df, missing, rule)
+            if len(offending):
+                violations.append(pd.DataFrame({
+                    'rule': rule['rule'],
+                    'column': rule['column'],
+                    'row': offending.index,
+                    'value': offending.to_numpy()
+                }))
+
+        self._violations = (
+            pd.concat(violations, ignore_index=True) if violations
+            else pd.DataFrame(columns=self.VIOLATION_COLUMNS)
+        )
+        return self
+
+    def get_violations(self) -> pd.DataFrame:
+        """
+        Get every violation.
+
+        Returns:
+            DataFrame with rule, column, offending row index and offending value
+        """
+        self._check_checked()
+        return self._violations
+
+    def get_report(self) -> pd.DataFrame:
+        """
+        Get the violations grouped by rule.
+
+        Returns:
+            DataFrame indexed by rule with the column, number of offending rows and their row indexes,
+            most violated rules first
+        """
+        self._check_checked()
+        return self._violations.groupby('rule', sort=False).agg(
+            column=('column', 'first'),
+            count=('row', 'nunique'),
+            rows=('row', lambda rows: sorted(set(rows)))
+        ).sort_values('count', ascending=False, kind='stable')
+
+    def is_valid(self) -> bool:
+        self._check_checked()
+        return self._violations.empty
+
+    # ========== VALIDATION METHODS ==========
+
+    def _check_checked(self) -> None:
+        if self._violations is None:
+            raise ValueError("Data must be checked first. Call check() first.")
+
+    # ========== RULE DERIVATION METHODS ==========
+
+    def _resolve(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Inline '$ref' and merge 'allOf' parts, nested properties included"""
+        if '$ref' in schema:
+            name = schema['$ref'].split('/')[-1]
+            base = self._resolve(self._definitions[name])
+            schema = self._merge(base, {key: value for key, value in schema.items() if key != '$ref'})
+        for part in schema.get('allOf', []):
+            schema = self._merge({key: value for key, value in schema.items() if key != 'allOf'}, self._resolve(part))
+        return schema
+
+    def _merge(self, base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+        merged = dict(base)
+        for key, value in extra.items():
+            if key == 'properties':
+                properties = dict(merged.get('properties', {}))
+                for name, prop_schema in value.items():
+                    properties[name] = self._merge(self._resolve(properties.get(name, {})), self._resolve(prop_schema))
+                merged['properties'] = properties
+            else:
+                merged[key] = value
+        return merged
+
+    @staticmethod
+    def _has_value(schema: Dict[str, Any]) -> bool:
+        return 'value' in schema.get('properties', {})
+
+    def _derive_rules(self, name: str, schema: Dict[str, Any]) -> None:
+        if schema.get('type') == 'object' and 'properties' in schema:
+            # Provenance object: value, datasource and extraction date are flattened columns
+            for required in schema.get('required', []):
+                self._add_rule(f"{name}.{required}: required", f"{name}.{required}", 'required_if_present',
+                               name)
+            for sub_name, sub_schema in schema['properties'].items():
+                self._derive_rules(f"{name}.{sub_name}", self._resolve(sub_schema))
+            return
+
+        if schema.get('type') == 'array':
+            if schema.get('uniqueItems'):
+                self._add_rule(f"{name}: uniqueItems", name, 'unique_items')
+            items = self._resolve(schema.get('items', {}))
+            item_type = 'object' if self._has_value(items) else items.get('type')
+            if item_type:
+                self._add_rule(f"{name}[]: type {item_type}", name, 'item_type', item_type)
+
+        if 'type' in schema and schema['type'] != 'object':
+            self._add_rule(f"{name}: type {schema['type']}", name, 'type', schema['type'])
+        if 'enum' in schema:
+            self._add_rule(f"{name}: enum", name, 'enum', schema['enum'])
+        if 'pattern' in schema:
+            self._add_rule(f"{name}: pattern {schema['pattern']}", name, 'pattern', schema['pattern'])
+        if 'format' in schema and schema['format'] in self.FORMAT_PATTERNS:
+            self._add_rule(f"{name}: format {schema['format']}", name, 'pattern',
+                           self.FORMAT_PATTERNS[schema['format']])
+        if 'minLength' in schema:
+            self._add_rule(f"{name}: minLength {schema['minLength']}", name, 'min_length', schema['minLength'])
+        if 'maxLength' in schema:
+            self._add_rule(f"{name}: maxLength {schema['maxLength']}", name, 'max_length', schema['maxLength'])
+
+    def _add_rule(self, rule: str, column: Optional[str], kind: str, parameter: Any = None) -> None:
+        self._rules.append({'rule': rule, 'column': column, 'kind': kind, 'parameter': parameter})
+
+    # ========== RULE EXECUTION METHODS ==========
+
+    def _apply_rule(self, df: pd.DataFrame, missing: pd.DataFrame, rule: Dict[str, Any]) -> pd.Series:
+        """Offending values of one rule, indexed by row"""
+        kind, column, parameter = rule['kind'], rule['column'], rule['parameter']
+
+        if kind == 'unique_rows':
+            hashable = df.apply(lambda col: col.map(repr) if col.dtype == object else col)
+            duplicated = hashable.duplicated(keep='first')
+            return pd.Series('duplicated row', index=df.index[duplicated])
+
+        if kind == 'required':
+            if column not in df.columns:
+                return pd.Series(None, index=df.index, dtype=object)
+            return df.loc[missing[column], column]
+
+        if kind == 'required_if_present':
+            # Provenance fields are only required when their parent object is given
+            siblings = [col for col in df.columns if col.startswith(f"{parameter}.")]
+            if not siblings:
+                return pd.Series(dtype=object)
+            present = ~missing[siblings].all(axis=1)
+            absent = missing[column] if column in df.columns else pd.Series(True, index=df.index)
+            return pd.Series(None, index=df.index[present & absent], dtype=object)
+
+        if column not in df.columns:
+            return pd.Series(dtype=object)
+        values = df.loc[~missing[column], column]
+
+        if kind in ('unique_items', 'item_type'):
+            return self._apply_array_rule(values[values.map(lambda v: isinstance(v, self.JSON_TYPES['array']))],
+                                          kind, parameter)
+
+        if kind == 'type' and pd.api.types.infer_dtype(values, skipna=True) == self.INFERRED_TYPES.get(parameter):
+            return values.iloc[0:0]
+
+        # Columns hold few distinct values: check every distinct value once, then broadcast back to the rows.
+        # Types are factorized apart since True == 1 would merge booleans and integers.
+        try:
+            codes, uniques = pd.factorize(values.map(type) if kind == 'type' else values)
+        except TypeError:
+            codes, uniques = np.arange(len(values)), values.to_numpy()
+        bad = np.append(self._check_values(pd.Series(uniques, dtype=object), kind, parameter), False)
+        return values[bad[codes]]
+
+    def _check_values(self, values: pd.Series, kind: str, parameter: Any) -> np.ndarray:
+        """Boolean mask of the values violating a scalar rule"""
+        if kind == 'type':
+            return ~values.map(lambda t: issubclass(t, self.JSON_TYPES[parameter])).to_numpy(dtype=bool)
+        if kind == 'enum':
+            return ~values.isin(parameter).to_numpy()
+        if kind == 'pattern':
+            # JSON schema patterns are searched, not matched, anywhere in the string
+            return ~values.astype(str).str.match(f"(?s:.*?)(?:{parameter})").to_numpy(dtype=bool)
+        if kind == 'min_length':
+            return (values.astype(str).str.len() < parameter).to_numpy()
+        if kind == 'max_length':
+            return (values.astype(str).str.len() > parameter).to_numpy()
+
+        raise ValueError(f"Unknown rule kind '{kind}'")
+
+    def _apply_array_rule(self, values: pd.Series, kind: str, parameter: Any) -> pd.Series:
+        items = values.explode().dropna()
+        if kind == 'item_type':
+            bad_rows = items.index[~items.map(lambda v: isinstance(v, self.JSON_TYPES[parameter]))].unique()
+            return values.loc[bad_rows]
+        if kind == 'unique_items':
+            keys = items.map(lambda v: v.get('value') if isinstance(v, dict) else v)
+            duplicated = pd.DataFrame({'row': keys.index, 'item': keys.to_numpy()}).duplicated()
+            return values.loc[keys.index[duplicated.to_numpy()].unique()]
+
+        raise ValueError(f"Unknown rule kind '{kind}'")
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    catalogue = [
+        {'eacode': 'AB-12345', 'trigram': 'AAA', 'productName': 'Alpha', 'productManager': 'Jane Doe',
+         'productOwner': 'John Doe', 'crownJewelsLevel': 'tier-1', 'rtoLevel': 'A0',
+         'provideEnterpriseServiceFlag': True, 'webExposureFlag': False, 'makeOrBuyCategory': 'make',
+         'flaggedToBeDeleted': False, 'sonarQubeProjectIds': ['aaa-api', 'aaa-ui']},
+        {'eacode': 'AB-1234', 'trigram': 'bbb', 'productName': 'Beta', 'productManager': 'Jane Doe',
+         'productOwner': 'John Doe', 'crownJewelsLevel': 'tier-4', 'rtoLevel': 'A1',
+         'provideEnterpriseServiceFlag': 'yes', 'webExposureFlag': False, 'makeOrBuyCategory': 'buy',
+         'flaggedToBeDeleted': False, 'sonarQubeProjectIds': []},
+        {'eacode': 'CD-00001', 'trigram': 'CCC', 'productName': 'Gamma', 'productManager': None,
+         'productOwner': 'John Doe', 'crownJewelsLevel': 'n/a', 'rtoLevel': 'A2',
+         'provideEnterpriseServiceFlag': False, 'webExposureFlag': True, 'makeOrBuyCategory': 'customise',
+         'flaggedToBeDeleted': True, 'sonarQubeProjectIds': ['ccc-batch']}
+    ]
+
+    checker = SchemaRuleChecker().load_schema('../fetchers-interfaces/product-catalogue-schema.json')
+    checker.check(pd.DataFrame(catalogue))
+
+    print(checker.get_report())
+    print(checker.get_violations())
@@ -0,0 +1,256 @@
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import List, Dict, Optional, Union
+
+
+class StaticQualityIngestor:
+    """
+    Ingestion stage for the Sonar static quality snapshots (Static_quality entity).
+
+    One application maps to many Sonar projects (sonarQubeProjectIds in the product catalogue), each one
+    with several branches and snapshots over time. The ingestor keeps the latest snapshot per project and
+    branch with a single sort + drop_duplicates, then aggregates ratings, coverage and line counts per
+    application, weighted by number_of_lines.
+
+    Usage:
+        ingestor = StaticQualityIngestor()
+        ingestor.set_project_mapping(catalogue_records).load_snapshots('fixtures/sonar-snapshots.json')
+        per_application = ingestor.aggregate()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # Snapshot columns (see doc/data-dictionary.md - Static_quality entity)
+    PROJECT_COLUMN = 'sonar_project_id'
+    BRANCH_COLUMN = 'branch'
+    SNAPSHOT_DATE_COLUMN = 'creation_date'
+    APPLICATION_COLUMN = 'application_id'
+    LINES_COLUMN = 'number_of_lines'
+    COVERAGE_COLUMN = 'coverage'
+    RATING_COLUMNS = ['maintainability_score', 'reliability_score', 'security_score', 'security_review_score']
+
+    REQUIRED_COLUMNS = [PROJECT_COLUMN, BRANCH_COLUMN, SNAPSHOT_DATE_COLUMN, LINES_COLUMN]
+
+    # Product catalogue fields (see src/fetchers-interfaces/product-catalogue-schema.json)
+    CATALOGUE_APPLICATION_FIELD = 'trigram'
+    CATALOGUE_PROJECTS_FIELD = 'sonarQubeProjectIds'
+
+    # Sonar ratings, best first. Weighted averages are rounded back to the closest rating.
+    RATINGS = ['A', 'B', 'C', 'D', 'E']
+
+    SUPPORTED_FILE_TYPES = ['.json', '.csv']
+
+    def __init__(self):
+        self._snapshots: Optional[pd.DataFrame] = None
+        self._project_mapping: Optional[pd.DataFrame] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_project_mapping(self, catalogue: Union[pd.DataFrame, List[Dict]]) -> 'StaticQualityIngestor':
+        """
+        Set the Sonar project to application mapping from product catalogue items.
+
+        Args:
+            catalogue: Catalogue items (list of dicts or DataFrame) with 'trigram' and 'sonarQubeProjectIds'
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the catalogue misses the required fields
+        """
+        items = pd.DataFrame(catalogue)
+        for field in [self.CATALOGUE_APPLICATION_FIELD, self.CATALOGUE_PROJECTS_FIELD]:
+            if field not in items.columns:
+                raise ValueError(f"Catalogue items must contain a '{field}' field")
+
+        mapping = items[[self.CATALOGUE_APPLICATION_FIELD, self.CATALOGUE_PROJECTS_FIELD]].explode(
+            self.CATALOGUE_PROJECTS_FIELD
+        ).dropna()
+        mapping.columns = [self.APPLICATION_COLUMN, self.PROJECT_COLUMN]
+        self._project_mapping = mapping.drop_duplicates(self.PROJECT_COLUMN, keep='first')
+
+        return self
+
+    def set_data(self, data: Union[pd.DataFrame, List[Dict], Dict]) -> 'StaticQualityIngestor':
+        """
+        Set the static quality snapshots, replacing any previously loaded ones.
+
+        Args:
+            data: Snapshots as a DataFrame, a list of records or a dictionary of columns
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        if isinstance(data, (dict, list)):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data.copy()
+        else:
+            raise ValueError("Data must be either a pandas DataFrame, a list of records or a dictionary")
+
+        self._validate_data_frame(df)
+        self._snapshots = df
+
+        return self
+
+    def load_snapshots(self, *paths: Union[str, Path]) -> 'StaticQualityIngestor':
+        """
+        Load static quality snapshots in bulk from local JSON (list of records) or CSV files.
+
+        Args:
+            paths: One or more files, all concatenated into a single table
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If a file type is not supported or no file is given
+        """
+        if not paths:
+            raise ValueError("At least one snapshot file must be given")
+
+        frames = [self._read_file(Path(path)) for path in paths]
+        return self.set_data(pd.concat(frames, ignore_index=True))
+
+    def get_latest_snapshots(self) -> pd.DataFrame:
+        """
+        Keep only the latest snapshot per Sonar project and branch.
+
+        Returns:
+            DataFrame with one row per (project, branch), mapped to its application when a mapping is set
+
+        Raises:
+            ValueError: If data is not set
+        """
+        if self._snapshots is None:
+            raise ValueError("Data must be set before ingesting. Call set_data() or load_snapshots() first.")
+
+        snapshots = self._snapshots.copy()
+        snapshots[self.SNAPSHOT_DATE_COLUMN] = pd.to_datetime(snapshots[self.SNAPSHOT_DATE_COLUMN])
+
+        latest = snapshots.sort_values(
+            [self.PROJECT_COLUMN, self.BRANCH_COLUMN, self.SNAPSHOT_DATE_COLUMN], kind='stable'
+        ).drop_duplicates([self.PROJECT_COLUMN, self.BRANCH_COLUMN], keep='last')
+
+        if self._project_mapping is not None:
+            latest = latest.drop(columns=[self.APPLICATION_COLUMN], errors='ignore').merge(
+                self._project_mapping, on=self.PROJECT_COLUMN, how='left'
+            )
+
+        return latest.reset_index(drop=True)
+
+    def aggregate(self, branches: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Aggregate the latest snapshots per application, weighted by number of lines.
+
+        Args:
+            branches: Branches to keep (e.g. ['main', 'master']). If None, all branches are aggregated.
+
+        Returns:
+            DataFrame indexed by application with one rating column per Sonar rating (A-E, NaN if unknown),
+            the weighted coverage and the total number of lines
+
+        Raises:
+            ValueError: If data is not set or snapshots cannot be mapped to an application
+        """
+        latest = self.get_latest_snapshots()
+        if self.APPLICATION_COLUMN not in latest.columns:
+            raise ValueError("Snapshots have no application. Call set_project_mapping() or provide 'application_id'.")
+
+        if branches is not None:
+            latest = latest[latest[self.BRANCH_COLUMN].isin(branches)]
+        latest = latest.dropna(subset=[self.APPLICATION_COLUMN])
+
+        lines = pd.to_numeric(latest[self.LINES_COLUMN], errors='coerce').fillna(0).to_numpy(dtype=float)
+        value_columns = [col for col in self.RATING_COLUMNS + [self.COVERAGE_COLUMN] if col in latest.columns]
+
+        # Weighted sums and weights of every value column in one groupby
+        weighted = {self.LINES_COLUMN: lines}
+        for col in value_columns:
+            values = self._to_numeric_values(latest[col], col)
+            known = ~np.isnan(values)
+            weighted[col] = np.where(known, values * lines, 0.0)
+            weighted[f'{col}_weight'] = np.where(known, lines, 0.0)
+
+        sums = pd.DataFrame(weighted, index=latest.index).groupby(
+            latest[self.APPLICATION_COLUMN].to_numpy(), sort=True
+        ).sum()
+
+        aggregated = pd.DataFrame(index=sums.index)
+        aggregated.index.name = self.APPLICATION_COLUMN
+        for col in value_columns:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = sums[col] / sums[f'{col}_weight'].replace(0, np.nan)
+            aggregated[col] = self._to_ratings(mean) if col in self.RATING_COLUMNS else mean.round(4)
+        aggregated[self.LINES_COLUMN] = sums[self.LINES_COLUMN].astype(np.int64)
+
+        return aggregated
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        """Validate that the DataFrame has the required columns"""
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"Static quality snapshots are missing columns: {missing_columns}")
+
+    # ========== HELPER METHODS ==========
+
+    def _read_file(self, path: Path) -> pd.DataFrame:
+        suffix = path.suffix.lower()
+        if suffix not in self.SUPPORTED_FILE_TYPES:
+            raise ValueError(f"Unsupported snapshot file '{path}'. Supported types: {self.SUPPORTED_FILE_TYPES}")
+
+        if suffix == '.json':
+            with open(path, encoding='utf-8') as file:
+                return pd.DataFrame(json.load(file))
+        return pd.read_csv(path)
+
+    def _to_numeric_values(self, column: pd.Series, name: str) -> np.ndarray:
+        """Ratings A-E become 1-5 (NA, UN and unknown letters become NaN), other columns are coerced"""
+        if name in self.RATING_COLUMNS:
+            codes = pd.Index(self.RATINGS).get_indexer(column.astype('string').str.strip().str.upper().fillna(''))
+            return np.where(codes >= 0, codes + 1, np.nan)
+        return pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+
+    def _to_ratings(self, means: pd.Series) -> pd.Series:
+        ratings = np.array(self.RATINGS + [None], dtype=object)
+        codes = np.where(means.isna(), len(self.RATINGS), np.rint(means.fillna(1)) - 1).astype(int)
+        return pd.Series(ratings[codes], index=means.index)
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    catalogue = [
+        {'trigram': 'AAA', 'sonarQubeProjectIds': ['aaa-api', 'aaa-ui']},
+        {'trigram': 'BBB', 'sonarQubeProjectIds': ['bbb-core']}
+    ]
+
+    snapshots = [
+        {'sonar_project_id': 'aaa-api', 'branch': 'main', 'creation_date': '2025-06-01', 'maintainability_score': 'B',
+         'reliability_score': 'A', 'security_score': 'A', 'security_review_score': 'C', 'coverage': 0.70,
+         'number_of_lines': 12000},
+        {'sonar_project_id': 'aaa-api', 'branch': 'main', 'creation_date': '2025-08-01', 'maintainability_score': 'A',
+         'reliability_score': 'A', 'security_score': 'A', 'security_review_score': 'B', 'coverage': 0.82,
+         'number_of_lines': 12500},
+        {'sonar_project_id': 'aaa-ui', 'branch': 'main', 'creation_date': '2025-08-03', 'maintainability_score': 'C',
+         'reliability_score': 'B', 'security_score': 'UN', 'security_review_score': 'E', 'coverage': 0.40,
+         'number_of_lines': 4000},
+        {'sonar_project_id': 'bbb-core', 'branch': 'main', 'creation_date': '2025-07-21', 'maintainability_score': 'A',
+         'reliability_score': 'C', 'security_score': 'B', 'security_review_score': 'A', 'coverage': 0.95,
+         'number_of_lines': 30000}
+    ]
+
+    ingestor = StaticQualityIngestor()
+    ingestor.set_project_mapping(catalogue).set_data(snapshots)
+
+    print(ingestor.get_latest_snapshots())
+    print(ingestor.aggregate(branches=['main']))
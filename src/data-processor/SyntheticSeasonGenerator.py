@@ -0,0 +1,572 @@
+import json
+import string
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import List, Dict, Optional, Union, Any
+
+from MetricsWorkbookReader import MetricsWorkbookReader
+from MetricsAnswerDecoder import MetricsAnswerDecoder
+
+
+class SyntheticSeasonGenerator:
+    """
+    Seeded generator of realistic QSnap inputs at production scale, for load tests and benchmarks.
+
+    Every application gets a latent quality level (0 = poor, 1 = excellent) drifting from one season to the
+    next. It drives all the generated data, so the inputs stay consistent with each other: good applications
+    answer "Yes" more often, get better Sonar ratings and coverage, and fewer incidents. Generated inputs:
+        - applications and product catalogue items (valid against product-catalogue-schema.json)
+        - ProductExport.xlsx-like exports
+        - "Data collect" metrics workbooks, one per team or one per season, in the layout of a template workbook
+        - incident, release and Sonar snapshot tables (see doc/data-dictionary.md)
+
+    Each table draws from its own random stream spawned from the seed: the same seed gives the same data,
+    whatever the order in which the tables are generated. All draws are vectorized, millions of incidents
+    take a few seconds.
+
+    Usage:
+        generator = SyntheticSeasonGenerator(seed=7).set_scale(applications=3000, seasons=range(2016, 2026))
+        incidents = generator.get_incidents()
+        generator.write_metrics_workbooks('collect/2025', season=2025)
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    DEFAULT_APPLICATIONS = 200
+    DEFAULT_SEASONS = list(range(2021, 2026))
+
+    # Yearly volumes per application, for an average quality
+    INCIDENTS_PER_SEASON = 40
+    RELEASES_PER_SEASON = 12
+    SONAR_SNAPSHOTS_PER_SEASON = 4
+
+    # Organisation sizes
+    APPLICATIONS_PER_PLATFORM = 60
+    APPLICATIONS_PER_TEAM = 8
+
+    # Latent quality: initial distribution and season-to-season drift
+    QUALITY_BETA = (2.5, 2.0)
+    QUALITY_DRIFT = 0.08
+
+    # Season from September of the previous year to August
+    SEASON_START_MONTH = 9
+
+    # Share of Not Applicable / Unknown answers
+    NOT_APPLICABLE_RATE = 0.03
+    UNKNOWN_RATE = 0.02
+
+    PRIORITIES = ['Blocker', 'Critical', 'Major', 'Minor']
+    PRIORITY_WEIGHTS = [0.05, 0.15, 0.30, 0.50]
+    # Median hours to resolve, per priority
+    RESOLUTION_HOURS = [4.0, 12.0, 48.0, 120.0]
+    NOT_AN_INCIDENT_RATE = 0.02
+
+    RATINGS = ['A', 'B', 'C', 'D', 'E']
+    SONAR_BRANCHES = ['main', 'develop']
+    MAX_SONAR_PROJECTS = 3
+
+    # Product catalogue enums (see src/fetchers-interfaces/product-catalogue-schema.json)
+    CROWN_JEWELS_LEVELS = ['tier-1', 'tier-2', 'tier-3', 'n/a']
+    RTO_LEVELS = ['A0', 'A1', 'A2', 'A3']
+    MAKE_OR_BUY_CATEGORIES = ['make', 'buy', 'customise']
+
+    # Metrics workbook header answers (see MetricsAnswerDecoder.CATEGORIES)
+    WORKBOOK_MAKE_OR_BUY = {'make': 'M', 'buy': 'B', 'customise': 'BM'}
+
+    # Template of the "Data collect" layout
+    DEFAULT_TEMPLATE = Path(__file__).resolve().parents[2] / 'data' / '2025-metrics-v2.xlsx'
+    TEMPLATE_SEASON = 2025
+
+    MAX_APPLICATIONS = 26 ** 3
+
+    # Random streams, one per generated table
+    _STREAMS = ['applications', 'quality', 'incidents', 'releases', 'sonar', 'answers']
+
+    def __init__(self, seed: int = 0):
+        self._seed = seed
+        self._application_count: int = self.DEFAULT_APPLICATIONS
+        self._seasons: List[int] = list(self.DEFAULT_SEASONS)
+        self._incidents_per_season: float = self.INCIDENTS_PER_SEASON
+        self._applications: Optional[pd.DataFrame] = None
+        self._quality: Optional[np.ndarray] = None
+        self._template: Optional[Dict[str, Any]] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_scale(self, applications: int = DEFAULT_APPLICATIONS, seasons: Optional[Union[List[int], range]] = None,
+                  incidents_per_season: float = INCIDENTS_PER_SEASON) -> 'SyntheticSeasonGenerator':
+        """
+        Set the volume of the generated data.
+
+        Args:
+            applications: Number of applications
+            seasons: Seasons to generate, e.g. range(2016, 2026)
+            incidents_per_season: Average yearly incidents per application
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the scale is out of bounds
+        """
+        if not 1 <= applications <= self.MAX_APPLICATIONS:
+            raise ValueError(f"Applications must be between 1 and {self.MAX_APPLICATIONS} (unique trigrams)")
+        seasons = sorted(seasons) if seasons is not None else list(self.DEFAULT_SEASONS)
+        if not seasons:
+            raise ValueError("At least one season is needed")
+
+        self._application_count = applications
+        self._seasons = seasons
+        self._incidents_per_season = incidents_per_season
+        self._applications = None
+        self._quality = None
+        return self
+
+    def get_applications(self) -> pd.DataFrame:
+        """
+        Get the applications.
+
+        Returns:
+            DataFrame with trigram, eacode, name, platform, team, product manager/owner, criticality,
+            crown jewel level, flags and Sonar project ids
+        """
+        if self._applications is None:
+            self._applications = self._generate_applications()
+        return self._applications
+
+    def get_quality(self) -> pd.DataFrame:
+        """
+        Get the latent quality levels driving the generated data.
+
+        Returns:
+            DataFrame indexed by trigram with one column per season
+        """
+        return pd.DataFrame(self._get_quality(), index=self.get_applications()['trigram'], columns=self._seasons)
+
+    def get_catalogue(self) -> List[Dict[str, Any]]:
+        """
+        Get the product catalogue items.
+
+        Returns:
+            Items valid against product-catalogue-schema.json
+        """
+        applications = self.get_applications()
+        return [
+            {
+                'eacode': row.eacode,
+                'trigram': row.trigram,
+                'productName': row.name,
+                'productManager': row.product_manager,
+                'productOwner': row.product_owner,
+                'crownJewelsLevel': row.crown_jewels_level,
+                'rtoLevel': row.rto_level,
+                'provideEnterpriseServiceFlag': bool(row.enterprise_service),
+                'webExposureFlag': bool(row.web_exposure),
+                'makeOrBuyCategory': row.make_or_buy,
+                'flaggedToBeDeleted': bool(row.flagged_for_deletion),
+                'sonarQubeProjectIds': list(row.sonar_project_ids)
+            }
+            for row in applications.itertuples(index=False)
+        ]
+
+    def get_product_export(self) -> pd.DataFrame:
+        """
+        Get the catalogue as a ProductExport.xlsx sheet (see QSnapDataStore.PRODUCT_EXPORT_FIELDS).
+
+        Returns:
+            DataFrame with the export column names and YES/NO flags
+        """
+        applications = self.get_applications()
+        flags = {True: 'YES', False: 'NO'}
+        return pd.DataFrame({
+            'EA code': applications['eacode'],
+            'Name': applications['name'],
+            'Trigram': applications['trigram'],
+            'Status': np.where(applications['flagged_for_deletion'], 'Decommissioning', 'AnnualReview'),
+            'Product Manager': applications['product_manager'],
+            'Business Owner': applications['product_owner'],
+            'Criticality': applications['rto_level'],
+            'Crown Jewel': applications['crown_jewels_level'],
+            'Jira Project Link': 'https://jira.example.com/projects/' + applications['trigram'],
+            'Make-or-Buy Decision': applications['make_or_buy'].str.capitalize(),
+            'External Exposure': applications['web_exposure'].map(flags),
+            'Enterprise Service': applications['enterprise_service'].map(flags)
+        })
+
+    def get_incidents(self) -> pd.DataFrame:
+        """
+        Get the incidents of all the seasons.
+
+        Returns:
+            DataFrame in the Incident entity columns, 'faulty_application' holding the trigram
+        """
+        rng = self._get_stream('incidents')
+        quality = self._get_quality()
+        base_rates = rng.gamma(2.0, self._incidents_per_season / 2.0, size=(len(quality), 1))
+        # Poor quality up to 1.6x the average volume, excellent quality down to 0.4x
+        counts = rng.poisson(base_rates * (1.6 - 1.2 * quality))
+
+        applications, seasons = self._repeat_cells(counts)
+        total = len(applications)
+        created = self._draw_dates(rng, seasons, total)
+
+        priority_codes = rng.choice(len(self.PRIORITIES), size=total, p=self.PRIORITY_WEIGHTS)
+        hours = rng.lognormal(np.log(np.asarray(self.RESOLUTION_HOURS)[priority_codes]), 0.8)
+        trigrams = self.get_applications()['trigram'].to_numpy()
+
+        return pd.DataFrame({
+            'jira_id': np.char.add('INC-', np.arange(1, total + 1).astype(str)),
+            'incident_creation_date': created,
+            'resolution_date': created + pd.to_timedelta(hours.round(2), unit='h'),
+            'priority': pd.Categorical.from_codes(priority_codes, self.PRIORITIES),
+            'resolution_category': pd.Categorical.from_codes(
+                rng.choice(3, size=total, p=[0.6, 0.3, 0.1]), ['Fixed', 'Workaround', 'Duplicate']
+            ),
+            'financial_impact': np.where(rng.random(total) < 0.01, rng.lognormal(9.0, 1.0, total).round(), 0),
+            'faulty_application': pd.Categorical(trigrams[applications], categories=trigrams),
+            'flagged_as_not_an_incident': rng.random(total) < self.NOT_AN_INCIDENT_RATE
+        }).sort_values('incident_creation_date', kind='stable', ignore_index=True)
+
+    def get_releases(self) -> pd.DataFrame:
+        """
+        Get the releases of all the seasons.
+
+        Returns:
+            DataFrame in the Release entity columns, 'application_id' holding the trigram
+        """
+        rng = self._get_stream('releases')
+        quality = self._get_quality()
+        # Better teams release more often
+        counts = rng.poisson(self.RELEASES_PER_SEASON * (0.5 + quality))
+
+        applications, seasons = self._repeat_cells(counts)
+        releases = pd.DataFrame({
+            'application_id': self.get_applications()['trigram'].to_numpy()[applications],
+            'release_date': self._draw_dates(rng, seasons, len(applications)),
+            'season': seasons
+        }).sort_values(['application_id', 'release_date'], kind='stable', ignore_index=True)
+
+        # Versions: major = season, minor = rank of the release within the season
+        minor = releases.groupby(['application_id', 'season']).cumcount() + 1
+        releases['version_number'] = (releases['season'] - 2000).astype(str) + '.' + minor.astype(str) + '.0'
+        releases['change_request_id'] = np.char.add('CR-', rng.integers(10000, 99999, len(releases)).astype(str))
+        releases.insert(0, 'release_id', np.arange(1, len(releases) + 1))
+        return releases.drop(columns='season')
+
+    def get_sonar_snapshots(self) -> pd.DataFrame:
+        """
+        Get the Sonar snapshots of every project and branch, SONAR_SNAPSHOTS_PER_SEASON per season.
+
+        Returns:
+            DataFrame in the StaticQualityIngestor snapshot columns
+        """
+        rng = self._get_stream('sonar')
+        applications = self.get_applications()
+        projects = applications[['trigram', 'sonar_project_ids']].explode('sonar_project_ids')
+        project_apps = applications.index.get_indexer(projects.index)
+        project_ids = projects['sonar_project_ids'].to_numpy()
+        lines = rng.lognormal(9.5, 1.0, len(project_ids)).round()
+
+        snapshots = self.SONAR_SNAPSHOTS_PER_SEASON
+        n_branches, n_seasons = len(self.SONAR_BRANCHES), len(self._seasons)
+        # One row per project, branch, season and snapshot
+        shape = (len(project_ids), n_branches, n_seasons, snapshots)
+        project, branch, season, snapshot = (index.ravel() for index in np.indices(shape))
+
+        quality = self._get_quality()[project_apps[project], season]
+        quality = np.clip(quality + rng.normal(0, 0.05, len(project)), 0, 1)
+        rating_codes = np.clip(np.round((1 - quality[:, None]) * 4 + rng.normal(0, 0.7, (len(project), 4))), 0, 4)
+
+        season_starts = np.array([self._get_season_start(s) for s in self._seasons], dtype='datetime64[D]')
+        dates = season_starts[season] + (snapshot * 365 // snapshots + rng.integers(0, 20, len(project)))
+
+        ratings = np.asarray(self.RATINGS)[rating_codes.astype(int)]
+        return pd.DataFrame({
+            'sonar_project_id': project_ids[project],
+            'branch': np.asarray(self.SONAR_BRANCHES)[branch],
+            'creation_date': pd.to_datetime(dates),
+            'maintainability_score': ratings[:, 0],
+            'reliability_score': ratings[:, 1],
+            'security_score': ratings[:, 2],
+            'security_review_score': ratings[:, 3],
+            'coverage': np.clip(quality * 0.9 + rng.normal(0, 0.1, len(project)), 0, 1).round(3),
+            'number_of_lines': (lines[project] * (1 + 0.05 * season)).round().astype(int)
+        })
+
+    def write_catalogue(self, path: Union[str, Path]) -> Path:
+        """
+        Write the product catalogue as a JSON array.
+
+        Args:
+            path: Output file (.json)
+
+        Returns:
+            The written path
+        """
+        path = Path(path)
+        path.write_text(json.dumps(self.get_catalogue(), indent=2), encoding='utf-8')
+        return path
+
+    def write_product_export(self, path: Union[str, Path]) -> Path:
+        """
+        Write the catalogue as a ProductExport.xlsx workbook.
+
+        Args:
+            path: Output file (.xlsx)
+
+        Returns:
+            The written path
+        """
+        path = Path(path)
+        self.get_product_export().to_excel(path, index=False)
+        return path
+
+    def write_metrics_workbooks(self, directory: Union[str, Path], season: int, per_team: bool = True,
+                                template: Union[str, Path] = DEFAULT_TEMPLATE) -> List[Path]:
+        """
+        Write the "Data collect" workbooks of a season, filled with generated answers.
+
+        Args:
+            directory: Output directory
+            season: Season of the answers, one of the generated seasons
+            per_team: True writes one workbook per team, False a single workbook with all the applications
+            template: Workbook giving the questionnaire layout
+
+        Returns:
+            The written paths
+
+        Raises:
+            ValueError: If the season is not generated or a template question has no known answer type
+        """
+        if season not in self._seasons:
+            raise ValueError(f"Season {season} is not generated. Generated seasons: {self._seasons}")
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        applications = self.get_applications()
+        answers = self._generate_answers(season, template)
+
+        if per_team:
+            groups = applications.groupby('team', sort=False).indices
+        else:
+            groups = {'all': np.arange(len(applications))}
+        paths = []
+        for team, rows in groups.items():
+            path = directory / f"{season}-metrics-{self._slug(team)}.xlsx"
+            self._build_sheet(season, applications.iloc[rows], answers[:, rows]).to_excel(
+                path, sheet_name=MetricsWorkbookReader.SHEET_NAME, header=False, index=False
+            )
+            paths.append(path)
+        return paths
+
+    # ========== GENERATION METHODS ==========
+
+    def _generate_applications(self) -> pd.DataFrame:
+        rng = self._get_stream('applications')
+        count = self._application_count
+
+        codes = rng.choice(self.MAX_APPLICATIONS, size=count, replace=False)
+        letters = np.asarray(list(string.ascii_uppercase))
+        trigrams = np.char.add(np.char.add(letters[codes // 676], letters[codes // 26 % 26]), letters[codes % 26])
+
+        platforms = np.arange(count) * max(1, count // self.APPLICATIONS_PER_PLATFORM) // count + 1
+        teams = np.arange(count) // self.APPLICATIONS_PER_TEAM + 1
+        people = np.char.add('Person ', rng.integers(1, max(2, count // 3), size=(count, 2)).astype(str))
+        project_counts = rng.integers(1, self.MAX_SONAR_PROJECTS + 1, count)
+
+        return pd.DataFrame({
+            'trigram': trigrams,
+            'eacode': np.char.add('EA-', np.char.zfill(rng.choice(100000, count, replace=False).astype(str), 5)),
+            'name': np.char.add('Product ', trigrams),
+            'platform': np.char.add('Platform ', platforms.astype(str)),
+            'platform_head': np.char.add('Platform head ', platforms.astype(str)),
+            'team': np.char.add('Team ', teams.astype(str)),
+            'team_head': np.char.add('Team head ', teams.astype(str)),
+            'product_manager': people[:, 0],
+            'product_owner': people[:, 1],
+            'rto_level': rng.choice(self.RTO_LEVELS, count, p=[0.1, 0.2, 0.4, 0.3]),
+            'crown_jewels_level': rng.choice(self.CROWN_JEWELS_LEVELS, count, p=[0.1, 0.15, 0.25, 0.5]),
+            'enterprise_service': rng.random(count) < 0.3,
+            'web_exposure': rng.random(count) < 0.2,
+            'make_or_buy': rng.choice(self.MAKE_OR_BUY_CATEGORIES, count, p=[0.6, 0.25, 0.15]),
+            'flagged_for_deletion': rng.random(count) < 0.03,
+            'sonar_project_ids': [
+                [f"{trigram.lower()}-{index}" for index in range(projects)]
+                for trigram, projects in zip(trigrams, project_counts)
+            ]
+        })
+
+    def _get_quality(self) -> np.ndarray:
+        """Latent quality per application (rows) and season (columns): a bounded random walk"""
+        if self._quality is None:
+            rng = self._get_stream('quality')
+            count = len(self.get_applications())
+            steps = rng.normal(0, self.QUALITY_DRIFT, size=(count, len(self._seasons)))
+            steps[:, 0] = 0
+            start = rng.beta(*self.QUALITY_BETA, size=(count, 1))
+            self._quality = np.clip(start + np.cumsum(steps, axis=1), 0.02, 0.98)
+        return self._quality
+
+    def _generate_answers(self, season: int, template: Union[str, Path]) -> np.ndarray:
+        """Answers of every questionnaire row (rows) and application (columns) of the season"""
+        layout = self._get_template(template)['layout']
+        rng = np.random.default_rng([self._seed, self._STREAMS.index('answers'), season])
+        quality = self._get_quality()[:, self._seasons.index(season)]
+        count = len(quality)
+
+        answers = np.full((len(layout), count), None, dtype=object)
+        for index, (answer_type, has_details) in enumerate(zip(layout['answer_type'], layout['has_details'])):
+            if has_details:
+                continue
+            values = self._draw_answers(rng, answer_type, quality).astype(object)
+            special = rng.random(count)
+            values[special < self.NOT_APPLICABLE_RATE + self.UNKNOWN_RATE] = MetricsAnswerDecoder.UNKNOWN
+            values[special < self.NOT_APPLICABLE_RATE] = MetricsAnswerDecoder.NOT_APPLICABLE
+            answers[index] = values
+        return answers
+
+    def _draw_answers(self, rng: np.random.Generator, answer_type: str, quality: np.ndarray) -> np.ndarray:
+        count = len(quality)
+        noise = rng.normal(0, 1, count)
+        if answer_type == 'yes_no':
+            return np.where(rng.random(count) < quality, 'Yes', 'No')
+        if answer_type == 'rating':
+            return np.asarray(self.RATINGS)[np.clip(np.round((1 - quality) * 4 + 0.7 * noise), 0, 4).astype(int)]
+        if answer_type == 'score':
+            return np.clip(np.round(1 + 9 * quality + noise), 1, 10)
+        if answer_type == 'percent':
+            return np.clip(quality + 0.15 * noise, 0, 1).round(2)
+        if answer_type == 'count':
+            return rng.poisson(3.0 * (1.6 - 1.2 * quality)).astype(float)
+        if answer_type == 'duration':
+            return rng.lognormal(np.log(24.0 * (1.6 - 1.2 * quality)), 0.5).round(1)
+        if answer_type == 'amount':
+            return np.where(rng.random(count) < 0.1, rng.lognormal(9.0, 1.0, count).round(), 0.0)
+        raise ValueError(f"Unknown answer type '{answer_type}'")
+
+    # ========== WORKBOOK METHODS ==========
+
+    def _get_template(self, template: Union[str, Path]) -> Dict[str, Any]:
+        """Layout columns of the template sheet and the answer type of every questionnaire row"""
+        if self._template is None or self._template['path'] != Path(template):
+            reader = MetricsWorkbookReader().read(template)
+            sheet = pd.read_excel(template, sheet_name=MetricsWorkbookReader.SHEET_NAME, header=None)
+            labels = sheet[MetricsWorkbookReader.LABEL_COLUMN].astype('string').str.strip()
+            questions = reader.get_questions()
+
+            answer_types = pd.Series([
+                MetricsAnswerDecoder.QUESTION_FIELDS.get((section, question), (None, None))[1]
+                for section, question in zip(questions['section'], questions['question'])
+            ], index=questions.index)
+            if answer_types.isna().any():
+                unknown = questions.loc[answer_types.isna(), 'question'].unique().tolist()
+                raise ValueError(f"Template questions without answer type in MetricsAnswerDecoder: {unknown}")
+
+            detailed = questions.groupby(['section', 'question'])['detail'].transform(lambda d: d.notna().any())
+            self._template = {
+                'path': Path(template),
+                'layout_columns': sheet.iloc[:, :MetricsWorkbookReader.FIRST_APPLICATION_COLUMN],
+                'header_rows': {
+                    field: int(sheet.index[labels == label][0])
+                    for label, field in MetricsWorkbookReader.HEADER_FIELDS.items()
+                },
+                'layout': pd.DataFrame({
+                    'row': questions['row'].to_numpy(),
+                    'answer_type': answer_types.to_numpy(),
+                    # Questions detailed per month or sub-metric only hold answers on their detail rows
+                    'has_details': (detailed & questions['detail'].isna()).to_numpy()
+                })
+            }
+        return self._template
+
+    def _build_sheet(self, season: int, applications: pd.DataFrame, answers: np.ndarray) -> pd.DataFrame:
+        template = self._template
+        sheet = template['layout_columns'].copy()
+        sheet.iat[0, MetricsWorkbookReader.GROUP_COLUMN] = (
+            f"Quality Snapshot {season}\n01-09-{season - 1} - 31-08-{season}"
+        )
+
+        # Month details of the template season moved to the generated one
+        offset = pd.DateOffset(years=season - self.TEMPLATE_SEASON)
+        sheet[MetricsWorkbookReader.QUESTION_COLUMN] = sheet[MetricsWorkbookReader.QUESTION_COLUMN].map(
+            lambda cell: cell + offset if isinstance(cell, datetime) else cell
+        )
+
+        values = np.full((len(sheet), len(applications)), None, dtype=object)
+        values[template['layout']['row'].to_numpy()] = answers
+        header = {
+            'platform': applications['platform'],
+            'platform_head': applications['platform_head'],
+            'quality_champion': 'Champion ' + applications['platform'].str.split().str[-1],
+            'team': applications['team'],
+            'team_head': applications['team_head'],
+            'trigram': applications['trigram'],
+            'criticality': applications['rto_level'],
+            'crown_jewel': np.where(applications['crown_jewels_level'] == 'n/a', 'No', 'Yes'),
+            'enterprise_service': np.where(applications['enterprise_service'], 'Yes', 'No'),
+            'make_or_buy': applications['make_or_buy'].map(self.WORKBOOK_MAKE_OR_BUY)
+        }
+        for field, row in template['header_rows'].items():
+            values[row] = np.asarray(header[field], dtype=object)
+
+        application_columns = pd.DataFrame(
+            values, columns=range(MetricsWorkbookReader.FIRST_APPLICATION_COLUMN,
+                                  MetricsWorkbookReader.FIRST_APPLICATION_COLUMN + len(applications))
+        )
+        end_marker = pd.Series(MetricsWorkbookReader.COLUMN_END_MARKER, index=sheet.index,
+                               name=application_columns.columns[-1] + 1)
+        return pd.concat([sheet, application_columns, end_marker], axis=1)
+
+    # ========== HELPER METHODS ==========
+
+    def _get_stream(self, name: str) -> np.random.Generator:
+        """Independent random stream per table, so that tables do not depend on the generation order"""
+        return np.random.default_rng([self._seed, self._STREAMS.index(name)])
+
+    def _repeat_cells(self, counts: np.ndarray) -> tuple:
+        """Application and season index of every event, from per (application, season) event counts"""
+        cells = np.repeat(np.arange(counts.size), counts.ravel())
+        applications, seasons = np.divmod(cells, counts.shape[1])
+        return applications, np.asarray(self._seasons)[seasons]
+
+    def _draw_dates(self, rng: np.random.Generator, seasons: np.ndarray, count: int) -> pd.Series:
+        starts = pd.to_datetime([self._get_season_start(season) for season in self._seasons])
+        start_of = dict(zip(self._seasons, starts.to_numpy()))
+        season_starts = pd.Series(seasons).map(start_of).to_numpy()
+        seconds = rng.integers(0, 365 * 24 * 3600, count)
+        return pd.Series(season_starts + seconds.astype('timedelta64[s]'))
+
+    def _get_season_start(self, season: int) -> str:
+        return f"{season - 1}-{self.SEASON_START_MONTH:02d}-01"
+
+    @staticmethod
+    def _slug(value: str) -> str:
+        return '-'.join(str(value).lower().split())
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import time
+    import tempfile
+    from SchemaRuleChecker import SchemaRuleChecker
+    from MetricsWorkbookIngestor import MetricsWorkbookIngestor
+
+    generator = SyntheticSeasonGenerator(seed=7).set_scale(applications=3000, seasons=range(2016, 2026))
+
+    start = time.perf_counter()
+    incidents = generator.get_incidents()
+    print(f"{len(incidents):,} incidents in {time.perf_counter() - start:.1f}s")
+    print(f"{len(generator.get_releases()):,} releases, {len(generator.get_sonar_snapshots()):,} Sonar snapshots")
+
+    checker = SchemaRuleChecker().load_schema('../fetchers-interfaces/product-catalogue-schema.json')
+    print(f"Catalogue valid: {checker.check(generator.get_catalogue()).is_valid()}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        small = SyntheticSeasonGenerator(seed=7).set_scale(applications=120)
+        paths = small.write_metrics_workbooks(directory, season=2025)
+        ingestor = MetricsWorkbookIngestor().add_files(*paths).ingest()
+        print(f"{len(paths)} team workbooks: {ingestor.get_summary()}")
@@ -0,0 +1,211 @@
+import json
+import time
+import random
+import hashlib
+import threading
+from email import message_from_bytes
+from email.policy import HTTP
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote
+from typing import Dict, Optional, Tuple
+
+
+class MockWikiServer:
+    """
+    Local stand-in of the wiki REST API, for tests and throughput benchmarks of WikiPublisher.
+
+    Pages and attachments are kept in memory. Latency and transient failures (503 with Retry-After) can be
+    injected to exercise the publisher retries. HTTP/1.1 keep-alive is supported, so connection reuse shows
+    in get_stats().
+
+    API:
+        GET  /api/hashes                          -> {"pages": {path: sha256}, "attachments": {path/name: sha256}}
+                                                     (page hash: title, new line, body)
+        PUT  /api/pages/<path>                    JSON {"title": ..., "body": ...}
+        POST /api/pages/<path>/attachments        multipart/form-data, one part per file
+
+    Usage:
+        server = MockWikiServer(port=0).start()
+        publisher = WikiPublisher(server.get_url())
+        ...
+        server.stop()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PORT = 8765
+
+    API_PREFIX = '/api'
+    ATTACHMENTS_SUFFIX = '/attachments'
+
+    RETRY_AFTER_SECONDS = 0.05
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, latency: float = 0.0,
+                 failure_rate: float = 0.0, seed: int = 0):
+        self._host = host
+        self._port = port
+        self._latency = latency
+        self._failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pages: Dict[str, Dict[str, str]] = {}
+        self._attachments: Dict[str, bytes] = {}
+        self._hashes: Dict[str, Dict[str, str]] = {'pages': {}, 'attachments': {}}
+        self._stats = {'requests': 0, 'connections': 0, 'failures': 0, 'pages': 0, 'attachments': 0}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ========== PUBLIC API ==========
+
+    def start(self) -> 'MockWikiServer':
+        """
+        Serve in a background thread.
+
+        Returns:
+            Self for method chaining
+        """
+        self._server = ThreadingHTTPServer((self._host, self._port), self._create_handler())
+        self._server.daemon_threads = True
+        self._port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def get_url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def get_page(self, path: str) -> Optional[Dict[str, str]]:
+        return self._pages.get(path)
+
+    def get_attachment(self, page: str, name: str) -> Optional[bytes]:
+        return self._attachments.get(f"{page}/{name}")
+
+    # ========== REQUEST HANDLING ==========
+
+    def _create_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self) -> None:
+                super().setup()
+                server._count('connections')
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._handle(server._get)
+
+            def do_PUT(self) -> None:
+                self._handle(server._put_page)
+
+            def do_POST(self) -> None:
+                self._handle(server._post_attachments)
+
+            def _handle(self, action) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length) if length else b''
+                status, payload, headers = server._dispatch(action, unquote(self.path), self.headers, body)
+                content = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+    def _dispatch(self, action, path: str, headers, body: bytes) -> Tuple[int, Dict, Dict[str, str]]:
+        self._count('requests')
+        if self._latency:
+            time.sleep(self._latency)
+
+        with self._lock:
+            failing = self._random.random() < self._failure_rate
+        if failing:
+            self._count('failures')
+            return 503, {'error': 'Service unavailable'}, {'Retry-After': str(self.RETRY_AFTER_SECONDS)}
+
+        if not path.startswith(self.API_PREFIX):
+            return 404, {'error': f"Unknown path '{path}'"}, {}
+        try:
+            return action(path[len(self.API_PREFIX):], headers, body)
+        except (ValueError, KeyError) as error:
+            return 400, {'error': str(error)}, {}
+
+    def _get(self, path: str, headers, body: bytes) -> Tuple[int, Dict, Dict[str, str]]:
+        if path != '/hashes':
+            return 404, {'error': f"Unknown path '{path}'"}, {}
+        with self._lock:
+            return 200, {kind: dict(hashes) for kind, hashes in self._hashes.items()}, {}
+
+    def _put_page(self, path: str, headers, body: bytes) -> Tuple[int, Dict, Dict[str, str]]:
+        page = self._get_page_path(path)
+        content = json.loads(body)
+        with self._lock:
+            self._pages[page] = {'title': content['title'], 'body': content['body']}
+            page_content = f"{content['title']}\n{content['body']}".encode('utf-8')
+            self._hashes['pages'][page] = hashlib.sha256(page_content).hexdigest()
+            self._stats['pages'] += 1
+        return 200, {'page': page}, {}
+
+    def _post_attachments(self, path: str, headers, body: bytes) -> Tuple[int, Dict, Dict[str, str]]:
+        if not path.endswith(self.ATTACHMENTS_SUFFIX):
+            return 404, {'error': f"Unknown path '{path}'"}, {}
+        page = self._get_page_path(path[:-len(self.ATTACHMENTS_SUFFIX)])
+
+        message = message_from_bytes(
+            f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode('utf-8') + body, policy=HTTP
+        )
+        if not message.is_multipart():
+            raise ValueError("Attachments must be sent as multipart/form-data")
+
+        stored = []
+        with self._lock:
+            for part in message.iter_parts():
+                name = part.get_filename()
+                data = part.get_payload(decode=True)
+                self._attachments[f"{page}/{name}"] = data
+                self._hashes['attachments'][f"{page}/{name}"] = hashlib.sha256(data).hexdigest()
+                stored.append(name)
+            self._stats['attachments'] += len(stored)
+        return 200, {'page': page, 'stored': stored}, {}
+
+    @staticmethod
+    def _get_page_path(path: str) -> str:
+        prefix = '/pages/'
+        if not path.startswith(prefix) or len(path) == len(prefix):
+            raise ValueError(f"Invalid page path '{path}'")
+        return path[len(prefix):]
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    server = MockWikiServer(latency=0.01, failure_rate=0.05).start()
+    print(f"Mock wiki listening on {server.get_url()} - Ctrl+C to stop")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,337 @@
+import json
+import time
+import queue
+import threading
+import random
+import hashlib
+import http.client
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, quote
+from typing import Optional, Dict, List, Tuple, Any
+
+
+class ConnectionPool:
+    """Fixed-size pool of persistent HTTP(S) connections to one host"""
+
+    def __init__(self, url: str, size: int, timeout: float):
+        parts = urlsplit(url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self._base_path = parts.path.rstrip('/')
+        self._connections: queue.Queue = queue.Queue()
+        for _ in range(size):
+            self._connections.put(connection_class(parts.hostname, parts.port, timeout=timeout))
+
+    def request(self, method: str, path: str, body: bytes = b'',
+                headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send one request on a pooled connection; blocks while every connection is busy.
+
+        Returns:
+            (status, headers, body)
+        """
+        connection = self._connections.get()
+        try:
+            connection.request(method, self._base_path + path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        except (OSError, http.client.HTTPException):
+            # Broken keep-alive connection: the next request on it reconnects
+            connection.close()
+            raise
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        while not self._connections.empty():
+            self._connections.get().close()
+
+
+class WikiPublisher:
+    """
+    Publisher of the report pages and chart images to the wiki tree (see doc/wiki-structure.md).
+
+    Requests go through a pool of persistent connections, at most 'max_connections' at a time. Attachments are
+    uploaded per page in multipart batches. Transient failures (connection errors, 429, 5xx) of idempotent requests
+    are retried with exponential backoff and jitter, honouring Retry-After. Attachment uploads (POST) are only
+    retried when the server tells it did not apply them (429/503 with Retry-After); after a connection error, the
+    remote hashes are read again and only the attachments the wiki lacks are sent again. Before uploading, the
+    remote content hashes are fetched once, and pages (title and body) or attachments whose SHA-256 did not change
+    are skipped.
+
+    Usage:
+        publisher = WikiPublisher('https://wiki.example.com', token='...')
+        publisher.add_page('QSnap - Season 2025/Department', 'Department', html)
+        publisher.add_attachment('QSnap - Season 2025/Department', 'radar.png', png_bytes)
+        stats = publisher.publish()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    DEFAULT_MAX_CONNECTIONS = 4
+    DEFAULT_TIMEOUT = 30.0
+
+    # Attachment batches: whichever limit comes first
+    ATTACHMENT_BATCH_SIZE = 20
+    ATTACHMENT_BATCH_BYTES = 10 * 1024 * 1024
+
+    # Retries
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 0.2  # seconds, doubled at every retry
+    BACKOFF_MAX = 10.0
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    IDEMPOTENT_METHODS = {'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'}
+    # Statuses of requests the server did not apply, when sent with a Retry-After header
+    NOT_APPLIED_STATUSES = {429, 503}
+
+    # Wiki API
+    HASHES_PATH = '/api/hashes'
+    PAGE_PATH = '/api/pages/{page}'
+    ATTACHMENTS_PATH = '/api/pages/{page}/attachments'
+
+    def __init__(self, url: str, token: Optional[str] = None, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: float = DEFAULT_TIMEOUT):
+        if max_connections < 1:
+            raise ValueError("At least one connection is needed")
+
+        self._pool = ConnectionPool(url, max_connections, timeout)
+        self._max_connections = max_connections
+        self._headers = {'Authorization': f"Bearer {token}"} if token else {}
+        self._pages: Dict[str, Dict[str, str]] = {}
+        self._attachments: Dict[str, Dict[str, bytes]] = {}
+        self._stats = self._new_stats()
+        self._stats_lock = threading.Lock()
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def add_page(self, path: str, title: str, body: str) -> 'WikiPublisher':
+        """
+        Queue a page.
+
+        Args:
+            path: Page path in the wiki tree, e.g. 'QSnap - Season 2025/Department'
+            title: Page title
+            body: Page content
+
+        Returns:
+            Self for method chaining
+        """
+        self._pages[path] = {'title': title, 'body': body}
+        return self
+
+    def add_attachment(self, page: str, name: str, data: bytes) -> 'WikiPublisher':
+        """
+        Queue an attachment of a page.
+
+        Args:
+            page: Page path
+            name: File name, e.g. 'department_radar.png'
+            data: File content
+
+        Returns:
+            Self for method chaining
+        """
+        self._attachments.setdefault(page, {})[name] = data
+        return self
+
+    def publish(self) -> Dict[str, int]:
+        """
+        Upload the queued pages, then their attachments, skipping unchanged content.
+
+        Returns:
+            Statistics: uploaded/skipped pages and attachments, failed requests, sent requests and retries
+
+        Raises:
+            RuntimeError: If the remote hashes cannot be read
+        """
+        self._stats = self._new_stats()
+        remote = self._get_remote_hashes()
+
+        page_jobs = [
+            (path, page) for path, page in self._pages.items()
+            if remote['pages'].get(path) != self.hash_page(page['title'], page['body'])
+        ]
+        self._count('skipped_pages', len(self._pages) - len(page_jobs))
+
+        batches = []
+        for page, files in self._attachments.items():
+            changed = {
+                name: data for name, data in files.items()
+                if remote['attachments'].get(f"{page}/{name}") != self._hash(data)
+            }
+            self._count('skipped_attachments', len(files) - len(changed))
+            batches.extend((page, batch) for batch in self._split_batches(changed))
+
+        # Pages first: attachments need their page
+        self._run([lambda job=job: self._upload_page(*job) for job in page_jobs])
+        self._run([lambda batch=batch: self._upload_attachments(*batch) for batch in batches])
+
+        self._pages.clear()
+        self._attachments.clear()
+        return dict(self._stats)
+
+    def close(self) -> None:
+        self._pool.close()
+
+    # ========== UPLOAD METHODS ==========
+
+    def _get_remote_hashes(self) -> Dict[str, Dict[str, str]]:
+        status, _, body = self._request('GET', self.HASHES_PATH)
+        if status != 200:
+            raise RuntimeError(f"Cannot read the remote content hashes (HTTP {status})")
+        return json.loads(body)
+
+    def _upload_page(self, path: str, page: Dict[str, str]) -> None:
+        body = json.dumps(page).encode('utf-8')
+        status, _, _ = self._request('PUT', self.PAGE_PATH.format(page=quote(path)), body,
+                                     {'Content-Type': 'application/json'})
+        self._count('uploaded_pages' if status < 300 else 'failed')
+
+    def _upload_attachments(self, page: str, files: Dict[str, bytes]) -> None:
+        for attempt in range(self.MAX_RETRIES + 1):
+            body, content_type = self._encode_multipart(files)
+            try:
+                status, _, _ = self._request('POST', self.ATTACHMENTS_PATH.format(page=quote(page)), body,
+                                             {'Content-Type': content_type})
+            except (OSError, http.client.HTTPException):
+                if attempt == self.MAX_RETRIES:
+                    raise
+                # The wiki may have stored the upload before the connection broke: only send what it lacks
+                remote = self._get_remote_hashes()['attachments']
+                stored = [name for name, data in files.items() if remote.get(f"{page}/{name}") == self._hash(data)]
+                self._count('uploaded_attachments', len(stored))
+                files = {name: data for name, data in files.items() if name not in stored}
+                if not files:
+                    return
+                self._count('retries')
+                time.sleep(self._get_backoff(attempt, None))
+                continue
+
+            if status < 300:
+                self._count('uploaded_attachments', len(files))
+            else:
+                self._count('failed')
+            return
+
+    def _run(self, jobs: List[Any]) -> None:
+        """Run the jobs with at most max_connections in flight"""
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=self._max_connections) as executor:
+            for future in as_completed([executor.submit(job) for job in jobs]):
+                future.result()
+
+    def _request(self, method: str, path: str, body: bytes = b'',
+                 headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send a request, retrying transient failures with exponential backoff.
+
+        Non-idempotent requests are only retried on the statuses telling they were not applied: a connection
+        error may come after the server applied them, so it is raised.
+        """
+        headers = {**self._headers, **(headers or {})}
+        idempotent = method in self.IDEMPOTENT_METHODS
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._count('requests')
+            try:
+                status, response_headers, response_body = self._pool.request(method, path, body, headers)
+            except (OSError, http.client.HTTPException):
+                if attempt == self.MAX_RETRIES or not idempotent:
+                    raise
+                retry_after = None
+            else:
+                retry_after = response_headers.get('Retry-After')
+                if idempotent:
+                    retrying = status in self.RETRY_STATUSES
+                else:
+                    retrying = status in self.NOT_APPLIED_STATUSES and retry_after is not None
+                if not retrying or attempt == self.MAX_RETRIES:
+                    return status, response_headers, response_body
+
+            self._count('retries')
+            time.sleep(self._get_backoff(attempt, retry_after))
+
+    def _get_backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.BACKOFF_MAX)
+            except ValueError:
+                pass
+        # Full jitter, so that throttled workers do not retry all at once
+        return random.uniform(0, min(self.BACKOFF_BASE * 2 ** attempt, self.BACKOFF_MAX))
+
+    # ========== HELPER METHODS ==========
+
+    def _split_batches(self, files: Dict[str, bytes]) -> List[Dict[str, bytes]]:
+        batches, batch, batch_bytes = [], {}, 0
+        for name, data in files.items():
+            if batch and (len(batch) == self.ATTACHMENT_BATCH_SIZE
+                          or batch_bytes + len(data) > self.ATTACHMENT_BATCH_BYTES):
+                batches.append(batch)
+                batch, batch_bytes = {}, 0
+            batch[name] = data
+            batch_bytes += len(data)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _encode_multipart(files: Dict[str, bytes]) -> Tuple[bytes, str]:
+        boundary = uuid.uuid4().hex
+        parts = []
+        for name, data in files.items():
+            parts.append(
+                f"--{boundary}\r\n"
+                f"Content-Disposition: form-data; name=\"file\"; filename=\"{name}\"\r\n"
+                f"Content-Type: application/octet-stream\r\n\r\n".encode('utf-8') + data + b"\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n".encode('utf-8'))
+        return b''.join(parts), f"multipart/form-data; boundary={boundary}"
+
+    @classmethod
+    def hash_page(cls, title: str, body: str) -> str:
+        """Content hash of a page, as reported by the wiki: the title and the body, separated by a new line"""
+        return cls._hash(f"{title}\n{body}".encode('utf-8'))
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _count(self, stat: str, value: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[stat] += value
+
+    @staticmethod
+    def _new_stats() -> Dict[str, int]:
+        return {'uploaded_pages': 0, 'skipped_pages': 0, 'uploaded_attachments': 0, 'skipped_attachments': 0,
+                'failed': 0, 'requests': 0, 'retries': 0}
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    from MockWikiServer import MockWikiServer
+
+    server = MockWikiServer(port=0, latency=0.005, failure_rate=0.2).start()
+    publisher = WikiPublisher(server.get_url(), max_connections=8)
+
+    def queue_season(publisher: WikiPublisher, changed_chart: Optional[int] = None) -> None:
+        for platform in range(1, 6):
+            page = f"QSnap - Season 2025/Platform {platform}"
+            publisher.add_page(page, f"Platform {platform}", f"<h1>Platform {platform}</h1>")
+            for chart in range(40):
+                image = f"{platform}-{chart}-{'v2' if chart == changed_chart else 'v1'}".encode() * 5000
+                publisher.add_attachment(page, f"chart_{chart:02d}.png", image)
+
+    start = time.perf_counter()
+    queue_season(publisher)
+    print(publisher.publish(), f"{time.perf_counter() - start:.2f}s")
+
+    # Second run: only the changed chart is uploaded again
+    queue_season(publisher, changed_chart=7)
+    print(publisher.publish())
+    print(server.get_stats())
+
+    publisher.close()
+    server.stop()
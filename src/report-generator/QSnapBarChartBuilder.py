@@ -215,6 +215,29 @@ class QSnapBarChartBuilder:
             format="png"
         )
 
+    def to_image(self, image_format: str = "png") -> bytes:
+        """
+        Encode the chart in memory, with the same size as export_to_png().
+
+        Args:
+            image_format: Image format supported by Plotly (png, svg, jpeg, webp, pdf)
+
+        Returns:
+            Encoded image
+
+        Raises:
+            ValueError: If chart hasn't been built yet
+        """
+        if self._figure is None:
+            raise ValueError("Chart must be built before exporting. Call build() first.")
+
+        return self._figure.to_image(
+            format=image_format,
+            width=self._image_width,
+            height=self._image_height,
+            scale=self._image_scale
+        )
+
     def get_figure(self) -> Optional[go.Figure]:
         """
         Get the current figure object.
@@ -0,0 +1,268 @@
+import io
+import json
+import math
+import pandas as pd
+import plotly.graph_objects as go
+from PIL import Image
+from dataclasses import dataclass
+from typing import Optional, Union, Dict, List, Tuple, Any
+
+from QSnapBarChartBuilder import QSnapBarChartBuilder
+from QSnapParallelCategoriesBuilder import QSnapParallelCategoriesBuilder
+from QSnapRadarPlotBuilder import QSnapRadarPlotBuilder
+from QSnapYtdChartBuilder import QSnapYtdChartBuilder
+
+
+# Formats that can be downsampled into other resolutions (vector formats scale by themselves)
+RASTER_FORMATS = {'png': 'PNG', 'jpeg': 'JPEG', 'webp': 'WEBP'}
+
+# Chart kinds and the builder rendering them
+BUILDERS = {
+    'bar': QSnapBarChartBuilder,
+    'parcats': QSnapParallelCategoriesBuilder,
+    'radar': QSnapRadarPlotBuilder,
+    'ytd': QSnapYtdChartBuilder
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ChartSpec:
+    """
+    Immutable description of a chart: kind, data, metadata, options and image size.
+
+    Everything is stored as tuples and canonical JSON strings, so a spec is hashable (usable as a cache key),
+    compares by value and pickles into a few hundred bytes. Build it with ChartSpec.create().
+    """
+
+    kind: str
+    columns: Tuple[Tuple[str, Tuple[Any, ...]], ...]
+    metadata: str
+    options: str = '{}'
+    width: Optional[int] = None
+    height: Optional[int] = None
+    scale: Optional[int] = None
+
+    @classmethod
+    def create(cls, kind: str, data: Union[pd.DataFrame, Dict], metadata: Union[Dict, Any],
+               options: Optional[Dict[str, Any]] = None, width: Optional[int] = None,
+               height: Optional[int] = None, scale: Optional[int] = None) -> 'ChartSpec':
+        """
+        Create a spec from the usual builder inputs.
+
+        Args:
+            kind: Chart kind, one of BUILDERS
+            data: DataFrame or dictionary, as given to the builder set_data()
+            metadata: Dictionary or ChartMetadata dataclass, as given to the builder set_metadata()
+            options: Builder setters and their arguments, e.g. {'set_series': [['2023', '2024', '2025']]}.
+                     The 'set_data' entry holds keyword arguments of set_data(), e.g. {'cumulative': True}.
+            width: Image width in pixels (default: builder default)
+            height: Image height in pixels (default: builder default)
+            scale: Image scale factor (default: builder default)
+
+        Returns:
+            Frozen spec
+
+        Raises:
+            ValueError: If the kind is unknown or the inputs cannot be frozen
+        """
+        if kind not in BUILDERS:
+            raise ValueError(f"Unknown chart kind '{kind}'. Supported: {list(BUILDERS)}")
+
+        df = pd.DataFrame(data) if isinstance(data, dict) else data
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        # NaN never equals itself: store missing values as None so that equal data gives equal specs
+        columns = tuple(
+            (str(column), tuple(None if cls._is_missing(value) else value for value in df[column].tolist()))
+            for column in df.columns
+        )
+        if not isinstance(metadata, dict):
+            metadata = {field: getattr(metadata, field) for field in metadata.__dataclass_fields__}
+
+        return cls(
+            kind=kind,
+            columns=columns,
+            metadata=cls._to_json(metadata),
+            options=cls._to_json(options or {}),
+            width=width,
+            height=height,
+            scale=scale
+        )
+
+    def get_data(self) -> Dict[str, List[Any]]:
+        return {column: list(values) for column, values in self.columns}
+
+    def get_metadata(self) -> Dict[str, Any]:
+        return json.loads(self.metadata)
+
+    def get_options(self) -> Dict[str, Any]:
+        return json.loads(self.options)
+
+    @staticmethod
+    def _is_missing(value: Any) -> bool:
+        return value is None or (isinstance(value, float) and math.isnan(value))
+
+    @staticmethod
+    def _to_json(value: Dict[str, Any]) -> str:
+        try:
+            return json.dumps(value, sort_keys=True, separators=(',', ':'))
+        except TypeError as error:
+            raise ValueError(f"Spec values must be JSON serializable: {error}") from error
+
+
+def render(spec: ChartSpec) -> go.Figure:
+    """
+    Build the figure of a spec.
+
+    A new builder is created for every call and nothing is shared between calls, so render() can run
+    concurrently from any number of threads or worker processes.
+
+    Args:
+        spec: Chart spec
+
+    Returns:
+        Plotly Figure object
+
+    Raises:
+        ValueError: If the spec holds invalid data, metadata or options
+    """
+    return _create_builder(spec).build()
+
+
+def render_image(spec: ChartSpec, image_format: str = 'png') -> bytes:
+    """
+    Build and encode the figure of a spec, with the size of the spec.
+
+    Args:
+        spec: Chart spec
+        image_format: Image format supported by Plotly (png, svg, jpeg, webp, pdf)
+
+    Returns:
+        Encoded image
+    """
+    builder = _create_builder(spec)
+    builder.build()
+    return builder.to_image(image_format)
+
+
+def render_images(spec: ChartSpec, scales: Dict[str, float], image_format: str = 'png') -> Dict[str, bytes]:
+    """
+    Build and encode the figure of a spec once, at the largest scale, and derive the other scales from it.
+
+    Args:
+        spec: Chart spec. Its scale is replaced by the largest requested one.
+        scales: Output name and scale factor, e.g. {'wiki': 2, 'thumbnail': 0.5, 'print': 4}
+        image_format: Raster format, one of RASTER_FORMATS
+
+    Returns:
+        Encoded image per output name
+
+    Raises:
+        ValueError: If the format is not a raster format or a scale is not positive
+    """
+    _validate_scales(scales, image_format)
+    largest = max(scales.values())
+    builder = _create_builder(spec)
+    builder.set_image_size(scale=largest)
+    builder.build()
+    return downsample_image(builder.to_image(image_format), largest, scales, image_format)
+
+
+def downsample_image(image: bytes, source_scale: float, scales: Dict[str, float],
+                     image_format: str = 'png') -> Dict[str, bytes]:
+    """
+    Derive smaller resolutions of an encoded chart with Lanczos resampling, one decode for all of them.
+
+    Args:
+        image: Image encoded at source_scale
+        source_scale: Scale factor of the image
+        scales: Output name and scale factor, none above source_scale
+        image_format: Raster format of the image and of the outputs, one of RASTER_FORMATS
+
+    Returns:
+        Encoded image per output name; the source scale gets the source bytes unchanged
+
+    Raises:
+        ValueError: If the format is not a raster format or a scale is not positive or above source_scale
+    """
+    _validate_scales(scales, image_format)
+    if max(scales.values()) > source_scale:
+        raise ValueError(f"Scales cannot exceed the source scale {source_scale}: upsampling loses quality")
+
+    images = {}
+    with Image.open(io.BytesIO(image)) as source:
+        source.load()
+        for name, scale in scales.items():
+            if scale == source_scale:
+                images[name] = image
+                continue
+
+            size = (max(1, round(source.width * scale / source_scale)),
+                    max(1, round(source.height * scale / source_scale)))
+            buffer = io.BytesIO()
+            source.resize(size, Image.Resampling.LANCZOS).save(buffer, format=RASTER_FORMATS[image_format])
+            images[name] = buffer.getvalue()
+
+    return images
+
+
+def _validate_scales(scales: Dict[str, float], image_format: str) -> None:
+    if image_format not in RASTER_FORMATS:
+        raise ValueError(f"Resolutions need a raster format. Supported: {list(RASTER_FORMATS)}")
+    if not scales:
+        raise ValueError("At least one scale is needed")
+    if min(scales.values()) <= 0:
+        raise ValueError("Scales must be positive")
+
+
+def _create_builder(spec: ChartSpec) -> Any:
+    options = spec.get_options()
+    builder = BUILDERS[spec.kind]()
+    builder.set_data(spec.get_data(), **options.pop('set_data', {}))
+    builder.set_metadata(spec.get_metadata())
+    builder.set_image_size(spec.width, spec.height, spec.scale)
+
+    for setter, arguments in options.items():
+        if not setter.startswith('set_') or not hasattr(builder, setter):
+            raise ValueError(f"Unknown option '{setter}' for {spec.kind} charts")
+        getattr(builder, setter)(*arguments)
+
+    return builder
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor
+
+    bar_spec = ChartSpec.create(
+        'bar',
+        data={
+            'Category': ['Good', 'Average', 'Bad', 'Unknown'],
+            '2023': [22, 18, 9, 5],
+            '2024': [34, 12, 5, 1]
+        },
+        metadata={'img_name': 'Coverage Score Trend', 'y_label': 'Coverage score'},
+        width=600,
+        height=600
+    )
+    radar_spec = ChartSpec.create(
+        'radar',
+        data={
+            'Category': ['User satisfaction', 'Product stability', 'Fix reactivity'],
+            '2023': [0.48, 0.58, 0.89],
+            '2024': [0.38, None, 0.79],
+            '2025': [0.28, 0.68, 0.84]
+        },
+        metadata={'img_name': 'AAA Quality Radar', 'y_label': 'Score'},
+        options={'set_series': [['2023', '2024', '2025']]}
+    )
+
+    print(hash(bar_spec) == hash(pickle.loads(pickle.dumps(bar_spec))), len(pickle.dumps(bar_spec)))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        figures = list(executor.map(render, [bar_spec, radar_spec] * 4))
+    print(len(figures))
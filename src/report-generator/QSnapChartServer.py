@@ -0,0 +1,279 @@
+import json
+import hashlib
+import threading
+import plotly.io as pio
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote, urlsplit
+from typing import Optional, Dict, Callable, Tuple, Any
+
+from QSnapChartRenderer import ChartSpec, render, render_image
+
+
+class LruCache:
+    """Thread-safe least-recently-used cache with a maximum number of entries"""
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QSnapChartServer:
+    """
+    Local HTTP server building the charts on demand, for reviewers browsing the current season.
+
+    Every chart is registered with a provider: a callable returning the ChartSpec of the chart from the current
+    ingested data (e.g. a query on QSnapDataStore). Built figures and encoded images are kept in an LRU cache
+    keyed by spec, and responses carry an ETag (spec hash) and a Last-Modified date (build time): a repeat view
+    is answered 304 Not Modified without rebuilding nor transferring anything, and a data change gives a new
+    spec, hence a new ETag.
+
+    Routes:
+        GET /charts                 -> JSON list of the chart ids
+        GET /charts/<id>.png|.svg   -> encoded image
+        GET /charts/<id>.json       -> Plotly figure JSON
+
+    Usage:
+        server = QSnapChartServer()
+        server.register('department_radar', lambda: ChartSpec.create('radar', store_query(), metadata))
+        server.start()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PORT = 8050
+
+    DEFAULT_CACHE_ENTRIES = 256
+
+    ROUTE_PREFIX = '/charts'
+
+    CONTENT_TYPES = {
+        'png': 'image/png',
+        'svg': 'image/svg+xml',
+        'json': 'application/json'
+    }
+
+    # Browsers revalidate every time, the ETag makes it cheap
+    CACHE_CONTROL = 'no-cache'
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 cache_entries: int = DEFAULT_CACHE_ENTRIES):
+        self._host = host
+        self._port = port
+        self._providers: Dict[str, Callable[[], ChartSpec]] = {}
+        self._cache = LruCache(cache_entries)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stats_lock = threading.Lock()
+        self._stats = {'requests': 0, 'builds': 0, 'not_modified': 0}
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def register(self, chart_id: str, provider: Callable[[], ChartSpec]) -> 'QSnapChartServer':
+        """
+        Register a chart.
+
+        Args:
+            chart_id: Chart identifier used in the URL
+            provider: Callable returning the spec of the chart from the current data
+
+        Returns:
+            Self for method chaining
+        """
+        self._providers[chart_id] = provider
+        return self
+
+    def start(self, blocking: bool = False) -> 'QSnapChartServer':
+        """
+        Start serving.
+
+        Args:
+            blocking: True serves in the calling thread until interrupted
+
+        Returns:
+            Self for method chaining
+        """
+        self._server = ThreadingHTTPServer((self._host, self._port), self._create_handler())
+        self._server.daemon_threads = True
+        self._port = self._server.server_address[1]
+        if blocking:
+            self._server.serve_forever()
+        else:
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def get_url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {**self._stats, 'cache_hits': self._cache.hits, 'cache_misses': self._cache.misses,
+                    'cache_entries': len(self._cache)}
+
+    # ========== REQUEST HANDLING ==========
+
+    def _create_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                # Query strings (e.g. cache-busting "?v=2") do not select the chart
+                status, headers, body = server._handle(unquote(urlsplit(self.path).path), self.headers)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def _handle(self, path: str, request_headers) -> Tuple[int, Dict[str, str], bytes]:
+        self._count('requests')
+
+        if path.rstrip('/') == self.ROUTE_PREFIX:
+            return 200, {'Content-Type': self.CONTENT_TYPES['json']}, json.dumps(sorted(self._providers)).encode()
+
+        chart_id, _, image_format = path[len(self.ROUTE_PREFIX) + 1:].rpartition('.')
+        if not path.startswith(self.ROUTE_PREFIX + '/') or chart_id not in self._providers:
+            return 404, {'Content-Type': 'text/plain'}, f"Unknown chart '{path}'".encode()
+        if image_format not in self.CONTENT_TYPES:
+            return 404, {'Content-Type': 'text/plain'}, f"Unsupported format '{image_format}'".encode()
+
+        try:
+            spec = self._providers[chart_id]()
+        except (ValueError, KeyError) as error:
+            return 500, {'Content-Type': 'text/plain'}, str(error).encode()
+
+        # The ETag only depends on the spec and the format: no need to build to validate
+        etag = f"\"{self._get_spec_hash(spec, image_format)}\""
+        entry = self._cache.get((spec, image_format))
+        headers = {'ETag': etag, 'Cache-Control': self.CACHE_CONTROL}
+
+        if self._is_not_modified(request_headers, etag, entry):
+            self._count('not_modified')
+            if entry is not None:
+                headers['Last-Modified'] = entry[1]
+            return 304, headers, b''
+
+        if entry is None:
+            try:
+                content = self._build(spec, image_format)
+            except Exception as error:
+                # e.g. invalid data or no image export engine: report it, keep serving the other charts
+                return 500, {'Content-Type': 'text/plain'}, f"Cannot build '{chart_id}': {error}".encode()
+            entry = (content, formatdate(usegmt=True))
+            self._cache.put((spec, image_format), entry)
+            self._count('builds')
+
+        headers.update({'Content-Type': self.CONTENT_TYPES[image_format], 'Last-Modified': entry[1]})
+        return 200, headers, entry[0]
+
+    @staticmethod
+    def _is_not_modified(request_headers, etag: str, entry: Optional[Tuple[bytes, str]]) -> bool:
+        if_none_match = request_headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+
+        # If-Modified-Since is only meaningful against a cached build date
+        if_modified_since = request_headers.get('If-Modified-Since')
+        if if_modified_since is None or entry is None:
+            return False
+        try:
+            return parsedate_to_datetime(entry[1]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+    # ========== HELPER METHODS ==========
+
+    @staticmethod
+    def _build(spec: ChartSpec, image_format: str) -> bytes:
+        if image_format == 'json':
+            return pio.to_json(render(spec), validate=False, pretty=False).encode('utf-8')
+        return render_image(spec, image_format)
+
+    @staticmethod
+    def _get_spec_hash(spec: ChartSpec, image_format: str) -> str:
+        # hash() is salted per process: a content digest keeps ETags valid across server restarts
+        content = repr((spec.kind, spec.columns, spec.metadata, spec.options, spec.width, spec.height, spec.scale,
+                        image_format))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]
+
+    def _count(self, stat: str) -> None:
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import http.client
+
+    season_data = {
+        'Category': ['Good', 'Average', 'Bad', 'Unknown'],
+        '2023': [22, 18, 9, 5],
+        '2024': [34, 12, 5, 1]
+    }
+
+    server = QSnapChartServer(port=0)
+    server.register('coverage_score_trend', lambda: ChartSpec.create(
+        'bar', season_data, {'img_name': 'Coverage Score Trend', 'y_label': 'Coverage score'}
+    ))
+    server.start()
+
+    host, port = server.get_url()[len('http://'):].split(':')
+    connection = http.client.HTTPConnection(host, int(port))
+
+    connection.request('GET', '/charts/coverage_score_trend.json')
+    response = connection.getresponse()
+    body, etag = response.read(), response.getheader('ETag')
+    print(response.status, len(body), etag)
+
+    connection.request('GET', '/charts/coverage_score_trend.json', headers={'If-None-Match': etag})
+    response = connection.getresponse()
+    response.read()
+    print(response.status)
+
+    # New data, new spec: rebuilt
+    season_data['2024'] = [36, 10, 5, 1]
+    connection.request('GET', '/charts/coverage_score_trend.json', headers={'If-None-Match': etag})
+    response = connection.getresponse()
+    response.read()
+    print(response.status, server.get_stats())
+
+    server.stop()
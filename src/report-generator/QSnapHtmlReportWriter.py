@@ -0,0 +1,247 @@
+import html
+import plotly.io as pio
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+from pathlib import Path
+from typing import Optional, Union, List, Dict
+
+
+class QSnapHtmlReportWriter:
+    """
+    Writer of one self-contained interactive HTML report per department or platform.
+
+    All the charts share a single copy of the Plotly runtime, and of their layout templates (about three
+    quarters of a serialized QSnap figure). Each figure is stored once as compact JSON in an inert
+    <script type="application/json"> block and only drawn when its placeholder scrolls near the viewport,
+    so the page opens fast whatever the number of charts.
+
+    Usage:
+        writer = QSnapHtmlReportWriter().set_title('QSnap - Season 2025 - Department')
+        writer.add_section('Radar plot', 'This year relative to last one')
+        writer.add_figure(radar_figure, 'Department radar', width=600, height=600)
+        writer.write('department.html')
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # 'inline' embeds the runtime (offline, self-contained), 'cdn' loads it once from PLOTLY_CDN_URL
+    PLOTLY_JS_MODES = ['inline', 'cdn']
+    PLOTLY_CDN_URL = 'https://cdn.plot.ly/plotly-{version}.min.js'
+
+    # Charts drawn before the first scroll
+    EAGER_FIGURES = 2
+
+    # Distance to the viewport at which a chart is drawn
+    LAZY_ROOT_MARGIN = '300px'
+
+    DEFAULT_FIGURE_WIDTH = 600
+    DEFAULT_FIGURE_HEIGHT = 600
+
+    PLOTLY_CONFIG = {'displaylogo': False, 'responsive': True}
+
+    PAGE_STYLE = (
+        "body{font-family:Arial,sans-serif;margin:24px auto;max-width:1280px;color:#111827}"
+        "h1{font-size:24px}h2{font-size:18px;margin-top:32px}"
+        ".qsnap-figure{margin:16px 0}.qsnap-figure figcaption{font-weight:bold;margin-bottom:4px}"
+        ".qsnap-plot{background:#F9FAFB}"
+    )
+
+    # Draws every placeholder once it gets close to the viewport
+    LAZY_RENDER_SCRIPT = """
+(function () {
+  var templates = JSON.parse(document.getElementById('qsnap-templates').textContent);
+  function draw(el) {
+    if (el.dataset.drawn) { return; }
+    el.dataset.drawn = '1';
+    var spec = JSON.parse(document.getElementById(el.dataset.figure).textContent);
+    if (el.dataset.template) { spec.layout.template = templates[el.dataset.template]; }
+    Plotly.newPlot(el, spec.data, spec.layout, %(config)s);
+  }
+  var plots = Array.prototype.slice.call(document.querySelectorAll('.qsnap-plot'));
+  plots.slice(0, %(eager)d).forEach(draw);
+  if (!('IntersectionObserver' in window)) { plots.forEach(draw); return; }
+  var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) { observer.unobserve(entry.target); draw(entry.target); }
+    });
+  }, {rootMargin: '%(margin)s'});
+  plots.slice(%(eager)d).forEach(function (el) { observer.observe(el); });
+})();
+"""
+
+    def __init__(self):
+        self._title: str = 'QSnap report'
+        self._plotly_js: str = 'inline'
+        self._blocks: List[Dict[str, Union[str, int]]] = []
+        self._figure_count: int = 0
+        self._templates: Dict[str, str] = {}
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_title(self, title: str) -> 'QSnapHtmlReportWriter':
+        self._title = title
+        return self
+
+    def set_plotly_js(self, mode: str) -> 'QSnapHtmlReportWriter':
+        """
+        Choose how the Plotly runtime is included (once in any case).
+
+        Args:
+            mode: 'inline' (self-contained file) or 'cdn'
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in self.PLOTLY_JS_MODES:
+            raise ValueError(f"Unknown Plotly runtime mode '{mode}'. Supported: {self.PLOTLY_JS_MODES}")
+        self._plotly_js = mode
+        return self
+
+    def add_section(self, title: str, text: Optional[str] = None) -> 'QSnapHtmlReportWriter':
+        """
+        Add a section heading, with an optional comment paragraph.
+
+        Args:
+            title: Section title
+            text: Comment, e.g. the global comment & recommendation
+
+        Returns:
+            Self for method chaining
+        """
+        self._blocks.append({'kind': 'section', 'title': title, 'text': text or ''})
+        return self
+
+    def add_figure(self, figure: Union[go.Figure, List[go.Figure]], title: Optional[str] = None,
+                   width: int = DEFAULT_FIGURE_WIDTH, height: int = DEFAULT_FIGURE_HEIGHT) -> 'QSnapHtmlReportWriter':
+        """
+        Add a chart. The figure is serialized right away, so the caller can drop it.
+
+        Args:
+            figure: Built figure, or a list of figures (e.g. the pages of QSnapRadarGridBuilder)
+            title: Caption
+            width: Placeholder width in pixels
+            height: Placeholder height in pixels
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the figure is not a Plotly figure
+        """
+        figures = figure if isinstance(figure, list) else [figure]
+        for page in figures:
+            if not isinstance(page, go.Figure):
+                raise ValueError("Figure must be a plotly Figure or a list of plotly Figures")
+
+            self._figure_count += 1
+            spec = page.to_dict()
+            template = spec['layout'].pop('template', None)
+            self._blocks.append({
+                'kind': 'figure',
+                'id': f"qsnap-figure-{self._figure_count}",
+                'title': title or '',
+                'width': width,
+                'height': height,
+                'template': self._add_template(template) if template else '',
+                'json': self._to_compact_json(spec)
+            })
+        return self
+
+    def build(self) -> str:
+        """
+        Assemble the document.
+
+        Returns:
+            HTML document
+        """
+        body = []
+        for block in self._blocks:
+            if block['kind'] == 'section':
+                body.append(f"<h2>{html.escape(block['title'])}</h2>")
+                if block['text']:
+                    body.append(f"<p>{html.escape(block['text'])}</p>")
+            else:
+                caption = f"<figcaption>{html.escape(block['title'])}</figcaption>" if block['title'] else ''
+                body.append(
+                    f"<figure class=\"qsnap-figure\">{caption}"
+                    f"<div class=\"qsnap-plot\" data-figure=\"{block['id']}\" data-template=\"{block['template']}\" "
+                    f"style=\"width:{block['width']}px;height:{block['height']}px\"></div>"
+                    f"<script type=\"application/json\" id=\"{block['id']}\">{block['json']}</script></figure>"
+                )
+
+        script = self.LAZY_RENDER_SCRIPT % {
+            'config': pio.json.to_json_plotly(self.PLOTLY_CONFIG),
+            'eager': self.EAGER_FIGURES,
+            'margin': self.LAZY_ROOT_MARGIN
+        }
+
+        templates = "{" + ",".join(f'"{key}":{value}' for key, value in self._templates.items()) + "}"
+        body.append(f"<script type=\"application/json\" id=\"qsnap-templates\">{templates}</script>")
+
+        return (
+            "<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(self._title)}</title><style>{self.PAGE_STYLE}</style>"
+            f"{self._get_runtime_tag()}</head>\n"
+            f"<body><h1>{html.escape(self._title)}</h1>\n" + "\n".join(body) +
+            f"\n<script>{script}</script></body></html>\n"
+        )
+
+    def write(self, filename: Union[str, Path]) -> Path:
+        """
+        Write the document.
+
+        Args:
+            filename: Output file (.html)
+
+        Returns:
+            The written path
+        """
+        path = Path(filename)
+        path.write_text(self.build(), encoding='utf-8')
+        return path
+
+    # ========== HELPER METHODS ==========
+
+    @staticmethod
+    def _to_compact_json(spec: Dict) -> str:
+        # No whitespace; '</' is escaped so the JSON cannot close its script tag
+        return pio.json.to_json_plotly(spec, pretty=False).replace('</', '<\\/')
+
+    def _add_template(self, template: Dict) -> str:
+        """Store a layout template once, returns its key"""
+        data = self._to_compact_json(template)
+        for key, value in self._templates.items():
+            if value == data:
+                return key
+        key = f"t{len(self._templates)}"
+        self._templates[key] = data
+        return key
+
+    def _get_runtime_tag(self) -> str:
+        if self._plotly_js == 'cdn':
+            return f"<script src=\"{self.PLOTLY_CDN_URL.format(version=get_plotlyjs_version())}\"></script>"
+        return f"<script type=\"text/javascript\">{get_plotlyjs()}</script>"
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    from QSnapBarChartBuilder import QSnapBarChartBuilder
+
+    writer = QSnapHtmlReportWriter().set_title('QSnap - Season 2025 - Department')
+    writer.add_section('Global comment & recommendation', 'Coverage improved on most platforms.')
+
+    for metric in ['Coverage score', 'Quality score', 'Documentation score', 'Automation score']:
+        figure = QSnapBarChartBuilder().set_data({
+            'Category': ['Good', 'Average', 'Bad', 'Unknown'],
+            '2023': [22, 18, 9, 5],
+            '2024': [34, 12, 5, 1]
+        }).set_metadata({'img_name': f"{metric} Trend", 'y_label': metric}).build()
+        writer.add_figure(figure, metric)
+
+    path = writer.write('department_report.html')
+    print(f"{path} - {path.stat().st_size / 1024:.0f} KB")
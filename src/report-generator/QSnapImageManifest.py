@@ -0,0 +1,244 @@
+import io
+import json
+import hashlib
+import numpy as np
+from PIL import Image
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union, Dict, Any, Tuple
+
+
+class QSnapImageManifest:
+    """
+    Manifest of the exported images: content hash and perceptual hash of every chart.
+
+    Images are first normalized into byte-stable PNGs (pixels only, no metadata, fixed encoder settings), so the
+    same chart always gives the same bytes and the same content hash: any other content is a change. Skipping
+    re-renders that differ by a few anti-aliased pixels only is opt-in, with a perceptual hash (dHash) threshold:
+    an 8x8 dHash does not see small text changes (e.g. a bar label going from "34% (12)" to "35% (13)").
+
+    Usage:
+        manifest = QSnapImageManifest().load('charts/manifest.json')
+        image = QSnapImageManifest.normalize_png(raw_png)
+        status = manifest.record('coverage_score_trend', image)  # 'new', 'changed', 'identical' or 'similar'
+        manifest.save()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # Fixed encoder settings: same pixels in, same bytes out
+    PNG_COMPRESS_LEVEL = 6
+    PNG_MODE = 'RGBA'
+
+    # dHash of HASH_SIZE x HASH_SIZE bits
+    HASH_SIZE = 8
+
+    # Maximum number of differing dHash bits for two images to be visually unchanged. None: perceptual
+    # comparison disabled, every content change is published.
+    SIMILARITY_THRESHOLD = None
+
+    # Record statuses
+    NEW = 'new'
+    CHANGED = 'changed'
+    IDENTICAL = 'identical'
+    SIMILAR = 'similar'
+
+    UNCHANGED_STATUSES = (IDENTICAL, SIMILAR)
+
+    def __init__(self, similarity_threshold: Optional[int] = SIMILARITY_THRESHOLD):
+        self._similarity_threshold = similarity_threshold
+        self._path: Optional[Path] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def load(self, path: Union[str, Path]) -> 'QSnapImageManifest':
+        """
+        Load a manifest; a missing file starts an empty one.
+
+        Args:
+            path: Manifest JSON file, also used by save()
+
+        Returns:
+            Self for method chaining
+        """
+        self._path = Path(path)
+        self._entries = json.loads(self._path.read_text(encoding='utf-8')) if self._path.exists() else {}
+        return self
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Save the manifest, with sorted keys so that it is byte-stable too.
+
+        Args:
+            path: Manifest JSON file. If None, uses the loaded one.
+
+        Raises:
+            ValueError: If no path is known
+        """
+        path = Path(path) if path is not None else self._path
+        if path is None:
+            raise ValueError("Manifest path is unknown. Call load() first or give a path.")
+        path.write_text(json.dumps(self._entries, indent=2, sort_keys=True), encoding='utf-8')
+
+    def record(self, chart_id: str, image: bytes) -> str:
+        """
+        Record the hashes of an image and compare them with the previous export.
+
+        Args:
+            chart_id: Chart identifier
+            image: Normalized PNG bytes
+
+        Returns:
+            NEW, CHANGED, IDENTICAL (same bytes) or SIMILAR (perceptual hashes within the threshold, only when
+            a threshold is set). For IDENTICAL and SIMILAR the previous entry is kept, so small drifts do not
+            accumulate.
+        """
+        status, entry = self.compare(chart_id, image)
+        if status not in self.UNCHANGED_STATUSES:
+            self.update(chart_id, entry)
+        return status
+
+    def compare(self, chart_id: str, image: bytes) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Compare an image with the previous export, without recording it.
+
+        Args:
+            chart_id: Chart identifier
+            image: Normalized PNG bytes
+
+        Returns:
+            (status as returned by record(), entry to give to update() once the image is published, None if
+            unchanged)
+        """
+        sha256 = self.content_hash(image)
+        previous = self._entries.get(chart_id)
+
+        if previous is not None and previous['sha256'] == sha256:
+            return self.IDENTICAL, None
+
+        dhash = self.perceptual_hash(image)
+        if (previous is not None and self._similarity_threshold is not None
+                and self.hamming_distance(previous['dhash'], dhash) <= self._similarity_threshold):
+            return self.SIMILAR, None
+
+        entry = {
+            'sha256': sha256,
+            'dhash': dhash,
+            'size': len(image),
+            'updated': datetime.now().isoformat(timespec='seconds')
+        }
+        return (self.CHANGED if previous is not None else self.NEW), entry
+
+    def update(self, chart_id: str, entry: Dict[str, Any]) -> None:
+        self._entries[chart_id] = entry
+
+    def get_entry(self, chart_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded hashes of a chart.
+
+        Returns:
+            Dictionary with sha256, dhash, size and updated, or None if the chart is unknown
+        """
+        return self._entries.get(chart_id)
+
+    # ========== HASHING METHODS ==========
+
+    @classmethod
+    def normalize_png(cls, image: bytes) -> bytes:
+        """
+        Re-encode an image into a byte-stable PNG: pixels only, no text chunks, timestamps or ICC profile.
+
+        Args:
+            image: Encoded image (any format Pillow can read)
+
+        Returns:
+            Normalized PNG bytes
+        """
+        with Image.open(io.BytesIO(image)) as source:
+            pixels = source.convert(cls.PNG_MODE)
+
+        # Rebuilding the image from its raw pixels drops every info/metadata entry of the source
+        clean = Image.frombytes(cls.PNG_MODE, pixels.size, pixels.tobytes())
+        buffer = io.BytesIO()
+        clean.save(buffer, format='PNG', compress_level=cls.PNG_COMPRESS_LEVEL, optimize=False)
+        return buffer.getvalue()
+
+    @staticmethod
+    def content_hash(image: bytes) -> str:
+        return hashlib.sha256(image).hexdigest()
+
+    @classmethod
+    def perceptual_hash(cls, image: bytes, hash_size: int = HASH_SIZE) -> str:
+        """
+        Difference hash: sign of the horizontal gradient of a (hash_size + 1) x hash_size grayscale thumbnail.
+
+        Args:
+            image: Encoded image
+            hash_size: Number of rows and bits per row
+
+        Returns:
+            Hexadecimal hash of hash_size * hash_size bits
+        """
+        with Image.open(io.BytesIO(image)) as source:
+            # Transparent areas are white on the wiki
+            background = Image.new('RGBA', source.size, 'white')
+            flattened = Image.alpha_composite(background, source.convert('RGBA'))
+            thumbnail = flattened.convert('L').resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+
+        pixels = np.asarray(thumbnail, dtype=np.int16)
+        bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+        return f"{int(''.join('1' if bit else '0' for bit in bits), 2):0{hash_size * hash_size // 4}x}"
+
+    @staticmethod
+    def hamming_distance(hash_a: str, hash_b: str) -> int:
+        return bin(int(hash_a, 16) ^ int(hash_b, 16)).count('1')
+
+
+class ManifestSink:
+    """Normalize every image and only forward the new or changed ones to a sink, recording them once written"""
+
+    def __init__(self, sink: Any, manifest: QSnapImageManifest):
+        self._sink = sink
+        self._manifest = manifest
+        self._statuses: Dict[str, str] = {}
+
+    def write(self, chart_id: str, image: bytes) -> None:
+        image = QSnapImageManifest.normalize_png(image)
+        status, entry = self._manifest.compare(chart_id, image)
+        if status not in QSnapImageManifest.UNCHANGED_STATUSES:
+            self._sink.write(chart_id, image)
+            # Recorded once published only: an image the sink failed to write is sent again on the next run
+            self._manifest.update(chart_id, entry)
+        self._statuses[chart_id] = status
+
+    def close(self) -> None:
+        self._sink.close()
+        self._manifest.save()
+
+    def get_statuses(self) -> Dict[str, str]:
+        return self._statuses
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    from PIL.PngImagePlugin import PngInfo
+
+    def draw(shift: int) -> bytes:
+        # Renderers stamp volatile metadata, e.g. the creation time
+        info = PngInfo()
+        info.add_text('Creation Time', datetime.now().isoformat())
+        img = Image.new('RGB', (200, 100), 'white')
+        img.paste((30, 144, 255), (20 + shift, 20, 120 + shift, 80))
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG', pnginfo=info)
+        return buffer.getvalue()
+
+    manifest = QSnapImageManifest(similarity_threshold=4)
+    print(manifest.record('bar', QSnapImageManifest.normalize_png(draw(0))))   # new
+    print(manifest.record('bar', QSnapImageManifest.normalize_png(draw(0))))   # identical
+    print(manifest.record('bar', QSnapImageManifest.normalize_png(draw(1))))   # similar
+    print(manifest.record('bar', QSnapImageManifest.normalize_png(draw(60))))  # changed
+    print(manifest.get_entry('bar'))
@@ -0,0 +1,422 @@
+import pandas as pd
+import plotly.graph_objects as go
+from typing import List, Dict, Optional, Union
+from dataclasses import dataclass
+
+
+@dataclass
+class ChartMetadata:
+    img_name: str
+    y_label: str
+
+
+class QSnapParallelCategoriesBuilder:
+    """
+    Builder class for creating QSnap parallel categories charts: the category flows of the applications
+    from one season to the next.
+
+    The chart is drawn from weighted paths: one row per distinct sequence of categories (e.g. Good -> Bad ->
+    Average) with the number of applications following it, passed to Plotly as the counts of the dimensions.
+    The figure size therefore depends on the number of distinct paths (at most categories ^ seasons), never on
+    the number of applications.
+
+    Data is either:
+        - aggregated counts: one column per season and a 'Count' column, one row per path
+        - per-application categories: an 'Application' column and one column per season, collapsed into
+          weighted paths by set_data()
+
+    Usage:
+        builder = QSnapParallelCategoriesBuilder()
+        fig = builder.set_data(df).set_metadata(metadata).set_image_size(800, 600).build()
+        builder.export_to_png('output_chart')
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    APPLICATION_COLUMN = 'Application'
+    COUNT_COLUMN = 'Count'
+
+    # Category of the applications without an answer in a season
+    MISSING_CATEGORY = 'Unknown'
+
+    # Category order, top to bottom. Categories not listed are drawn below, in order of appearance.
+    CATEGORY_ORDER = ['Full', 'Good', 'Average', 'Low', 'Bad', 'None', 'Unknown']
+
+    # Color scheme for categories, flows take the color of their category in the first season
+    CATEGORY_COLORS = {
+        'Full':    '#4ADE80',   # Medium green
+        'Good':    '#86EFAC',   # Light green
+        'Average': '#D1D5DB',   # Light grey
+        'Low':     '#FDE047',   # Light yellow
+        'Bad':     '#FCA5A5',   # Light red
+        'None':    '#FCA5A5',   # Light red
+        'Unknown': '#F3F4F6'    # Lighter grey, white flows would not show
+    }
+    DEFAULT_CATEGORY_COLOR = '#CCCCCC'
+
+    # Chart styling constants
+    FONT_FAMILY = 'Arial'
+    LABEL_FONT_SIZE = 14
+    TICK_FONT_SIZE = 12
+    TITLE_Y_POSITION = 0.98
+    MARGIN = {'l': 100, 'r': 100, 't': 80, 'b': 50}
+
+    # Default image size
+    DEFAULT_IMAGE_WIDTH = 800
+    DEFAULT_IMAGE_HEIGHT = 600
+    DEFAULT_IMAGE_SCALE = 2
+
+    def __init__(self):
+        self._paths: Optional[pd.DataFrame] = None
+        self._series: Optional[List[str]] = None
+        self._metadata: Optional[ChartMetadata] = None
+        self._figure: Optional[go.Figure] = None
+        self._image_width: int = self.DEFAULT_IMAGE_WIDTH
+        self._image_height: int = self.DEFAULT_IMAGE_HEIGHT
+        self._image_scale: int = self.DEFAULT_IMAGE_SCALE
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_data(self, data: Union[pd.DataFrame, Dict]) -> 'QSnapParallelCategoriesBuilder':
+        """
+        Set the data for the chart.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain season columns and either a 'Count' column (aggregated counts) or an
+                  'Application' column (one row per application).
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid or no application has a weight
+        """
+        if isinstance(data, dict):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data
+        else:
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        self._validate_data_frame(df)
+        paths = self._compute_paths(df)
+        if paths.empty:
+            raise ValueError("No application to draw")
+        self._paths = paths
+
+        return self
+
+    def set_series(self, series: Optional[List[str]]) -> 'QSnapParallelCategoriesBuilder':
+        """
+        Select and order the season columns drawn as dimensions.
+
+        Args:
+            series: Ordered season columns, or None for all of them in data order
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If fewer than two seasons are given
+        """
+        if series is not None and len(series) < 2:
+            raise ValueError("Series must contain at least two columns")
+
+        self._series = list(series) if series is not None else None
+
+        return self
+
+    def set_metadata(self, metadata: Union[ChartMetadata, Dict]) -> 'QSnapParallelCategoriesBuilder':
+        """
+        Set the metadata for the chart.
+
+        Args:
+            metadata: Either a ChartMetadata object or a dictionary with metadata fields
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If metadata format is invalid
+        """
+        if isinstance(metadata, dict):
+            self._metadata = ChartMetadata(**metadata)
+        elif isinstance(metadata, ChartMetadata):
+            self._metadata = metadata
+        else:
+            raise ValueError("Metadata must be either a ChartMetadata object or a dictionary")
+
+        if not self._metadata.img_name:
+            raise ValueError("Metadata must include 'img_name'")
+
+        return self
+
+    def set_image_size(self, width: int = None, height: int = None,
+                       scale: int = None) -> 'QSnapParallelCategoriesBuilder':
+        """
+        Set the image export dimensions.
+
+        Args:
+            width: Image width in pixels (default: 800)
+            height: Image height in pixels (default: 600)
+            scale: Image scale factor (default: 2)
+
+        Returns:
+            Self for method chaining
+        """
+        if width is not None:
+            self._image_width = width
+        if height is not None:
+            self._image_height = height
+        if scale is not None:
+            self._image_scale = scale
+
+        return self
+
+    def build(self) -> go.Figure:
+        """
+        Build the chart with current data and metadata.
+
+        Returns:
+            Plotly Figure object
+
+        Raises:
+            ValueError: If data or metadata is not set, or a selected season is not in the data
+        """
+        if self._paths is None:
+            raise ValueError("Data must be set before building. Call set_data() first.")
+        if self._metadata is None:
+            raise ValueError("Metadata must be set before building. Call set_metadata() first.")
+
+        self._figure = self._create_chart()
+        return self._figure
+
+    def export_to_png(self, filename: Optional[str] = None) -> None:
+        """
+        Export the chart to PNG file.
+
+        Args:
+            filename: Output filename (without extension). If None, uses metadata img_name.
+
+        Raises:
+            ValueError: If chart hasn't been built yet
+        """
+        if self._figure is None:
+            raise ValueError("Chart must be built before exporting. Call build() first.")
+
+        if filename is None:
+            filename = self._metadata.img_name
+
+        clean_filename = filename.strip().lower().replace(' ', '_') + ".png"
+
+        self._figure.write_image(
+            clean_filename,
+            width=self._image_width,
+            height=self._image_height,
+            scale=self._image_scale,
+            format="png"
+        )
+
+    def to_image(self, image_format: str = "png") -> bytes:
+        """
+        Encode the chart in memory, with the same size as export_to_png().
+
+        Args:
+            image_format: Image format supported by Plotly (png, svg, jpeg, webp, pdf)
+
+        Returns:
+            Encoded image
+
+        Raises:
+            ValueError: If chart hasn't been built yet
+        """
+        if self._figure is None:
+            raise ValueError("Chart must be built before exporting. Call build() first.")
+
+        return self._figure.to_image(
+            format=image_format,
+            width=self._image_width,
+            height=self._image_height,
+            scale=self._image_scale
+        )
+
+    def get_figure(self) -> Optional[go.Figure]:
+        """
+        Get the current figure object.
+
+        Returns:
+            The plotly Figure object or None if not built yet
+        """
+        return self._figure
+
+    def get_paths(self) -> Optional[pd.DataFrame]:
+        """
+        Get the weighted paths drawn by the chart.
+
+        Returns:
+            DataFrame with one column per season and the 'Count' column, or None if no data is set
+        """
+        return self._paths
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        """Validate that the DataFrame has the required structure"""
+        has_count = self.COUNT_COLUMN in df.columns
+        has_application = self.APPLICATION_COLUMN in df.columns
+        if has_count == has_application:
+            raise ValueError(f"DataFrame must contain either a '{self.COUNT_COLUMN}' column (aggregated counts) "
+                             f"or an '{self.APPLICATION_COLUMN}' column (one row per application)")
+
+        if len(df.columns) < 3:
+            raise ValueError("DataFrame must contain at least two season columns")
+
+        if has_count:
+            if not pd.api.types.is_numeric_dtype(df[self.COUNT_COLUMN]):
+                raise ValueError(f"'{self.COUNT_COLUMN}' column must contain numeric values")
+            if (df[self.COUNT_COLUMN] < 0).any():
+                raise ValueError(f"'{self.COUNT_COLUMN}' column must not contain negative values")
+        elif df[self.APPLICATION_COLUMN].duplicated().any():
+            duplicates = df.loc[df[self.APPLICATION_COLUMN].duplicated(), self.APPLICATION_COLUMN].unique()
+            raise ValueError(f"Applications must appear once, duplicated: {list(duplicates[:5])}")
+
+    # ========== DATA PROCESSING METHODS ==========
+
+    def _compute_paths(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Collapse the rows into distinct category paths weighted by their number of applications"""
+        weight_column = self.COUNT_COLUMN if self.COUNT_COLUMN in df.columns else self.APPLICATION_COLUMN
+        seasons = [column for column in df.columns if column != weight_column]
+
+        categories = df[seasons].astype(object).where(df[seasons].notna(), self.MISSING_CATEGORY).astype(str)
+        if weight_column == self.COUNT_COLUMN:
+            weights = df[self.COUNT_COLUMN]
+        else:
+            weights = pd.Series(1, index=df.index)
+
+        paths = weights.groupby([categories[season] for season in seasons], sort=False).sum()
+        paths = paths[paths > 0].rename(self.COUNT_COLUMN).reset_index()
+        return paths
+
+    def _get_categories(self, seasons: List[str]) -> List[str]:
+        found = pd.unique(self._paths[seasons].to_numpy().ravel()).tolist()
+        ordered = [category for category in self.CATEGORY_ORDER if category in found]
+        return ordered + [category for category in found if category not in self.CATEGORY_ORDER]
+
+    # ========== CHART CREATION METHODS ==========
+
+    def _create_chart(self) -> go.Figure:
+        """Main method to create the complete chart"""
+        seasons = self._get_seasons()
+        categories = self._get_categories(seasons)
+
+        # Flows only differing by the deselected seasons are drawn as one
+        paths = self._paths.groupby(seasons, sort=False)[self.COUNT_COLUMN].sum().reset_index()
+        counts = paths[self.COUNT_COLUMN].to_numpy()
+
+        fig = go.Figure(go.Parcats(
+            dimensions=[self._create_dimension(paths, season, categories) for season in seasons],
+            counts=counts,
+            line=self._create_line(paths[seasons[0]], categories),
+            labelfont={'size': self.LABEL_FONT_SIZE, 'family': self.FONT_FAMILY},
+            tickfont={'size': self.TICK_FONT_SIZE, 'family': self.FONT_FAMILY},
+            arrangement='freeform',
+            hoveron='color',
+            hoverinfo='count+probability',
+            bundlecolors=True,
+            sortpaths='forward'
+        ))
+
+        return self._apply_layout(fig)
+
+    def _create_dimension(self, paths: pd.DataFrame, season: str, categories: List[str]) -> Dict:
+        """One dimension per season, each category label carrying its number of applications"""
+        totals = paths.groupby(season)[self.COUNT_COLUMN].sum()
+        season_categories = [category for category in categories if category in totals.index]
+
+        return {
+            'label': season,
+            'values': paths[season].tolist(),
+            'categoryorder': 'array',
+            'categoryarray': season_categories,
+            'ticktext': [f"{category} ({int(totals[category])})" for category in season_categories]
+        }
+
+    def _create_line(self, first_categories: pd.Series, categories: List[str]) -> Dict:
+        """Color every flow by its first category, through a discrete color scale"""
+        codes = first_categories.map({category: code for code, category in enumerate(categories)}).to_numpy()
+        colors = [self.CATEGORY_COLORS.get(category, self.DEFAULT_CATEGORY_COLOR) for category in categories]
+        last_code = max(len(categories) - 1, 1)
+
+        return {
+            'color': codes,
+            'cmin': 0,
+            'cmax': last_code,
+            'colorscale': [[code / last_code, color] for code, color in enumerate(colors)] if len(colors) > 1
+            else [[0, colors[0]], [1, colors[0]]],
+            'shape': 'hspline'
+        }
+
+    def _apply_layout(self, fig: go.Figure) -> go.Figure:
+        """Apply layout configuration to the figure"""
+        fig.update_layout(
+            title={
+                'text': self._metadata.img_name,
+                'x': 0.5,
+                'xanchor': 'center',
+                'y': self.TITLE_Y_POSITION,
+                'yanchor': 'top'
+            },
+            font={'size': self.TICK_FONT_SIZE, 'family': self.FONT_FAMILY},
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            margin=self.MARGIN
+        )
+
+        return fig
+
+    # ========== HELPER METHODS ==========
+
+    def _get_seasons(self) -> List[str]:
+        available = self._paths.columns.drop(self.COUNT_COLUMN).tolist()
+        if self._series is None:
+            return available
+
+        missing = [season for season in self._series if season not in available]
+        if missing:
+            raise ValueError(f"Series {missing} not found in data. Available seasons: {available}")
+        return self._series
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    # Aggregated counts: one row per path
+    data = {
+        '2023': ['Good', 'Good', 'Average', 'Average', 'Bad', 'Bad'],
+        '2024': ['Good', 'Average', 'Good', 'Bad', 'Average', 'Bad'],
+        '2025': ['Good', 'Good', 'Good', 'Average', 'Average', 'Bad'],
+        'Count': [30, 4, 8, 3, 6, 2]
+    }
+
+    metadata = {
+        'img_name': 'Coverage Score Flows',
+        'y_label': 'Coverage score'
+    }
+
+    builder = QSnapParallelCategoriesBuilder()
+    fig = builder.set_data(data).set_metadata(metadata).set_image_size(800, 600).build()
+    fig.show()
+    builder.export_to_png()
+
+    # Per-application categories: collapsed into weighted paths, whatever the number of applications
+    applications = {
+        'Application': ['AAA', 'BBB', 'CCC', 'DDD', 'EEE'],
+        '2024': ['Good', 'Bad', 'Good', None, 'Average'],
+        '2025': ['Good', 'Average', 'Bad', 'Good', 'Average']
+    }
+
+    fig2 = builder.set_data(applications).set_metadata({'img_name': 'Fix Reactivity Flows', 'y_label': ''}).build()
+    print(builder.get_paths())
+    fig2.show()
@@ -0,0 +1,291 @@
+import io
+import os
+import numpy as np
+import pandas as pd
+from PIL import Image
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Optional, Union, Tuple, Any
+
+
+def optimize_file(source: str, target: str, mode: str, colors: int) -> Dict[str, Any]:
+    """
+    Optimize one PNG file. Runs in the worker processes, hence a module function.
+
+    Args:
+        source: PNG to optimize
+        target: Output path (may be the source itself)
+        mode: QSnapPngOptimizer.LOSSLESS or QSnapPngOptimizer.QUANTIZE
+        colors: Maximum palette size of the quantize mode
+
+    Returns:
+        'file' and either 'error', or 'size_before', 'size_after', 'encoding' and 'identical'
+    """
+    try:
+        original = Path(source).read_bytes()
+        optimized, encoding = QSnapPngOptimizer.optimize_image(original, mode, colors)
+        identical = QSnapPngOptimizer.is_pixel_identical(original, optimized)
+        if mode == QSnapPngOptimizer.LOSSLESS and not identical:
+            raise ValueError("Lossless optimization changed the pixels")
+
+        if len(optimized) >= len(original):
+            optimized, encoding, identical = original, 'original', True
+        if optimized is not original or source != target:
+            Path(target).write_bytes(optimized)
+
+        return {
+            'file': source,
+            'size_before': len(original),
+            'size_after': len(optimized),
+            'encoding': encoding,
+            'identical': identical
+        }
+    except Exception as error:
+        # An unreadable file is reported and left untouched, the other files go on
+        return {'file': source, 'error': f"{type(error).__name__}: {error}"}
+
+
+class QSnapPngOptimizer:
+    """
+    Optional post-processing of the exported PNGs: recompression and palette conversion, in a process pool.
+
+    Plotly exports are RGBA, filtered and deflated for speed. Two modes:
+        - LOSSLESS: drops an all-opaque alpha channel, stores images of at most 256 colors as an exact palette,
+          recompresses the others at the highest level. Every result is decoded again and checked pixel-identical
+          to the source; a difference is reported as an error and the file is left untouched.
+        - QUANTIZE: additionally reduces images of more than 'colors' colors (mostly anti-aliasing shades) to a
+          palette. Smaller files, not pixel-identical: the 'identical' statistic tells which ones changed.
+
+    A file that would grow is kept as is. Compression is CPU bound, hence processes rather than threads.
+
+    Usage:
+        optimizer = QSnapPngOptimizer(mode='lossless').add_directory('dist').optimize()
+        print(optimizer.get_summary())
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    LOSSLESS = 'lossless'
+    QUANTIZE = 'quantize'
+    MODES = [LOSSLESS, QUANTIZE]
+
+    PNG_PATTERN = '*.png'
+
+    # Palette size of the quantize mode
+    DEFAULT_COLORS = 256
+
+    # Highest zlib level; Pillow's optimize also tries the filter strategies
+    PNG_COMPRESS_LEVEL = 9
+
+    FILE_COLUMN = 'file'
+
+    def __init__(self, mode: str = LOSSLESS, colors: int = DEFAULT_COLORS, max_workers: Optional[int] = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode '{mode}'. Supported: {self.MODES}")
+        if not 2 <= colors <= 256:
+            raise ValueError("Palette colors must be between 2 and 256")
+
+        self._mode = mode
+        self._colors = colors
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._paths: List[Path] = []
+        self._results: Optional[List[Dict[str, Any]]] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def add_files(self, *paths: Union[str, Path]) -> 'QSnapPngOptimizer':
+        """
+        Add PNG files to optimize.
+
+        Args:
+            *paths: PNG paths
+
+        Returns:
+            Self for method chaining
+        """
+        self._paths.extend(Path(path) for path in paths)
+        return self
+
+    def add_directory(self, directory: Union[str, Path], pattern: str = PNG_PATTERN) -> 'QSnapPngOptimizer':
+        """
+        Add every PNG of a directory.
+
+        Args:
+            directory: Directory to scan (not recursive)
+            pattern: File name pattern
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the directory does not exist
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise ValueError(f"Directory not found: {directory}")
+
+        self._paths.extend(sorted(directory.glob(pattern)))
+        return self
+
+    def optimize(self, output_dir: Optional[Union[str, Path]] = None) -> 'QSnapPngOptimizer':
+        """
+        Optimize all the added files, in parallel.
+
+        Args:
+            output_dir: Directory of the optimized files, keeping their paths relative to the common directory
+                        of the sources (so same-named files of different directories do not collide).
+                        If None, the files are replaced in place.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If no file was added
+        """
+        if not self._paths:
+            raise ValueError("No PNG to optimize. Call add_files() or add_directory() first.")
+
+        # Resolved, so that one file added through two different paths is optimized once
+        sources = [str(path) for path in dict.fromkeys(path.resolve() for path in self._paths)]
+        if output_dir is not None:
+            root = os.path.commonpath([os.path.dirname(source) for source in sources])
+            targets = [str(Path(output_dir) / os.path.relpath(source, root)) for source in sources]
+            for target in targets:
+                Path(target).parent.mkdir(parents=True, exist_ok=True)
+        else:
+            targets = sources
+
+        jobs = [(source, target, self._mode, self._colors) for source, target in zip(sources, targets)]
+        if self._max_workers == 1 or len(jobs) == 1:
+            results = [optimize_file(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self._max_workers, len(jobs))) as executor:
+                futures = [executor.submit(optimize_file, *job) for job in jobs]
+                results = [future.result() for future in as_completed(futures)]
+            order = {source: index for index, source in enumerate(sources)}
+            results.sort(key=lambda result: order[result['file']])
+
+        self._results = results
+        return self
+
+    def get_stats(self) -> pd.DataFrame:
+        """
+        Get the per file statistics.
+
+        Returns:
+            DataFrame with the file, sizes before and after in bytes, saved ratio, encoding and whether
+            the pixels are identical to the source, one row per optimized file
+        """
+        self._check_optimized()
+        stats = pd.DataFrame(
+            [result for result in self._results if 'error' not in result],
+            columns=[self.FILE_COLUMN, 'size_before', 'size_after', 'encoding', 'identical']
+        )
+        stats['saved'] = 1 - stats['size_after'] / stats['size_before']
+        return stats
+
+    def get_errors(self) -> pd.DataFrame:
+        self._check_optimized()
+        return pd.DataFrame([(result['file'], result['error']) for result in self._results if 'error' in result],
+                            columns=[self.FILE_COLUMN, 'error'])
+
+    def get_summary(self) -> Dict[str, Any]:
+        stats = self.get_stats()
+        size_before, size_after = int(stats['size_before'].sum()), int(stats['size_after'].sum())
+        return {
+            'files': len(self._results),
+            'optimized_files': int((stats['encoding'] != 'original').sum()),
+            'failed_files': len(self._results) - len(stats),
+            'changed_pixels': int((~stats['identical']).sum()),
+            'size_before': size_before,
+            'size_after': size_after,
+            'saved': 1 - size_after / size_before if size_before else 0.0
+        }
+
+    # ========== IMAGE METHODS ==========
+
+    @classmethod
+    def optimize_image(cls, image: bytes, mode: str = LOSSLESS, colors: int = DEFAULT_COLORS) -> Tuple[bytes, str]:
+        """
+        Re-encode one PNG.
+
+        Args:
+            image: PNG bytes
+            mode: LOSSLESS or QUANTIZE
+            colors: Maximum palette size of the quantize mode
+
+        Returns:
+            (optimized PNG bytes, encoding: 'palette', 'quantized', 'rgb' or 'rgba')
+        """
+        with Image.open(io.BytesIO(image)) as source:
+            pixels = np.asarray(source.convert('RGBA'))
+
+        opaque = bool((pixels[..., 3] == 255).all())
+        palette = cls._to_exact_palette(pixels, opaque)
+        if palette is not None:
+            return cls._encode(palette), 'palette'
+
+        truecolor = Image.fromarray(pixels[..., :3] if opaque else pixels, 'RGB' if opaque else 'RGBA')
+        if mode == cls.QUANTIZE:
+            # Median cut keeps the flat chart colors exact and spends the rest of the palette on the edges
+            method = Image.Quantize.MEDIANCUT if opaque else Image.Quantize.FASTOCTREE
+            return cls._encode(truecolor.quantize(colors, method=method, dither=Image.Dither.NONE)), 'quantized'
+        return cls._encode(truecolor), 'rgb' if opaque else 'rgba'
+
+    @staticmethod
+    def is_pixel_identical(image_a: bytes, image_b: bytes) -> bool:
+        with Image.open(io.BytesIO(image_a)) as first, Image.open(io.BytesIO(image_b)) as second:
+            return first.size == second.size and first.convert('RGBA').tobytes() == second.convert('RGBA').tobytes()
+
+    # ========== HELPER METHODS ==========
+
+    @staticmethod
+    def _to_exact_palette(pixels: np.ndarray, opaque: bool) -> Optional[Image.Image]:
+        """Palette image of the exact colors, or None above 256 colors"""
+        packed = np.ascontiguousarray(pixels).view(np.uint32)[..., 0]
+        colors, indexes = np.unique(packed, return_inverse=True)
+        if len(colors) > 256:
+            return None
+
+        rgba = colors.view(np.uint8).reshape(-1, 4)
+        palette = Image.fromarray(indexes.reshape(packed.shape).astype(np.uint8), 'P')
+        palette.putpalette(rgba[:, :3].ravel().tolist())
+        if not opaque:
+            palette.info['transparency'] = bytes(rgba[:, 3].tolist())
+        return palette
+
+    @classmethod
+    def _encode(cls, image: Image.Image) -> bytes:
+        buffer = io.BytesIO()
+        save_options = {'transparency': image.info['transparency']} if 'transparency' in image.info else {}
+        image.save(buffer, format='PNG', optimize=True, compress_level=cls.PNG_COMPRESS_LEVEL, **save_options)
+        return buffer.getvalue()
+
+    def _check_optimized(self) -> None:
+        if self._results is None:
+            raise ValueError("Files must be optimized first. Call optimize() first.")
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import sys
+    import time
+
+    # python QSnapPngOptimizer.py [lossless|quantize] <png or directory> ...
+    mode = sys.argv[1] if len(sys.argv) > 1 else QSnapPngOptimizer.LOSSLESS
+    paths = sys.argv[2:] or ['../../dist', '../../workshop']
+
+    optimizer = QSnapPngOptimizer(mode=mode)
+    for path in paths:
+        if Path(path).is_dir():
+            optimizer.add_directory(path)
+        else:
+            optimizer.add_files(path)
+
+    start = time.perf_counter()
+    optimizer.optimize(output_dir='optimized')
+    print(f"{optimizer.get_summary()} in {time.perf_counter() - start:.2f}s")
+    print(optimizer.get_stats().to_string())
+    print(optimizer.get_errors().to_string())
@@ -0,0 +1,474 @@
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from dataclasses import dataclass
+from typing import Optional, Union, Dict, List, Tuple, Iterator
+import numpy as np
+from PIL import Image
+import io
+import base64
+
+from QSnapSnapshotDiffEngine import QSnapSnapshotDiffEngine
+
+
+@dataclass
+class ChartMetadata:
+    img_name: str
+    y_label: str
+
+
+class QSnapRadarGridBuilder:
+    """
+    Builder class for small-multiples radar grids: one radar per application, N per page.
+
+    All radars of a page share one layout and one embedded gradient background image, and the trend markers
+    of the whole portfolio are classified once by QSnapSnapshotDiffEngine. A department with 300 applications
+    exports as a few pages instead of 300 renders.
+
+    Usage:
+        builder = QSnapRadarGridBuilder()
+        pages = builder.set_data(df).set_metadata(metadata).set_grid_size(4, 5).build()
+        builder.export_to_png('department_radars')
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    APPLICATION_COLUMN = 'Application'
+    CATEGORY_COLUMN = 'Category'
+
+    # Grid and cell size
+    DEFAULT_ROWS = 4
+    DEFAULT_COLUMNS = 4
+    DEFAULT_CELL_WIDTH = 300
+    DEFAULT_CELL_HEIGHT = 300
+    DEFAULT_IMAGE_SCALE = 2
+    HORIZONTAL_SPACING = 0.04
+    VERTICAL_SPACING = 0.06
+
+    # Page margins, needed to place the shared gradient behind each radar
+    MARGIN = {'l': 40, 'r': 40, 't': 80, 'b': 40}
+
+    # Error margin for trend detection
+    TREND_ERROR_MARGIN = 0.05  # 5% error margin
+
+    # Radar styling (same as QSnapRadarPlotBuilder)
+    PREVIOUS_LINE_COLOR = 'grey'
+    CURRENT_LINE_COLOR = 'rgb(30, 144, 255)'
+    CURRENT_FILL_COLOR = 'rgba(135, 206, 250, 0.4)'
+    MARKER_SIZE = 5
+    GRADIENT_OPACITY = 0.33
+    GRADIENT_ALPHA = 200
+
+    FONT_SIZE = 9
+    SUBPLOT_TITLE_FONT_SIZE = 12
+    TITLE_FONT_SIZE = 16
+
+    def __init__(self):
+        self._data_frame: Optional[pd.DataFrame] = None
+        self._metadata: Optional[ChartMetadata] = None
+        self._figures: List[go.Figure] = []
+        self._rows: int = self.DEFAULT_ROWS
+        self._columns: int = self.DEFAULT_COLUMNS
+        self._cell_width: int = self.DEFAULT_CELL_WIDTH
+        self._cell_height: int = self.DEFAULT_CELL_HEIGHT
+        self._image_scale: int = self.DEFAULT_IMAGE_SCALE
+        self._gradient_cache: Dict[Tuple[int, int, int, int, int], str] = {}
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_data(self, data: Union[pd.DataFrame, Dict]) -> 'QSnapRadarGridBuilder':
+        """
+        Set the portfolio scores.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain an 'Application' column, a 'Category' column and year columns,
+                  one row per (application, category). The last two years are drawn.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        if isinstance(data, dict):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data.copy()
+        else:
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        self._validate_data_frame(df)
+        self._data_frame = df
+
+        return self
+
+    def set_metadata(self, metadata: Union[ChartMetadata, Dict]) -> 'QSnapRadarGridBuilder':
+        """
+        Set the metadata for the grid.
+
+        Args:
+            metadata: Either a ChartMetadata object or a dictionary with metadata fields
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If metadata format is invalid
+        """
+        if isinstance(metadata, dict):
+            self._metadata = ChartMetadata(**metadata)
+        elif isinstance(metadata, ChartMetadata):
+            self._metadata = metadata
+        else:
+            raise ValueError("Metadata must be either a ChartMetadata object or a dictionary")
+
+        if not self._metadata.img_name:
+            raise ValueError("Metadata must include 'img_name'")
+
+        return self
+
+    def set_grid_size(self, rows: int = None, columns: int = None) -> 'QSnapRadarGridBuilder':
+        """
+        Set the number of radars per page.
+
+        Args:
+            rows: Radar rows per page (default: 4)
+            columns: Radar columns per page (default: 4)
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If a dimension is not positive
+        """
+        if rows is not None:
+            if rows < 1:
+                raise ValueError("Grid rows must be positive")
+            self._rows = rows
+        if columns is not None:
+            if columns < 1:
+                raise ValueError("Grid columns must be positive")
+            self._columns = columns
+
+        return self
+
+    def set_image_size(self, cell_width: int = None, cell_height: int = None,
+                       scale: int = None) -> 'QSnapRadarGridBuilder':
+        """
+        Set the size of one radar cell; the page size follows from the grid size.
+
+        The gradient background is drawn at the cell size when building: already built pages are built again.
+
+        Args:
+            cell_width: Cell width in pixels (default: 300)
+            cell_height: Cell height in pixels (default: 300)
+            scale: Image scale factor (default: 2)
+
+        Returns:
+            Self for method chaining
+        """
+        cell_size = (self._cell_width, self._cell_height)
+        if cell_width is not None:
+            self._cell_width = cell_width
+        if cell_height is not None:
+            self._cell_height = cell_height
+        if scale is not None:
+            self._image_scale = scale
+
+        if self._figures and (self._cell_width, self._cell_height) != cell_size:
+            self._figures = self._create_pages()
+
+        return self
+
+    def build(self) -> List[go.Figure]:
+        """
+        Build one figure per page.
+
+        Returns:
+            List of Plotly Figure objects, one per page
+
+        Raises:
+            ValueError: If data or metadata is not set
+        """
+        if self._data_frame is None:
+            raise ValueError("Data must be set before building. Call set_data() first.")
+        if self._metadata is None:
+            raise ValueError("Metadata must be set before building. Call set_metadata() first.")
+
+        self._figures = self._create_pages()
+        return self._figures
+
+    def export_to_png(self, filename: Optional[str] = None) -> List[str]:
+        """
+        Export every page to a PNG file, suffixed with its page number.
+
+        Args:
+            filename: Output filename (without extension). If None, uses metadata img_name.
+
+        Returns:
+            The written file names
+
+        Raises:
+            ValueError: If the grid hasn't been built yet
+        """
+        if not self._figures:
+            raise ValueError("Grid must be built before exporting. Call build() first.")
+
+        if filename is None:
+            filename = self._metadata.img_name
+
+        clean_filename = filename.strip().lower().replace(' ', '_')
+        width, height = self._get_page_size()
+        filenames = []
+
+        for page, figure in enumerate(self._figures, start=1):
+            page_filename = f"{clean_filename}_page_{page:02d}.png"
+            figure.write_image(page_filename, width=width, height=height, scale=self._image_scale, format="png")
+            filenames.append(page_filename)
+
+        return filenames
+
+    def to_images(self, image_format: str = "png") -> Iterator[bytes]:
+        """
+        Encode the pages in memory one at a time, with the same size as export_to_png().
+
+        Args:
+            image_format: Image format supported by Plotly (png, svg, jpeg, webp, pdf)
+
+        Yields:
+            One encoded image per page
+
+        Raises:
+            ValueError: If the grid hasn't been built yet
+        """
+        if not self._figures:
+            raise ValueError("Grid must be built before exporting. Call build() first.")
+
+        width, height = self._get_page_size()
+        for figure in self._figures:
+            yield figure.to_image(format=image_format, width=width, height=height, scale=self._image_scale)
+
+    def get_figures(self) -> List[go.Figure]:
+        """
+        Get the built pages.
+
+        Returns:
+            List of Plotly Figure objects (empty if not built yet)
+        """
+        return self._figures
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        for col in (self.APPLICATION_COLUMN, self.CATEGORY_COLUMN):
+            if col not in df.columns:
+                raise ValueError(f"DataFrame must contain a '{col}' column")
+
+        year_columns = self._get_years(df)
+        if not year_columns:
+            raise ValueError("DataFrame must contain at least one year column")
+        for col in year_columns:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                raise ValueError(f"Year column '{col}' must contain numeric values")
+
+    # ========== CHART CREATION METHODS ==========
+
+    def _create_pages(self) -> List[go.Figure]:
+        years = self._get_years(self._data_frame)[-2:]
+        engine = QSnapSnapshotDiffEngine(self.TREND_ERROR_MARGIN).set_data(
+            self._data_frame[[self.APPLICATION_COLUMN, self.CATEGORY_COLUMN] + years]
+        )
+
+        # Values of the last two years as an (applications, categories, 2) matrix, markers classified once
+        applications = engine.get_applications()
+        categories = engine.get_categories()
+        values = engine.get_value_matrix()
+        if len(years) == 2:
+            engine.compute()
+            marker_colors = engine.STATUS_COLORS[engine.get_status_matrix()[..., -1]]
+        else:
+            marker_colors = np.full(values.shape[:2], QSnapSnapshotDiffEngine.STATUS_COLORS[engine.NO_COMPARISON])
+
+        # Close every polygon at once
+        closed_values = np.concatenate([values, values[:, :1, :]], axis=1)
+        closed_colors = np.concatenate([marker_colors, marker_colors[:, :1]], axis=1)
+        closed_categories = categories + categories[:1]
+
+        per_page = self._rows * self._columns
+        pages = []
+        for start in range(0, len(applications), per_page):
+            page_apps = range(start, min(start + per_page, len(applications)))
+            pages.append(self._create_page(
+                [applications[i] for i in page_apps], closed_values[page_apps.start:page_apps.stop],
+                closed_colors[page_apps.start:page_apps.stop], closed_categories, years,
+                page=len(pages) + 1, num_pages=-(-len(applications) // per_page)
+            ))
+
+        return pages
+
+    def _create_page(self, applications: List[str], values: np.ndarray, marker_colors: np.ndarray,
+                     categories: List[str], years: List[str], page: int, num_pages: int) -> go.Figure:
+        fig = make_subplots(
+            rows=self._rows,
+            cols=self._columns,
+            specs=[[{'type': 'polar'}] * self._columns for _ in range(self._rows)],
+            subplot_titles=applications,
+            horizontal_spacing=self.HORIZONTAL_SPACING,
+            vertical_spacing=self.VERTICAL_SPACING
+        )
+
+        # Traces are added in one call, add_trace() per cell re-validates the whole figure each time
+        traces, rows, cols = [], [], []
+        for idx, application in enumerate(applications):
+            row, col = divmod(idx, self._columns)
+            show_legend = idx == 0
+
+            if len(years) == 2:
+                traces.append(go.Scatterpolar(
+                    r=values[idx, :, 0],
+                    theta=categories,
+                    mode='lines',
+                    line=dict(color=self.PREVIOUS_LINE_COLOR, dash='dot', width=1),
+                    name=years[0],
+                    legendgroup=years[0],
+                    showlegend=show_legend
+                ))
+                rows.append(row + 1)
+                cols.append(col + 1)
+
+            traces.append(go.Scatterpolar(
+                r=values[idx, :, -1],
+                theta=categories,
+                fill='toself',
+                fillcolor=self.CURRENT_FILL_COLOR,
+                line=dict(color=self.CURRENT_LINE_COLOR, width=1.5),
+                marker=dict(size=self.MARKER_SIZE, color=marker_colors[idx]),
+                name=years[-1],
+                legendgroup=years[-1],
+                showlegend=show_legend,
+                connectgaps=False
+            ))
+            rows.append(row + 1)
+            cols.append(col + 1)
+
+        fig.add_traces(traces, rows=rows, cols=cols)
+
+        return self._apply_layout(fig, len(applications), page, num_pages)
+
+    def _apply_layout(self, fig: go.Figure, num_cells: int, page: int, num_pages: int) -> go.Figure:
+        # One update for every polar subplot of the page
+        fig.update_polars(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 1],
+                tickvals=[0, 0.5, 1],
+                ticktext=['0', '0.5', '1'],
+                tickfont=dict(size=self.FONT_SIZE - 2)
+            ),
+            angularaxis=dict(
+                rotation=90,
+                direction="clockwise",
+                showticklabels=False
+            ),
+            bgcolor='rgba(0,0,0,0)'
+        )
+        fig.update_annotations(font_size=self.SUBPLOT_TITLE_FONT_SIZE)
+
+        title = self._metadata.img_name if num_pages == 1 else f"{self._metadata.img_name} ({page}/{num_pages})"
+        fig.update_layout(
+            title={'text': title, 'x': 0.5, 'xanchor': 'center', 'font': {'size': self.TITLE_FONT_SIZE}},
+            margin=self.MARGIN,
+            font={'size': self.FONT_SIZE},
+            showlegend=True,
+            legend={'orientation': 'h', 'x': 0.5, 'xanchor': 'center', 'y': 1.0, 'yanchor': 'bottom'},
+            plot_bgcolor='white',
+            hovermode=False,
+            images=[
+                dict(
+                    source=self._get_gradient_image(fig, num_cells),
+                    xref="paper",
+                    yref="paper",
+                    x=0,
+                    y=1,
+                    sizex=1,
+                    sizey=1,
+                    sizing="stretch",
+                    xanchor="left",
+                    yanchor="top",
+                    layer="below",
+                    opacity=self.GRADIENT_OPACITY
+                )
+            ]
+        )
+
+        return fig
+
+    # ========== HELPER METHODS ==========
+
+    def _get_years(self, df: pd.DataFrame) -> List[str]:
+        return [col for col in df.columns if col not in (self.APPLICATION_COLUMN, self.CATEGORY_COLUMN)]
+
+    def _get_page_size(self) -> Tuple[int, int]:
+        width = self._columns * self._cell_width + self.MARGIN['l'] + self.MARGIN['r']
+        height = self._rows * self._cell_height + self.MARGIN['t'] + self.MARGIN['b']
+        return width, height
+
+    def _get_gradient_image(self, fig: go.Figure, num_cells: int) -> str:
+        """One background image holding the radial gradient of every cell of the page, cached per layout and size"""
+        key = (self._rows, self._columns, num_cells, self._cell_width, self._cell_height)
+        if key not in self._gradient_cache:
+            width, height = self._get_page_size()
+            paper_width = width - self.MARGIN['l'] - self.MARGIN['r']
+            paper_height = height - self.MARGIN['t'] - self.MARGIN['b']
+
+            y, x = np.mgrid[0:paper_height, 0:paper_width]
+            img_array = np.zeros((paper_height, paper_width, 4), dtype=np.uint8)
+
+            for idx in range(num_cells):
+                domain = fig.layout[f"polar{idx + 1 if idx else ''}"].domain
+                center_x = (domain.x[0] + domain.x[1]) / 2 * paper_width
+                center_y = (1 - (domain.y[0] + domain.y[1]) / 2) * paper_height
+                radius = min((domain.x[1] - domain.x[0]) * paper_width, (domain.y[1] - domain.y[0]) * paper_height) / 2
+
+                normalized_dist = np.hypot(x - center_x, y - center_y) / radius
+                inside = normalized_dist <= 1.0
+
+                # Interpolate from light red (center) to light green (border)
+                img_array[inside, 0] = (255 * (1 - normalized_dist[inside])).astype(np.uint8)
+                img_array[inside, 1] = (255 * normalized_dist[inside]).astype(np.uint8)
+                img_array[inside, 3] = self.GRADIENT_ALPHA
+
+            buffer = io.BytesIO()
+            Image.fromarray(img_array, mode='RGBA').save(buffer, format='PNG', optimize=True)
+            self._gradient_cache[key] = f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+        return self._gradient_cache[key]
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    rng = np.random.default_rng(2025)
+    categories = ['User satisfaction', 'Product stability', 'Fix reactivity', 'Documentation',
+                  'Policy adherence', 'FAT practices', 'UAT practices', 'Static quality',
+                  'Unit coverage', 'Automation practices']
+    applications = [f"A{idx:02d}" for idx in range(40)]
+
+    data = pd.DataFrame({
+        'Application': np.repeat(applications, len(categories)),
+        'Category': categories * len(applications),
+        '2024': rng.random(len(applications) * len(categories)).round(2),
+        '2025': rng.random(len(applications) * len(categories)).round(2)
+    })
+
+    metadata = {
+        'img_name': 'Department radars',
+        'y_label': 'Score'
+    }
+
+    builder = QSnapRadarGridBuilder()
+    pages = builder.set_data(data).set_metadata(metadata).set_grid_size(4, 5).build()
+    pages[0].show()
+    # builder.export_to_png()
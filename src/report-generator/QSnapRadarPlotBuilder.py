@@ -7,6 +7,8 @@ from PIL import Image
 import io
 import base64
 
+from QSnapSnapshotDiffEngine import QSnapSnapshotDiffEngine
+
 @dataclass
 class ChartMetadata:
     img_name: str
@@ -22,6 +24,15 @@ class QSnapRadarPlotBuilder:
     # Error margin for trend detection
     TREND_ERROR_MARGIN = 0.05  # 5% error margin
 
+    # Multi-series mode styling
+    FOCUS_LINE_COLOR = 'rgb(30, 144, 255)'
+    FOCUS_FILL_COLOR = 'rgba(135, 206, 250, 0.4)'
+    HISTORY_LINE_COLOR = 'grey'
+    HISTORY_MARKER_SIZE = 5
+    HISTORY_LEGEND_GROUP = 'history'
+    REFERENCE_LINE_COLORS = ['rgb(107, 33, 168)', 'rgb(217, 119, 6)', 'rgb(15, 118, 110)', 'rgb(190, 24, 93)']
+    REFERENCE_LINE_DASH = 'dash'
+
     def __init__(self):
         self._data_frame: Optional[pd.DataFrame] = None
         self._original_data_frame: Optional[pd.DataFrame] = None
@@ -30,6 +41,9 @@ class QSnapRadarPlotBuilder:
         self._image_width: int = self.DEFAULT_IMAGE_WIDTH
         self._image_height: int = self.DEFAULT_IMAGE_HEIGHT
         self._image_scale: int = self.DEFAULT_IMAGE_SCALE
+        self._trend_marker_colors: Optional[List[str]] = None
+        self._series: Optional[List[str]] = None
+        self._references: List[str] = []
 
 
     def set_data(self, data: Union[pd.DataFrame, Dict]) -> 'QSnapRadarPlotBuilder':
@@ -60,6 +74,27 @@ class QSnapRadarPlotBuilder:
         return self
 
 
+    def set_trend_markers(self, marker_colors: Optional[List[str]]) -> 'QSnapRadarPlotBuilder':
+        # Precomputed marker colors (one per category), e.g. from QSnapSnapshotDiffEngine.get_marker_colors().
+        # None classifies the last two years again when building.
+        self._trend_marker_colors = list(marker_colors) if marker_colors is not None else None
+
+        return self
+
+
+    def set_series(self, series: Optional[List[str]], references: Optional[List[str]] = None) -> 'QSnapRadarPlotBuilder':
+        # Multi-series mode: 'series' are ordered columns (e.g. five seasons), the last one being the focus.
+        # All the previous ones share a single trace, 'references' (e.g. platform average, department median)
+        # get one outline trace each. None goes back to the default "last two years" mode.
+        if series is not None and len(series) == 0:
+            raise ValueError("Series must contain at least one column")
+
+        self._series = list(series) if series is not None else None
+        self._references = list(references) if references is not None else []
+
+        return self
+
+
     def set_image_size(self, width: int = None, height: int = None, scale: int = None) -> 'QSnapRadarPlotBuilder':
         if width is not None:
             self._image_width = width
@@ -76,6 +111,10 @@ class QSnapRadarPlotBuilder:
             raise ValueError("Data must be set before building. Call set_data() first.")
         if self._metadata is None:
             raise ValueError("Metadata must be set before building. Call set_metadata() first.")
+        if self._trend_marker_colors is not None and len(self._trend_marker_colors) != len(self._get_y_axis()):
+            raise ValueError("Trend markers must contain one color per category")
+        if self._series is not None:
+            self._validate_series()
 
         self._figure = self._create_chart()
         return self._figure
@@ -98,6 +137,17 @@ class QSnapRadarPlotBuilder:
             format="png"
         )
 
+    def to_image(self, image_format: str = "png") -> bytes:
+        if self._figure is None:
+            raise ValueError("Chart must be built before exporting. Call build() first.")
+
+        return self._figure.to_image(
+            format=image_format,
+            width=self._image_width,
+            height=self._image_height,
+            scale=self._image_scale
+        )
+
     def get_figure(self) -> Optional[go.Figure]:
         return self._figure
 
@@ -119,6 +169,13 @@ class QSnapRadarPlotBuilder:
                 raise ValueError(f"Year column '{col}' must contain numeric values")
 
 
+    def _validate_series(self) -> None:
+        columns = self._get_x_axis()
+        unknown = [col for col in self._series + self._references if col not in columns]
+        if unknown:
+            raise ValueError(f"Series columns {unknown} not found in data. Available columns: {columns}")
+
+
     def _validate_metadata(self) -> None:
         if not self._metadata.img_name:
             raise ValueError("Metadata must include 'img_name'")
@@ -132,7 +189,10 @@ class QSnapRadarPlotBuilder:
         years = self._get_x_axis()
         categories = self._get_y_axis()
 
-        fig = self._add_radars(years, categories)
+        if self._series is not None:
+            fig = self._add_multi_series_radars(categories)
+        else:
+            fig = self._add_radars(years, categories)
         fig = self._apply_layout(fig)
 
         return fig
@@ -166,29 +226,16 @@ class QSnapRadarPlotBuilder:
                 ))
             # Second of last two years (most recent): Light blue partially transparent fill with blue solid line
             elif idx == 1:
-                # Calculate marker colors based on trend
-                previous_year_values = self._data_frame[last_two_years[0]].tolist()
-                current_year_values = value
-                marker_colors = []
-
-                for i, category in enumerate(categories):
-                    prev_val = previous_year_values[i]
-                    curr_val = current_year_values[i]
-                    diff = curr_val - prev_val
-
-                    if pd.isna(prev_val) or pd.isna(curr_val):
-                        # If current value exists but previous doesn't, use blue (no comparison possible)
-                        marker_colors.append('rgb(30, 144, 255)')
-                    else:
-                        if diff > self.TREND_ERROR_MARGIN:
-                            # Improved: green
-                            marker_colors.append('green')
-                        elif diff < -self.TREND_ERROR_MARGIN:
-                            # Degraded: red
-                            marker_colors.append('red')
-                        else:
-                            # Stable (within error margin): blue
-                            marker_colors.append('grey')
+                # Calculate marker colors based on trend, unless precomputed for the whole portfolio
+                if self._trend_marker_colors is not None:
+                    marker_colors = self._trend_marker_colors
+                else:
+                    statuses = QSnapSnapshotDiffEngine.classify(
+                        self._data_frame[last_two_years[0]].to_numpy(dtype=float),
+                        np.asarray(value, dtype=float),
+                        self.TREND_ERROR_MARGIN
+                    )
+                    marker_colors = QSnapSnapshotDiffEngine.STATUS_COLORS[statuses].tolist()
 
                 # Add the first color again to close the loop
                 marker_colors_closed = marker_colors + [marker_colors[0]]
@@ -215,6 +262,86 @@ class QSnapRadarPlotBuilder:
         return fig
 
 
+    def _add_multi_series_radars(self, categories: List[str]) -> go.Figure:
+        fig = go.Figure()
+
+        # (categories + 1, series) matrix, closed by repeating the first category row
+        values = self._data_frame[self._series].to_numpy(dtype=float)
+        closed_values = np.vstack([values, values[:1]])
+        closed_categories = np.append(categories, categories[0])
+
+        # Markers of every series against its predecessor, in one selection over the whole matrix
+        statuses = np.full(closed_values.shape, QSnapSnapshotDiffEngine.NO_COMPARISON, dtype=np.int8)
+        statuses[:, 1:] = QSnapSnapshotDiffEngine.classify(
+            closed_values[:, :-1], closed_values[:, 1:], self.TREND_ERROR_MARGIN
+        )
+        marker_colors = QSnapSnapshotDiffEngine.STATUS_COLORS[statuses]
+        if self._trend_marker_colors is not None:
+            marker_colors[:, -1] = self._trend_marker_colors + self._trend_marker_colors[:1]
+
+        # History: all series but the focus in a single trace, polygons separated by a None gap. The trace count
+        # stays constant whatever the number of seasons; the hover text tells each season apart.
+        history = self._series[:-1]
+        if history:
+            num_history = len(history)
+            gap = np.full((1, num_history), np.nan)
+            fig.add_trace(go.Scatterpolar(
+                r=np.vstack([closed_values[:, :-1], gap]).T.ravel(),
+                theta=np.tile(np.append(closed_categories, None), num_history),
+                text=np.repeat(history, len(closed_categories) + 1),
+                hovertemplate='%{text}<br>%{theta}: %{r:.0%}<extra></extra>',
+                mode='lines+markers',
+                line=dict(
+                    color=self.HISTORY_LINE_COLOR,
+                    dash='dot',
+                    width=1
+                ),
+                marker=dict(
+                    size=self.HISTORY_MARKER_SIZE,
+                    color=np.vstack([marker_colors[:, :-1], np.full((1, num_history), 'white', dtype=object)]).T.ravel()
+                ),
+                name=history[0] if num_history == 1 else f"{history[0]} - {history[-1]}",
+                legendgroup=self.HISTORY_LEGEND_GROUP,
+                connectgaps=False
+            ))
+
+        for idx, reference in enumerate(self._references):
+            reference_values = self._data_frame[reference].to_numpy(dtype=float)
+            fig.add_trace(go.Scatterpolar(
+                r=np.append(reference_values, reference_values[0]),
+                theta=closed_categories,
+                mode='lines',
+                line=dict(
+                    color=self.REFERENCE_LINE_COLORS[idx % len(self.REFERENCE_LINE_COLORS)],
+                    dash=self.REFERENCE_LINE_DASH,
+                    width=2
+                ),
+                name=reference,
+                connectgaps=False
+            ))
+
+        fig.add_trace(go.Scatterpolar(
+            r=closed_values[:, -1],
+            theta=closed_categories,
+            fill='toself',
+            fillcolor=self.FOCUS_FILL_COLOR,
+            line=dict(
+                color=self.FOCUS_LINE_COLOR,
+                dash='solid',
+                width=2
+            ),
+            marker=dict(
+                size=8,
+                color=marker_colors[:, -1],
+                line=dict(width=1, color='white')
+            ),
+            name=self._series[-1],
+            connectgaps=False
+        ))
+
+        return fig
+
+
     def _apply_layout(self, fig: go.Figure) -> go.Figure:
         fig.update_layout(
             polar=dict(
@@ -323,3 +450,9 @@ if __name__ == "__main__":
     fig = builder.set_data(data).set_metadata(metadata).set_image_size(600, 600).build()
     fig.show()
     # builder.export_to_png()
+
+    # Multi-series mode: five seasons of the application against its platform average
+    data['2021'] = [0.50, 0.40, 0.70, 0.90, 0.95, 0.50, 0.10, 0.60, 0.30, 0.90]
+    data['Platform average'] = [0.55, 0.60, 0.75, 0.80, 0.72, 0.60, 0.30, 0.55, 0.50, 0.60]
+    fig = builder.set_data(data).set_series(['2021', '2022', '2023', '2024', '2025'], ['Platform average']).build()
+    fig.show()
@@ -0,0 +1,406 @@
+import os
+import secrets
+import socket
+import stat
+import tempfile
+import threading
+import time
+import getpass
+import plotly.io as pio
+from pathlib import Path
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client, Connection
+from typing import Optional, Union, Dict, List, Tuple, Any
+
+from QSnapChartRenderer import ChartSpec, render, render_image
+from QSnapChartServer import LruCache
+
+
+# Listener address: (host, port) for a local TCP socket, or a file path for a Unix domain socket
+Address = Union[Tuple[str, int], str]
+
+# Environment variable overriding the generated key, on both sides
+AUTHKEY_VARIABLE = 'QSNAP_RENDER_KEY'
+
+
+def get_runtime_directory() -> Path:
+    """
+    Get the private directory of the daemon socket and key file, created on first use.
+
+    Returns:
+        Directory only accessible to the current user
+
+    Raises:
+        ValueError: If the directory exists but is owned by another user or accessible to others
+    """
+    base = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    directory = Path(base) / f"qsnap-render-{getpass.getuser()}"
+    directory.mkdir(mode=0o700, exist_ok=True)
+
+    if os.name == 'posix':
+        status = directory.stat()
+        if status.st_uid != os.getuid() or stat.S_IMODE(status.st_mode) & 0o077:
+            raise ValueError(f"Render directory {directory} must be owned by the current user and private (0700)")
+    return directory
+
+
+def get_default_address() -> Address:
+    # Unix domain socket in the private directory where available, local TCP elsewhere
+    if hasattr(socket, 'AF_UNIX'):
+        return str(get_runtime_directory() / 'render.sock')
+    return '127.0.0.1', 8051
+
+
+def get_key_file() -> Path:
+    return get_runtime_directory() / 'render.key'
+
+
+def read_authkey() -> bytes:
+    """
+    Get the key of the running daemon: QSNAP_RENDER_KEY if set, otherwise the key file written at daemon start.
+
+    Raises:
+        ValueError: If no key is available (daemon not started)
+    """
+    if os.environ.get(AUTHKEY_VARIABLE):
+        return os.environ[AUTHKEY_VARIABLE].encode('utf-8')
+    key_file = get_key_file()
+    if not key_file.exists():
+        raise ValueError(f"No render key in {key_file}: start the daemon first or set {AUTHKEY_VARIABLE}")
+    return key_file.read_bytes()
+
+
+class QSnapRenderDaemon:
+    """
+    Long-lived render worker keeping the Python runtime, Plotly and the image export engine warm.
+
+    A report command otherwise pays, on every run, the interpreter startup, the Plotly and pandas imports and
+    the start of the export engine (Kaleido drives a headless browser). The daemon pays them once: it imports
+    everything, starts Kaleido's persistent browser when available, renders a warm-up chart, then serves render
+    jobs (ChartSpec objects) sent by QSnapRenderClient over a local socket and sends back the encoded images.
+    Repeated specs are answered from an LRU cache.
+
+    Requests are pickled (multiprocessing.connection), so whoever can connect can run code in the daemon. Only the
+    current user can: the daemon listens on a Unix domain socket in a private (0700) directory where available,
+    and every connection must prove a random key generated at start and written to a 0600 file of that directory,
+    read by QSnapRenderClient (QSNAP_RENDER_KEY, when set on both sides, replaces it). Jobs of concurrent clients
+    are rendered one at a time, the export engine being a single browser.
+
+    Usage:
+        daemon = QSnapRenderDaemon().start()                # or: python QSnapRenderDaemon.py serve
+        with QSnapRenderClient() as client:
+            png = client.render(spec)
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    AUTHKEY_BYTES = 32
+
+    DEFAULT_CACHE_ENTRIES = 256
+
+    # 'json' gives the Plotly figure JSON, the other formats go through the export engine
+    IMAGE_FORMATS = ['png', 'svg', 'jpeg', 'webp', 'pdf', 'json']
+
+    # Rendered at start to load Plotly.js in the export engine before the first job
+    WARM_UP_SPEC = ChartSpec.create(
+        'bar',
+        {'Category': ['Good', 'Bad'], '2024': [1, 1], '2025': [2, 0]},
+        {'img_name': 'Warm up', 'y_label': 'Warm up'},
+        width=100,
+        height=100,
+        scale=1
+    )
+
+    def __init__(self, address: Optional[Address] = None, cache_entries: int = DEFAULT_CACHE_ENTRIES):
+        self._address = address if address is not None else get_default_address()
+        self._authkey: Optional[bytes] = None
+        self._key_file: Optional[Path] = None
+        self._cache = LruCache(cache_entries)
+        self._listener: Optional[Listener] = None
+        self._render_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {'jobs': 0, 'renders': 0, 'errors': 0, 'render_seconds': 0.0}
+        self._engine_status = 'not started'
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def start(self, blocking: bool = False) -> 'QSnapRenderDaemon':
+        """
+        Warm the export engine up and start serving.
+
+        Args:
+            blocking: True serves in the calling thread until a client sends 'shutdown'
+
+        Returns:
+            Self for method chaining
+        """
+        self._warm_up()
+        self._remove_stale_socket()
+        self._authkey = self._create_authkey()
+        self._listener = Listener(self._address, authkey=self._authkey)
+        self._address = self._listener.address
+        if blocking:
+            self._serve()
+        else:
+            threading.Thread(target=self._serve, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            # Closing the socket does not interrupt a pending accept(): wake it up with a last connection
+            try:
+                Client(self._address, authkey=self._authkey).close()
+            except OSError:
+                pass
+            listener.close()
+            if self._key_file is not None:
+                self._key_file.unlink(missing_ok=True)
+                self._key_file = None
+            self._stop_engine()
+
+    def get_address(self) -> Address:
+        return self._address
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {**self._stats, 'engine': self._engine_status, 'cache_hits': self._cache.hits,
+                    'cache_entries': len(self._cache)}
+
+    # ========== JOB HANDLING ==========
+
+    def _serve(self) -> None:
+        while self._listener is not None:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                # Listener closed by stop(), or a client failing the authentication
+                continue
+            threading.Thread(target=self._handle_connection, args=(connection,), daemon=True).start()
+
+    def _handle_connection(self, connection: Connection) -> None:
+        with connection:
+            while True:
+                try:
+                    command, payload = connection.recv()
+                except (EOFError, OSError):
+                    return
+
+                if command == 'shutdown':
+                    # Stopped before answering: once the client gets the answer, the key file is gone
+                    self.stop()
+                    connection.send(('ok', None))
+                    return
+                connection.send(self._handle(command, payload))
+
+    def _handle(self, command: str, payload: Any) -> Tuple[str, Any]:
+        if command == 'ping':
+            return 'ok', None
+        if command == 'stats':
+            return 'ok', self.get_stats()
+        if command == 'render':
+            spec, image_format = payload
+            return self._render_job(spec, image_format)
+        if command == 'render_batch':
+            specs, image_format = payload
+            return 'ok', [self._render_job(spec, image_format) for spec in specs]
+        return 'error', f"Unknown command '{command}'"
+
+    def _render_job(self, spec: ChartSpec, image_format: str) -> Tuple[str, Any]:
+        self._count('jobs')
+        if image_format not in self.IMAGE_FORMATS:
+            self._count('errors')
+            return 'error', f"Unsupported format '{image_format}'. Supported: {self.IMAGE_FORMATS}"
+
+        content = self._cache.get((spec, image_format))
+        if content is not None:
+            return 'ok', content
+
+        try:
+            with self._render_lock:
+                start = time.perf_counter()
+                content = self._build(spec, image_format)
+                elapsed = time.perf_counter() - start
+        except Exception as error:
+            # Invalid data, or no export engine: report it to the client, keep serving
+            self._count('errors')
+            return 'error', f"Cannot render '{spec.kind}' chart: {type(error).__name__}: {error}"
+
+        self._cache.put((spec, image_format), content)
+        with self._stats_lock:
+            self._stats['renders'] += 1
+            self._stats['render_seconds'] += elapsed
+        return 'ok', content
+
+    # ========== HELPER METHODS ==========
+
+    def _create_authkey(self) -> bytes:
+        if os.environ.get(AUTHKEY_VARIABLE):
+            return os.environ[AUTHKEY_VARIABLE].encode('utf-8')
+
+        authkey = secrets.token_bytes(self.AUTHKEY_BYTES)
+        key_file = get_key_file()
+        key_file.unlink(missing_ok=True)
+        # Created 0600 at once: the key is never readable by others, even briefly
+        descriptor = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(authkey)
+        self._key_file = key_file
+        return authkey
+
+    def _remove_stale_socket(self) -> None:
+        # The socket file of a daemon that did not stop cleanly blocks the address: remove it if nobody answers
+        if not isinstance(self._address, str) or not os.path.exists(self._address):
+            return
+        with socket.socket(socket.AF_UNIX) as probe:
+            try:
+                probe.connect(self._address)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self._address)
+                return
+        raise ValueError(f"A render daemon already listens on {self._address}")
+
+    @staticmethod
+    def _build(spec: ChartSpec, image_format: str) -> bytes:
+        if image_format == 'json':
+            return pio.to_json(render(spec), validate=False, pretty=False).encode('utf-8')
+        return render_image(spec, image_format)
+
+    def _warm_up(self) -> None:
+        try:
+            import kaleido
+            # Kaleido >= 1.0: one browser kept open for all the exports instead of one per export
+            if hasattr(kaleido, 'start_sync_server'):
+                kaleido.start_sync_server(silence_warnings=True)
+            render_image(self.WARM_UP_SPEC, 'png')
+            self._engine_status = 'warm'
+        except Exception as error:
+            # JSON jobs can still be served, image jobs will report the engine error
+            self._engine_status = f"unavailable ({type(error).__name__}: {str(error).strip().splitlines()[0]})"
+            render(self.WARM_UP_SPEC)
+
+    def _stop_engine(self) -> None:
+        try:
+            import kaleido
+            if hasattr(kaleido, 'stop_sync_server'):
+                kaleido.stop_sync_server(silence_warnings=True)
+        except Exception:
+            pass
+
+    def _count(self, stat: str) -> None:
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+
+class QSnapRenderClient:
+    """
+    Client of QSnapRenderDaemon. Keeps one connection open, so a render costs one local round trip.
+    By default it connects to the daemon of the current user with the key of its key file.
+
+    Usage:
+        with QSnapRenderClient() as client:
+            png = client.render(spec)
+            images = client.render_batch(specs, 'svg')
+    """
+
+    def __init__(self, address: Optional[Address] = None, authkey: Optional[bytes] = None):
+        # Default: the socket and the key file of the daemon of the current user (ValueError if not started)
+        self._connection = Client(address if address is not None else get_default_address(),
+                                  authkey=authkey if authkey is not None else read_authkey())
+
+    def __enter__(self) -> 'QSnapRenderClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def render(self, spec: ChartSpec, image_format: str = 'png') -> bytes:
+        """
+        Render one chart in the daemon.
+
+        Args:
+            spec: Chart spec
+            image_format: One of QSnapRenderDaemon.IMAGE_FORMATS
+
+        Returns:
+            Encoded image
+
+        Raises:
+            ValueError: If the daemon cannot render the chart
+        """
+        return self._check(self._request('render', (spec, image_format)))
+
+    def render_batch(self, specs: List[ChartSpec], image_format: str = 'png') -> List[bytes]:
+        """
+        Render several charts in one round trip.
+
+        Args:
+            specs: Chart specs
+            image_format: One of QSnapRenderDaemon.IMAGE_FORMATS
+
+        Returns:
+            Encoded images, in spec order
+
+        Raises:
+            ValueError: If the daemon cannot render one of the charts
+        """
+        return [self._check(result) for result in self._request('render_batch', (specs, image_format))[1]]
+
+    def ping(self) -> bool:
+        return self._request('ping')[0] == 'ok'
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self._request('stats')[1]
+
+    def shutdown(self) -> None:
+        self._request('shutdown')
+
+    # ========== HELPER METHODS ==========
+
+    def _request(self, command: str, payload: Any = None) -> Tuple[str, Any]:
+        self._connection.send((command, payload))
+        return self._connection.recv()
+
+    @staticmethod
+    def _check(result: Tuple[str, Any]) -> Any:
+        status, content = result
+        if status != 'ok':
+            raise ValueError(content)
+        return content
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import sys
+
+    # python QSnapRenderDaemon.py serve   -> run the daemon until a client sends 'shutdown'
+    if sys.argv[1:2] == ['serve']:
+        QSnapRenderDaemon().start(blocking=True)
+        sys.exit()
+
+    daemon = QSnapRenderDaemon().start()
+    print(daemon.get_stats()['engine'])
+
+    bar_spec = ChartSpec.create(
+        'bar',
+        data={
+            'Category': ['Good', 'Average', 'Bad', 'Unknown'],
+            '2023': [22, 18, 9, 5],
+            '2024': [34, 12, 5, 1]
+        },
+        metadata={'img_name': 'Coverage Score Trend', 'y_label': 'Coverage score'}
+    )
+
+    with QSnapRenderClient(daemon.get_address()) as client:
+        image_format = 'png' if daemon.get_stats()['engine'] == 'warm' else 'json'
+        for attempt in range(3):
+            start = time.perf_counter()
+            content = client.render(bar_spec, image_format)
+            print(f"{image_format}: {len(content)} bytes in {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(client.get_stats())
+        client.shutdown()
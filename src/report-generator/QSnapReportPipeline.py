@@ -0,0 +1,246 @@
+import queue
+import threading
+import zipfile
+import pandas as pd
+import plotly.graph_objects as go
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union, Dict, List, Iterable, Iterator, Tuple, Any, Callable
+
+from QSnapChartRenderer import RASTER_FORMATS, downsample_image
+
+
+@dataclass
+class ChartJob:
+    builder_class: type
+    data: Union[pd.DataFrame, Dict]
+    metadata: Union[Dict, Any]
+    chart_id: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    scale: Optional[int] = None
+
+    def __post_init__(self):
+        if self.chart_id is None:
+            img_name = self.metadata['img_name'] if isinstance(self.metadata, dict) else self.metadata.img_name
+            self.chart_id = img_name.strip().lower().replace(' ', '_')
+
+
+class DirectorySink:
+    """Write every image to <directory>/<chart_id>.<format>"""
+
+    def __init__(self, directory: Union[str, Path], image_format: str = 'png'):
+        self._directory = Path(directory)
+        self._image_format = image_format
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, chart_id: str, image: bytes) -> None:
+        (self._directory / f"{chart_id}.{self._image_format}").write_bytes(image)
+
+    def close(self) -> None:
+        pass
+
+
+class ZipSink:
+    """Append every image to a single zip bundle, one entry at a time"""
+
+    def __init__(self, path: Union[str, Path], image_format: str = 'png'):
+        self._image_format = image_format
+        # Images are already compressed, deflating them again costs time for no gain
+        self._zip_file = zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED)
+
+    def write(self, chart_id: str, image: bytes) -> None:
+        self._zip_file.writestr(f"{chart_id}.{self._image_format}", image)
+
+    def close(self) -> None:
+        self._zip_file.close()
+
+
+class CallbackSink:
+    """Hand every image to a callable, e.g. a wiki upload function"""
+
+    def __init__(self, callback: Callable[[str, bytes], Any]):
+        self._callback = callback
+
+    def write(self, chart_id: str, image: bytes) -> None:
+        self._callback(chart_id, image)
+
+    def close(self) -> None:
+        pass
+
+
+class QSnapReportPipeline:
+    """
+    Streaming report pipeline: charts are built, encoded and handed to a sink one at a time.
+
+    render() is a generator, so a chart is only built when the consumer asks for the next one, and the
+    figure is released as soon as its image is yielded. Peak memory stays the one of a single chart
+    (plus 'prefetch' encoded images when rendering runs ahead of a slow sink), whatever the number of charts.
+
+    With resolutions (chart id suffix -> scale factor, overriding the job scales), every chart is rendered once
+    at the largest requested scale and the smaller ones are downsampled from it: wiki image, index thumbnail and
+    print version for little more than the cost of one render. Only for raster formats.
+
+    Usage:
+        pipeline = QSnapReportPipeline()
+        for chart_id, image in pipeline.render(jobs):
+            ...
+        pipeline.run(jobs, ZipSink('season-2025.zip'), prefetch=2)
+        QSnapReportPipeline(resolutions={'': 2, '_thumbnail': 0.5, '_print': 4}).run(jobs, sink)
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    DEFAULT_IMAGE_FORMAT = 'png'
+    SUPPORTED_IMAGE_FORMATS = ['png', 'svg', 'jpeg', 'webp', 'pdf']
+
+    # How often a blocked prefetch thread checks whether the consumer stopped
+    PREFETCH_POLL_SECONDS = 0.1
+
+    # Marks the end of the stream in the prefetch queue
+    _END_OF_STREAM = object()
+
+    def __init__(self, image_format: str = DEFAULT_IMAGE_FORMAT, resolutions: Optional[Dict[str, float]] = None):
+        if image_format not in self.SUPPORTED_IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format '{image_format}'. Supported: {self.SUPPORTED_IMAGE_FORMATS}")
+        if resolutions is not None:
+            if image_format not in RASTER_FORMATS:
+                raise ValueError(f"Resolutions need a raster format. Supported: {list(RASTER_FORMATS)}")
+            if not resolutions or min(resolutions.values()) <= 0:
+                raise ValueError("Resolutions must hold at least one positive scale")
+        self._image_format = image_format
+        self._resolutions = dict(resolutions) if resolutions is not None else None
+
+    # ========== PUBLIC API ==========
+
+    def render(self, jobs: Iterable[ChartJob]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Build and encode the charts lazily.
+
+        Args:
+            jobs: Chart jobs, consumed one at a time (a generator keeps the job list itself out of memory)
+
+        Yields:
+            (chart_id, encoded_image). Builders returning several figures (e.g. grid pages) yield
+            one image per figure, suffixed with its page number. With resolutions, one image per
+            resolution, suffixed with its resolution suffix.
+        """
+        scale = max(self._resolutions.values()) if self._resolutions is not None else None
+        for job in jobs:
+            builder = job.builder_class()
+            built = builder.set_data(job.data).set_metadata(job.metadata).set_image_size(
+                job.width, job.height, scale or job.scale
+            ).build()
+
+            if isinstance(built, go.Figure):
+                yield from self._emit(job.chart_id, builder.to_image(self._image_format), scale)
+            else:
+                for page, image in enumerate(builder.to_images(self._image_format), start=1):
+                    yield from self._emit(f"{job.chart_id}_page_{page:02d}", image, scale)
+
+    def run(self, jobs: Iterable[ChartJob], sink: Any, prefetch: int = 0) -> int:
+        """
+        Stream all the charts into a sink.
+
+        Args:
+            jobs: Chart jobs
+            sink: Any object with write(chart_id, image) and close(), e.g. DirectorySink, ZipSink or CallbackSink
+            prefetch: Number of images rendered ahead in a background thread while the sink writes.
+                      0 renders and writes alternately in the calling thread.
+
+        Returns:
+            Number of images written
+        """
+        stream = self.render(jobs) if prefetch <= 0 else self._prefetch(self.render(jobs), prefetch)
+        count = 0
+
+        try:
+            for chart_id, image in stream:
+                sink.write(chart_id, image)
+                count += 1
+        finally:
+            # Stops the prefetch thread at once if the sink failed
+            stream.close()
+            sink.close()
+
+        return count
+
+    # ========== HELPER METHODS ==========
+
+    def _emit(self, chart_id: str, image: bytes, scale: Optional[float]) -> Iterator[Tuple[str, bytes]]:
+        if self._resolutions is None:
+            yield chart_id, image
+            return
+        for suffix, resized in downsample_image(image, scale, self._resolutions, self._image_format).items():
+            yield f"{chart_id}{suffix}", resized
+
+    def _prefetch(self, stream: Iterator[Tuple[str, bytes]], size: int) -> Iterator[Tuple[str, bytes]]:
+        """
+        Run the stream in a background thread through a bounded queue: the producer blocks when it is full.
+
+        If the consumer stops early (sink error, generator closed), the producer is told to stop and the queue
+        is drained, so the thread ends and the prefetched images are released.
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=size)
+        errors: List[BaseException] = []
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    buffer.put(item, timeout=self.PREFETCH_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            try:
+                for item in stream:
+                    if not put(item):
+                        break
+            except BaseException as error:
+                errors.append(error)
+            finally:
+                put(self._END_OF_STREAM)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while (item := buffer.get()) is not self._END_OF_STREAM:
+                yield item
+        finally:
+            stopped.set()
+            while not buffer.empty():
+                buffer.get_nowait()
+            producer.join()
+
+        if errors:
+            raise errors[0]
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    from QSnapBarChartBuilder import QSnapBarChartBuilder
+
+    def season_jobs():
+        # Jobs are generated lazily too, so the data of a chart only exists while it is rendered
+        for metric in ['Coverage score', 'Quality score', 'Documentation score']:
+            yield ChartJob(
+                builder_class=QSnapBarChartBuilder,
+                data={
+                    'Category': ['Good', 'Average', 'Bad', 'Unknown'],
+                    '2023': [22, 18, 9, 5],
+                    '2024': [34, 12, 5, 1]
+                },
+                metadata={'img_name': f"{metric} Trend", 'y_label': metric},
+                width=600,
+                height=600
+            )
+
+    pipeline = QSnapReportPipeline()
+    written = pipeline.run(season_jobs(), ZipSink('season_charts.zip'), prefetch=2)
+    print(f"{written} charts written")
@@ -0,0 +1,422 @@
+import re
+import json
+import shutil
+import pandas as pd
+import plotly.io as pio
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union, Dict, List, Tuple, Iterator, Any
+
+from QSnapChartRenderer import BUILDERS, ChartSpec, render
+
+
+@dataclass
+class PlanStep:
+    """One step of a compiled plan. 'key' identifies the step: equal keys are computed once."""
+    kind: str
+    key: Tuple
+    depends_on: Optional[Tuple] = None
+    charts: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class QSnapSeasonPlan:
+    """
+    Declarative chart plan of a season, compiled into one optimized batch job.
+
+    The plan file lists every chart of the season: metric(s), aggregation level, chart type, image size and
+    trigram source. compile() turns it into a dependency-ordered list of steps:
+        - select:    the applications of a trigram source
+        - aggregate: one grouped computation per (aggregation, metrics, level, source), shared by every chart
+                     needing it, whatever its type, size or title
+        - render:    one step per distinct chart, expanded at run time into one image per group of the level
+    Identical charts are planned once, and an aggregation is released as soon as its last chart is rendered.
+    run() then renders the images in batches, one image export call per batch.
+
+    Plan format:
+        {
+          "seasons": [2023, 2024, 2025],
+          "defaults": {"width": 600, "height": 600, "scale": 2},
+          "charts": [
+            {"id": "unit_coverage", "metric": "unit_coverage", "level": "platform", "chart": "bar",
+             "trigrams": "all", "categories": ["Good", "Average", "Bad", "Unknown"]},
+            {"metric": ["documentation", "automation", "fat"], "level": "department", "chart": "radar"},
+            {"metric": "critical_incidents", "level": "team", "chart": "ytd",
+             "trigrams": {"platform": ["Platform 1"]}, "width": 800, "height": 500}
+          ]
+        }
+    "trigrams" is "all", a list of trigrams or a filter on the application attributes.
+
+    Usage:
+        plan = QSnapSeasonPlan().load('season-2025.json').compile()
+        stats = plan.run(facts, applications, 'charts/2025')
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    # Chart type -> aggregation computing its data
+    CHART_AGGREGATIONS = {
+        'bar': 'distribution',      # applications per answer and season
+        'radar': 'mean',            # mean value per metric and season
+        'ytd': 'monthly_sum'        # sum per month and season
+    }
+
+    # Aggregation level -> application column grouping the charts (None: a single department chart)
+    LEVELS = {
+        'department': None,
+        'platform': 'platform',
+        'team': 'team',
+        'application': 'trigram'
+    }
+
+    DEPARTMENT_GROUP = 'Department'
+    ALL_TRIGRAMS = 'all'
+
+    # Season months, in chart order
+    MONTHS = ['Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug']
+
+    # Fact table columns: one value per application, season and metric (and month for monthly metrics)
+    FACT_COLUMNS = ['trigram', 'season', 'metric', 'value']
+    MONTH_COLUMN = 'month'
+
+    IMAGE_SIZE_FIELDS = ['width', 'height', 'scale']
+
+    # Charts per image export call
+    RENDER_BATCH_SIZE = 50
+
+    def __init__(self):
+        self._plan: Optional[Dict[str, Any]] = None
+        self._steps: Optional[List[PlanStep]] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def load(self, path: Union[str, Path]) -> 'QSnapSeasonPlan':
+        """
+        Load a plan file.
+
+        Args:
+            path: JSON plan file
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the plan is invalid
+        """
+        return self.set_plan(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def set_plan(self, plan: Dict[str, Any]) -> 'QSnapSeasonPlan':
+        """
+        Set the plan.
+
+        Args:
+            plan: Plan dictionary (see class docstring)
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the plan is invalid
+        """
+        if not isinstance(plan.get('charts'), list) or not plan['charts']:
+            raise ValueError("Plan must list its charts in a non-empty 'charts' array")
+        for index, chart in enumerate(plan['charts']):
+            self._validate_chart(index, chart)
+
+        self._plan = plan
+        self._steps = None
+        return self
+
+    def compile(self) -> 'QSnapSeasonPlan':
+        """
+        Compile the plan into deduplicated, dependency-ordered steps.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If no plan is set
+        """
+        if self._plan is None:
+            raise ValueError("Plan must be set first. Call load() or set_plan() first.")
+
+        defaults = self._plan.get('defaults', {})
+        selects: Dict[Tuple, PlanStep] = {}
+        aggregates: Dict[Tuple, PlanStep] = {}
+        renders: Dict[Tuple, PlanStep] = {}
+
+        for chart in self._plan['charts']:
+            chart = {**{k: v for k, v in defaults.items() if k in self.IMAGE_SIZE_FIELDS}, **chart}
+            metrics = self._get_metrics(chart)
+            source = self._to_key(chart.get('trigrams', self.ALL_TRIGRAMS))
+
+            select_key = ('select', source)
+            aggregate_key = ('aggregate', self.CHART_AGGREGATIONS[chart['chart']], metrics, chart['level'], source)
+            render_key = ('render', aggregate_key, chart['chart'],
+                          self._to_key({k: v for k, v in chart.items() if k not in ('id', 'trigrams', 'metric')}))
+
+            selects.setdefault(select_key, PlanStep('select', select_key))
+            aggregates.setdefault(aggregate_key, PlanStep('aggregate', aggregate_key, select_key))
+            step = renders.setdefault(render_key, PlanStep('render', render_key, aggregate_key))
+            chart_id = chart.get('id') or self._get_default_id(chart, metrics)
+            if chart_id not in [planned['id'] for planned in step.charts]:
+                step.charts.append({**chart, 'id': chart_id})
+
+        # Renders grouped per aggregation, so each aggregation can be released after its last chart
+        aggregate_order = {key: index for index, key in enumerate(aggregates)}
+        ordered_renders = sorted(renders.values(), key=lambda step: aggregate_order[step.depends_on])
+        self._steps = list(selects.values()) + list(aggregates.values()) + ordered_renders
+
+        return self
+
+    def get_steps(self) -> List[PlanStep]:
+        self._check_compiled()
+        return self._steps
+
+    def iter_specs(self, facts: pd.DataFrame, applications: pd.DataFrame) -> Iterator[Tuple[str, ChartSpec]]:
+        """
+        Execute the compiled steps, yielding the chart specs lazily.
+
+        Args:
+            facts: Long table with trigram, season, metric, value (and month for the ytd charts)
+            applications: Application attributes: trigram and the level and filter columns
+
+        Yields:
+            (file stem, chart spec), one per chart and group of its level
+
+        Raises:
+            ValueError: If a column is missing
+        """
+        self._check_compiled()
+        missing = [col for col in self.FACT_COLUMNS if col not in facts.columns]
+        if missing:
+            raise ValueError(f"Facts are missing columns: {missing}")
+
+        last_uses = {step.depends_on: index for index, step in enumerate(self._steps) if step.kind == 'render'}
+        results: Dict[Tuple, Any] = {}
+        for index, step in enumerate(self._steps):
+            if step.kind == 'select':
+                results[step.key] = self._select(applications, json.loads(step.key[1]))
+            elif step.kind == 'aggregate':
+                results[step.key] = self._aggregate(facts, results[step.depends_on], *step.key[1:4])
+            else:
+                yield from self._get_specs(step, results[step.depends_on])
+                if last_uses[step.depends_on] == index:
+                    del results[step.depends_on]
+
+    def run(self, facts: pd.DataFrame, applications: pd.DataFrame, output_dir: Union[str, Path],
+            image_format: str = 'png', batch_size: int = RENDER_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Run the whole season: aggregations once, then renders in batches.
+
+        Args:
+            facts: Long fact table (see iter_specs())
+            applications: Application attributes
+            output_dir: Directory of the images
+            image_format: Image format supported by Plotly (png, svg, jpeg, webp, pdf)
+            batch_size: Charts per image export call
+
+        Returns:
+            Number of written 'images', of 'rendered' charts and of 'batches'
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stats = {'images': 0, 'rendered': 0, 'batches': 0}
+
+        batch: List[Tuple[str, ChartSpec]] = []
+        for item in self.iter_specs(facts, applications):
+            batch.append(item)
+            if len(batch) == batch_size:
+                self._render_batch(batch, output_dir, image_format, stats)
+                batch = []
+        if batch:
+            self._render_batch(batch, output_dir, image_format, stats)
+
+        return stats
+
+    # ========== STEP METHODS ==========
+
+    def _select(self, applications: pd.DataFrame, source: Any) -> pd.DataFrame:
+        if source == self.ALL_TRIGRAMS:
+            return applications
+        if isinstance(source, list):
+            return applications[applications['trigram'].isin(source)]
+
+        mask = pd.Series(True, index=applications.index)
+        for column, values in source.items():
+            if column not in applications.columns:
+                raise ValueError(f"Unknown application attribute '{column}' in trigram source")
+            mask &= applications[column].isin(values if isinstance(values, list) else [values])
+        return applications[mask]
+
+    def _aggregate(self, facts: pd.DataFrame, selection: pd.DataFrame, aggregation: str, metrics: Tuple[str, ...],
+                   level: str) -> pd.DataFrame:
+        """One grouped computation for all the groups of the level"""
+        facts = facts[facts['metric'].isin(metrics) & facts['trigram'].isin(selection['trigram'])]
+        level_column = self.LEVELS[level]
+        if level_column is None:
+            groups = pd.Series(self.DEPARTMENT_GROUP, index=facts.index)
+        else:
+            if level_column not in selection.columns:
+                raise ValueError(f"Applications must have a '{level_column}' column for '{level}' charts")
+            groups = facts['trigram'].map(selection.drop_duplicates('trigram').set_index('trigram')[level_column])
+        facts = facts.assign(group=groups.to_numpy()).dropna(subset=['group'])
+
+        # Every aggregate has the same shape: group, row (answer, metric or month), season, value
+        if aggregation == 'distribution':
+            counts = facts.groupby(['group', 'value', 'season']).size()
+            return counts.rename_axis(['group', 'row', 'season']).rename('value').reset_index()
+
+        facts = facts.assign(value=pd.to_numeric(facts['value'], errors='coerce'))
+        if aggregation == 'mean':
+            means = facts.groupby(['group', 'metric', 'season'])['value'].mean()
+            return means.rename_axis(['group', 'row', 'season']).reset_index()
+
+        if self.MONTH_COLUMN not in facts.columns:
+            raise ValueError(f"Facts must have a '{self.MONTH_COLUMN}' column for the ytd charts")
+        sums = facts.groupby(['group', self.MONTH_COLUMN, 'season'])['value'].sum(min_count=1)
+        return sums.rename_axis(['group', 'row', 'season']).reset_index()
+
+    def _get_specs(self, step: PlanStep, aggregate: pd.DataFrame) -> Iterator[Tuple[str, ChartSpec]]:
+        aggregation, metrics = step.depends_on[1], step.depends_on[2]
+        seasons = self._plan.get('seasons') or sorted(aggregate['season'].unique().tolist())
+
+        label_column, categories = {
+            'distribution': ('Category', None),
+            'mean': ('Category', list(metrics)),
+            'monthly_sum': ('Month', self.MONTHS)
+        }[aggregation]
+
+        for group, values in aggregate.groupby('group', sort=True):
+            table = values.pivot(index='row', columns='season', values='value').reindex(columns=seasons)
+            table.columns = [str(season) for season in seasons]
+
+            for chart in step.charts:
+                order = chart.get('categories') or categories or table.index.tolist()
+                data = table.reindex(order)
+                if aggregation == 'distribution':
+                    data = data.fillna(0)
+                else:
+                    # Seasons without any value for the group (e.g. metric introduced later) are not drawn
+                    data = data.dropna(axis=1, how='all')
+                data = data.rename_axis(label_column).reset_index()
+
+                name = ', '.join(metric.replace('_', ' ') for metric in metrics).capitalize()
+                metadata = {
+                    'img_name': chart.get('title') or f"{name} - {group}",
+                    'y_label': chart.get('y_label') or ('Score' if aggregation == 'mean' else name)
+                }
+                stem = chart['id'] if chart['level'] == 'department' else f"{chart['id']}_{self._slug(group)}"
+                yield stem, ChartSpec.create(chart['chart'], data, metadata, width=chart.get('width'),
+                                             height=chart.get('height'), scale=chart.get('scale'))
+
+    def _render_batch(self, batch: List[Tuple[str, ChartSpec]], output_dir: Path, image_format: str,
+                      stats: Dict[str, int]) -> None:
+        """Build the distinct specs of the batch, export them in one call, copy the duplicates"""
+        files: Dict[ChartSpec, List[Path]] = {}
+        for stem, spec in batch:
+            files.setdefault(spec, []).append(output_dir / f"{stem}.{image_format}")
+
+        specs = list(files)
+        pio.write_images(
+            [render(spec) for spec in specs],
+            [files[spec][0] for spec in specs],
+            format=image_format,
+            width=[spec.width or BUILDERS[spec.kind].DEFAULT_IMAGE_WIDTH for spec in specs],
+            height=[spec.height or BUILDERS[spec.kind].DEFAULT_IMAGE_HEIGHT for spec in specs],
+            scale=[spec.scale or BUILDERS[spec.kind].DEFAULT_IMAGE_SCALE for spec in specs]
+        )
+        for paths in files.values():
+            for path in paths[1:]:
+                shutil.copyfile(paths[0], path)
+
+        stats['images'] += len(batch)
+        stats['rendered'] += len(specs)
+        stats['batches'] += 1
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_chart(self, index: int, chart: Dict[str, Any]) -> None:
+        if chart.get('chart') not in self.CHART_AGGREGATIONS:
+            raise ValueError(f"Chart {index}: unknown chart type '{chart.get('chart')}'. "
+                             f"Supported: {list(self.CHART_AGGREGATIONS)}")
+        if chart.get('level') not in self.LEVELS:
+            raise ValueError(f"Chart {index}: unknown level '{chart.get('level')}'. Supported: {list(self.LEVELS)}")
+        if not chart.get('metric'):
+            raise ValueError(f"Chart {index}: a 'metric' is required")
+
+        source = chart.get('trigrams', self.ALL_TRIGRAMS)
+        if not (source == self.ALL_TRIGRAMS or isinstance(source, (list, dict))):
+            raise ValueError(f"Chart {index}: 'trigrams' must be '{self.ALL_TRIGRAMS}', a list or a filter")
+
+    def _check_compiled(self) -> None:
+        if self._steps is None:
+            raise ValueError("Plan must be compiled first. Call compile() first.")
+
+    # ========== HELPER METHODS ==========
+
+    @staticmethod
+    def _get_metrics(chart: Dict[str, Any]) -> Tuple[str, ...]:
+        metric = chart['metric']
+        return tuple(metric) if isinstance(metric, list) else (metric,)
+
+    @staticmethod
+    def _get_default_id(chart: Dict[str, Any], metrics: Tuple[str, ...]) -> str:
+        return f"{'_'.join(metrics)}_{chart['chart']}_{chart['level']}"
+
+    @staticmethod
+    def _to_key(value: Any) -> str:
+        """Canonical JSON: equal plan entries give equal keys whatever their key order"""
+        if isinstance(value, list):
+            value = sorted(value)
+        return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+    @staticmethod
+    def _slug(value: Any) -> str:
+        return re.sub(r'[^0-9a-z]+', '_', str(value).lower()).strip('_')
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    import numpy as np
+
+    plan = {
+        'seasons': [2023, 2024, 2025],
+        'defaults': {'width': 600, 'height': 600, 'scale': 2},
+        'charts': [
+            {'id': 'unit_coverage', 'metric': 'unit_coverage', 'level': 'platform', 'chart': 'bar',
+             'categories': ['Good', 'Average', 'Bad', 'Unknown']},
+            # Same chart asked twice under another id: rendered once
+            {'id': 'unit_coverage_copy', 'metric': 'unit_coverage', 'level': 'platform', 'chart': 'bar',
+             'categories': ['Good', 'Average', 'Bad', 'Unknown']},
+            {'metric': ['documentation', 'automation', 'fat_practices'], 'level': 'department', 'chart': 'radar'},
+            {'metric': ['documentation', 'automation', 'fat_practices'], 'level': 'platform', 'chart': 'radar',
+             'width': 1200, 'height': 1200},
+            {'metric': 'critical_incidents', 'level': 'team', 'chart': 'ytd', 'trigrams': {'platform': 'Platform 1'}}
+        ]
+    }
+
+    rng = np.random.default_rng(0)
+    applications = pd.DataFrame({
+        'trigram': [f"A{i:02d}" for i in range(40)],
+        'platform': [f"Platform {i % 3 + 1}" for i in range(40)],
+        'team': [f"Team {i % 7 + 1}" for i in range(40)]
+    })
+    facts = pd.concat([
+        pd.DataFrame([(t, s, 'unit_coverage', rng.choice(['Good', 'Average', 'Bad', 'Unknown']), None)
+                      for t in applications['trigram'] for s in (2023, 2024, 2025)]),
+        pd.DataFrame([(t, s, m, rng.random(), None) for t in applications['trigram'] for s in (2023, 2024, 2025)
+                      for m in ('documentation', 'automation', 'fat_practices')]),
+        pd.DataFrame([(t, s, 'critical_incidents', int(rng.poisson(0.3)), month) for t in applications['trigram']
+                      for s in (2024, 2025) for month in QSnapSeasonPlan.MONTHS])
+    ])
+    facts.columns = ['trigram', 'season', 'metric', 'value', 'month']
+
+    season_plan = QSnapSeasonPlan().set_plan(plan).compile()
+    for step in season_plan.get_steps():
+        print(step.kind, step.key[1:3], [chart['id'] for chart in step.charts])
+
+    specs = list(season_plan.iter_specs(facts, applications))
+    print(f"{len(specs)} images, {len(set(spec for _, spec in specs))} distinct charts")
+    print(season_plan.run(facts, applications, 'season_charts'))
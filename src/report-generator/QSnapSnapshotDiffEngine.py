@@ -0,0 +1,307 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Optional, Union, Tuple
+
+
+class QSnapSnapshotDiffEngine:
+    """
+    Portfolio-wide snapshot comparison: improved / degraded / stable classification of every application,
+    category and consecutive year pair, computed as whole-matrix array operations.
+
+    The classification is the one of the radar plot: a difference above TREND_ERROR_MARGIN is an improvement,
+    below -TREND_ERROR_MARGIN a degradation, otherwise stable. A missing value on either side means that no
+    comparison is possible.
+
+    Usage:
+        engine = QSnapSnapshotDiffEngine()
+        engine.set_data(df).compute()
+        statuses = engine.get_status_frame()
+        changed = engine.get_changed_applications()
+        colors = engine.get_marker_colors('AAA')  # to give to QSnapRadarPlotBuilder.set_trend_markers()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    APPLICATION_COLUMN = 'Application'
+    CATEGORY_COLUMN = 'Category'
+
+    # Error margin for trend detection (same as QSnapRadarPlotBuilder)
+    TREND_ERROR_MARGIN = 0.05  # 5% error margin
+
+    # Status codes, stored as int8 in the status matrix
+    STABLE = 0
+    IMPROVED = 1
+    DEGRADED = 2
+    NO_COMPARISON = 3
+
+    STATUS_NAMES = np.array(['stable', 'improved', 'degraded', 'no comparison'], dtype=object)
+
+    # Radar marker colors per status
+    STATUS_COLORS = np.array(['grey', 'green', 'red', 'rgb(30, 144, 255)'], dtype=object)
+
+    def __init__(self, trend_error_margin: float = TREND_ERROR_MARGIN):
+        self._trend_error_margin = trend_error_margin
+        self._values: Optional[np.ndarray] = None
+        self._applications: Optional[pd.Index] = None
+        self._categories: Optional[pd.Index] = None
+        self._years: Optional[List[str]] = None
+        self._diffs: Optional[np.ndarray] = None
+        self._statuses: Optional[np.ndarray] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_data(self, data: Union[pd.DataFrame, Dict]) -> 'QSnapSnapshotDiffEngine':
+        """
+        Set the portfolio scores.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain an 'Application' column, a 'Category' column and year columns,
+                  one row per (application, category).
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        if isinstance(data, dict):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data
+        else:
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        self._validate_data_frame(df)
+        self._years = [col for col in df.columns if col not in (self.APPLICATION_COLUMN, self.CATEGORY_COLUMN)]
+
+        # Scatter the rows into an (applications, categories, years) matrix, missing cells stay NaN
+        app_codes, self._applications = pd.factorize(df[self.APPLICATION_COLUMN])
+        cat_codes, self._categories = pd.factorize(df[self.CATEGORY_COLUMN])
+        self._values = np.full((len(self._applications), len(self._categories), len(self._years)), np.nan)
+        self._values[app_codes, cat_codes, :] = df[self._years].to_numpy(dtype=float)
+
+        self._diffs = None
+        self._statuses = None
+
+        return self
+
+    def compute(self) -> 'QSnapSnapshotDiffEngine':
+        """
+        Classify every application, category and consecutive year pair at once.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data is not set or holds less than two years
+        """
+        self._check_data()
+        if len(self._years) < 2:
+            raise ValueError("At least two year columns are needed to compare snapshots")
+
+        previous = self._values[..., :-1]
+        current = self._values[..., 1:]
+        self._diffs = current - previous
+        self._statuses = self.classify(previous, current, self._trend_error_margin)
+
+        return self
+
+    @classmethod
+    def classify(cls, previous: np.ndarray, current: np.ndarray,
+                 trend_error_margin: float = TREND_ERROR_MARGIN) -> np.ndarray:
+        """
+        Classify the evolution from previous to current values, element-wise.
+
+        Args:
+            previous: Previous values (any shape, NaN when unknown)
+            current: Current values (same shape)
+            trend_error_margin: Differences within +/- this margin are stable
+
+        Returns:
+            int8 array of status codes (STABLE, IMPROVED, DEGRADED, NO_COMPARISON)
+        """
+        previous = np.asarray(previous, dtype=float)
+        current = np.asarray(current, dtype=float)
+        diff = current - previous
+
+        return np.select(
+            [np.isnan(diff), diff > trend_error_margin, diff < -trend_error_margin],
+            [cls.NO_COMPARISON, cls.IMPROVED, cls.DEGRADED],
+            default=cls.STABLE
+        ).astype(np.int8)
+
+    def get_applications(self) -> List[str]:
+        """
+        Get the applications, in the order of the first axis of the value and status matrices.
+
+        Returns:
+            List of applications
+        """
+        self._check_data()
+        return self._applications.tolist()
+
+    def get_categories(self) -> List[str]:
+        """
+        Get the categories, in the order of the second axis of the value and status matrices.
+
+        Returns:
+            List of categories
+        """
+        self._check_data()
+        return self._categories.tolist()
+
+    def get_value_matrix(self) -> np.ndarray:
+        """
+        Get the scores.
+
+        Returns:
+            float array of shape (applications, categories, years), NaN for missing scores
+        """
+        self._check_data()
+        return self._values
+
+    def get_status_matrix(self) -> np.ndarray:
+        """
+        Get the raw status codes.
+
+        Returns:
+            int8 array of shape (applications, categories, year pairs)
+        """
+        self._check_computed()
+        return self._statuses
+
+    def get_year_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Get the compared year pairs, in the order of the last axis of the status matrix.
+
+        Returns:
+            List of (previous year, current year)
+        """
+        self._check_computed()
+        return list(zip(self._years[:-1], self._years[1:]))
+
+    def get_status_frame(self) -> pd.DataFrame:
+        """
+        Get all the classifications in long format.
+
+        Returns:
+            DataFrame with application, category, year_from, year_to, diff and status
+        """
+        self._check_computed()
+        num_apps, num_cats, num_pairs = self._statuses.shape
+        pairs = self.get_year_pairs()
+
+        return pd.DataFrame({
+            self.APPLICATION_COLUMN: np.repeat(self._applications.to_numpy(), num_cats * num_pairs),
+            self.CATEGORY_COLUMN: np.tile(np.repeat(self._categories.to_numpy(), num_pairs), num_apps),
+            'year_from': np.tile([pair[0] for pair in pairs], num_apps * num_cats),
+            'year_to': np.tile([pair[1] for pair in pairs], num_apps * num_cats),
+            'diff': self._diffs.ravel(),
+            'status': self.STATUS_NAMES[self._statuses.ravel()]
+        })
+
+    def get_changed_applications(self, year_to: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get the applications with at least one improved or degraded category.
+
+        Args:
+            year_to: Current year of the compared pair. If None, uses the last year.
+
+        Returns:
+            DataFrame indexed by application with the number of improved and degraded categories,
+            only for the applications whose status changed
+        """
+        statuses = self._statuses[..., self._get_pair_index(year_to)]
+        improved = (statuses == self.IMPROVED).sum(axis=1)
+        degraded = (statuses == self.DEGRADED).sum(axis=1)
+        changed = (improved + degraded) > 0
+
+        return pd.DataFrame(
+            {'improved': improved[changed], 'degraded': degraded[changed]},
+            index=pd.Index(self._applications[changed], name=self.APPLICATION_COLUMN)
+        )
+
+    def get_marker_colors(self, application: str, year_to: Optional[str] = None,
+                          categories: Optional[List[str]] = None) -> List[str]:
+        """
+        Get the radar marker colors of one application, so the radar does not classify again.
+
+        Args:
+            application: Application to read
+            year_to: Current year of the compared pair. If None, uses the last year.
+            categories: Category order of the radar. If None, uses the data order.
+
+        Returns:
+            One color per category
+
+        Raises:
+            ValueError: If the application or a category is unknown
+        """
+        app_idx = self._applications.get_indexer([application])[0]
+        if app_idx < 0:
+            raise ValueError(f"Unknown application '{application}'")
+
+        statuses = self._statuses[app_idx, :, self._get_pair_index(year_to)]
+        if categories is not None:
+            cat_idx = self._categories.get_indexer(categories)
+            if (cat_idx < 0).any():
+                raise ValueError(f"Unknown categories: {[c for c, i in zip(categories, cat_idx) if i < 0]}")
+            statuses = statuses[cat_idx]
+
+        return self.STATUS_COLORS[statuses].tolist()
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        for col in (self.APPLICATION_COLUMN, self.CATEGORY_COLUMN):
+            if col not in df.columns:
+                raise ValueError(f"DataFrame must contain a '{col}' column")
+
+        year_columns = [col for col in df.columns if col not in (self.APPLICATION_COLUMN, self.CATEGORY_COLUMN)]
+        if not year_columns:
+            raise ValueError("DataFrame must contain at least one year column")
+        for col in year_columns:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                raise ValueError(f"Year column '{col}' must contain numeric values")
+
+        if df.duplicated([self.APPLICATION_COLUMN, self.CATEGORY_COLUMN]).any():
+            raise ValueError("DataFrame must contain one row per application and category")
+
+    def _check_data(self) -> None:
+        if self._values is None:
+            raise ValueError("Data must be set first. Call set_data() first.")
+
+    def _check_computed(self) -> None:
+        if self._statuses is None:
+            raise ValueError("Statuses must be computed first. Call compute() first.")
+
+    # ========== HELPER METHODS ==========
+
+    def _get_pair_index(self, year_to: Optional[str]) -> int:
+        self._check_computed()
+        if year_to is None:
+            return len(self._years) - 2
+        if year_to not in self._years[1:]:
+            raise ValueError(f"Year '{year_to}' has no previous year. Available years: {self._years[1:]}")
+        return self._years.index(year_to) - 1
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    data = {
+        'Application': ['AAA', 'AAA', 'AAA', 'BBB', 'BBB', 'BBB'],
+        'Category': ['User satisfaction', 'Product stability', 'Fix reactivity'] * 2,
+        '2023': [0.48, 0.58, 0.89, 0.60, 0.77, 0.40],
+        '2024': [None, 0.58, 0.79, 0.62, 0.67, 0.42],
+        '2025': [0.28, 0.68, 0.84, 0.63, 0.70, 0.44]
+    }
+
+    engine = QSnapSnapshotDiffEngine()
+    engine.set_data(data).compute()
+
+    print(engine.get_status_frame())
+    print(engine.get_changed_applications())
+    print(engine.get_marker_colors('AAA'))
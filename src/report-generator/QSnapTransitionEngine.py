@@ -0,0 +1,358 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Optional, Union, Tuple
+
+
+class QSnapTransitionEngine:
+    """
+    Year-to-year category transitions of the applications (e.g. how many applications went from Good to None),
+    for every metric and consecutive year pair, counted with a single bincount.
+
+    Categories are encoded as integer codes once; every (application, metric, year pair) then falls in one cell
+    of a (metrics, year pairs, categories, categories) count tensor. The members of the cells are not stored
+    per cell: they are kept as one sorted permutation of the applications (a CSR-like index), built on the
+    first member request only. Flow charts (QSnapParallelCategoriesBuilder) and bar chart callouts read their
+    data from here, without going back to the raw answers.
+
+    Usage:
+        engine = QSnapTransitionEngine()
+        engine.set_data(df).compute()
+        matrix = engine.get_matrix('Coverage score', '2025')
+        members = engine.get_members('Coverage score', '2025', category_from='Good', category_to='None')
+        flows = engine.get_flow_data('Coverage score')  # to give to QSnapParallelCategoriesBuilder.set_data()
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    APPLICATION_COLUMN = 'Application'
+    METRIC_COLUMN = 'Metric'
+    COUNT_COLUMN = 'Count'
+
+    # Category of the applications without an answer in a year
+    MISSING_CATEGORY = 'Unknown'
+
+    # Code order of the categories (same as the bar chart). Categories not listed get the next codes.
+    CATEGORY_ORDER = ['Full', 'Good', 'Average', 'Low', 'Bad', 'None', 'Unknown']
+
+    def __init__(self):
+        self._codes: Optional[np.ndarray] = None
+        self._applications: Optional[pd.Index] = None
+        self._metrics: Optional[pd.Index] = None
+        self._categories: Optional[pd.Index] = None
+        self._years: Optional[List[str]] = None
+        self._counts: Optional[np.ndarray] = None
+        self._cells: Optional[np.ndarray] = None
+        self._member_order: Optional[np.ndarray] = None
+        self._member_offsets: Optional[np.ndarray] = None
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_data(self, data: Union[pd.DataFrame, Dict]) -> 'QSnapTransitionEngine':
+        """
+        Set the portfolio categories.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain an 'Application' column, a 'Metric' column and year columns holding the
+                  category of the application (None when unknown), one row per (application, metric).
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        if isinstance(data, dict):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data
+        else:
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        self._validate_data_frame(df)
+        self._years = [col for col in df.columns if col not in (self.APPLICATION_COLUMN, self.METRIC_COLUMN)]
+
+        # Encode every category once, then scatter the codes into an (applications, metrics, years) matrix.
+        # Applications without a row for a metric are left out of its transitions (code -1).
+        values = df[self._years].astype(object).where(df[self._years].notna(), self.MISSING_CATEGORY)
+        values = values.to_numpy().astype(str)
+        found = pd.unique(values.ravel())
+        self._categories = pd.Index([c for c in self.CATEGORY_ORDER if c in found]
+                                    + [c for c in found if c not in self.CATEGORY_ORDER])
+
+        app_codes, self._applications = pd.factorize(df[self.APPLICATION_COLUMN])
+        metric_codes, self._metrics = pd.factorize(df[self.METRIC_COLUMN])
+        self._codes = np.full((len(self._applications), len(self._metrics), len(self._years)), -1, dtype=np.int64)
+        self._codes[app_codes, metric_codes, :] = self._categories.get_indexer(values.ravel()).reshape(values.shape)
+
+        self._counts = None
+        self._cells = None
+        self._member_order = None
+        self._member_offsets = None
+
+        return self
+
+    def compute(self) -> 'QSnapTransitionEngine':
+        """
+        Count the transitions of every metric and consecutive year pair at once.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data is not set or holds less than two years
+        """
+        self._check_data()
+        if len(self._years) < 2:
+            raise ValueError("At least two year columns are needed to compute transitions")
+
+        num_metrics, num_pairs, num_cats = len(self._metrics), len(self._years) - 1, len(self._categories)
+        previous = self._codes[..., :-1]
+        current = self._codes[..., 1:]
+
+        # Flat cell index of every (application, metric, pair): ((metric * pairs + pair) * K + from) * K + to
+        metric_pairs = (np.arange(num_metrics)[:, None] * num_pairs + np.arange(num_pairs)[None, :])
+        cells = (metric_pairs[None, :, :] * num_cats + previous) * num_cats + current
+        cells[(previous < 0) | (current < 0)] = -1
+
+        self._cells = cells.ravel()
+        present = self._cells >= 0
+        self._counts = np.bincount(
+            self._cells[present], minlength=num_metrics * num_pairs * num_cats * num_cats
+        ).reshape(num_metrics, num_pairs, num_cats, num_cats)
+        self._member_order = None
+        self._member_offsets = None
+
+        return self
+
+    def get_applications(self) -> List[str]:
+        self._check_data()
+        return self._applications.tolist()
+
+    def get_metrics(self) -> List[str]:
+        self._check_data()
+        return self._metrics.tolist()
+
+    def get_categories(self) -> List[str]:
+        """
+        Get the categories, in code order (the order of the last two axes of the count tensor).
+
+        Returns:
+            List of categories
+        """
+        self._check_data()
+        return self._categories.tolist()
+
+    def get_year_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Get the year pairs, in the order of the second axis of the count tensor.
+
+        Returns:
+            List of (previous year, current year)
+        """
+        self._check_computed()
+        return list(zip(self._years[:-1], self._years[1:]))
+
+    def get_count_tensor(self) -> np.ndarray:
+        """
+        Get the raw transition counts.
+
+        Returns:
+            int64 array of shape (metrics, year pairs, categories from, categories to)
+        """
+        self._check_computed()
+        return self._counts
+
+    def get_matrix(self, metric: str, year_to: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get the transition matrix of one metric and year pair.
+
+        Args:
+            metric: Metric to read
+            year_to: Current year of the pair. If None, uses the last year.
+
+        Returns:
+            DataFrame of counts, previous categories as index and current categories as columns,
+            restricted to the categories of the metric
+        """
+        metric_idx, pair_idx = self._get_metric_index(metric), self._get_pair_index(year_to)
+        used = self._get_metric_categories(metric_idx)
+        matrix = self._counts[metric_idx, pair_idx][np.ix_(used, used)]
+        categories = self._categories[used]
+
+        return pd.DataFrame(
+            matrix,
+            index=pd.Index(categories, name=self._years[pair_idx]),
+            columns=pd.Index(categories, name=self._years[pair_idx + 1])
+        )
+
+    def get_transition_frame(self) -> pd.DataFrame:
+        """
+        Get the non-empty cells of all the matrices in long format.
+
+        Returns:
+            DataFrame with metric, year_from, year_to, category_from, category_to and count
+        """
+        self._check_computed()
+        metric_idx, pair_idx, from_idx, to_idx = np.nonzero(self._counts)
+        pairs = self.get_year_pairs()
+
+        return pd.DataFrame({
+            self.METRIC_COLUMN: self._metrics.to_numpy()[metric_idx],
+            'year_from': np.array([pair[0] for pair in pairs], dtype=object)[pair_idx],
+            'year_to': np.array([pair[1] for pair in pairs], dtype=object)[pair_idx],
+            'category_from': self._categories.to_numpy()[from_idx],
+            'category_to': self._categories.to_numpy()[to_idx],
+            'count': self._counts[metric_idx, pair_idx, from_idx, to_idx]
+        })
+
+    def get_members(self, metric: str, year_to: Optional[str] = None, category_from: Optional[str] = None,
+                    category_to: Optional[str] = None) -> List[str]:
+        """
+        Get the applications of one cell, or of one row or column of a matrix.
+
+        Args:
+            metric: Metric to read
+            year_to: Current year of the pair. If None, uses the last year.
+            category_from: Category in the previous year. If None, any category.
+            category_to: Category in the current year. If None, any category.
+
+        Returns:
+            List of applications, in data order
+
+        Raises:
+            ValueError: If the metric, the year or a category is unknown
+        """
+        metric_idx, pair_idx = self._get_metric_index(metric), self._get_pair_index(year_to)
+        num_cats = len(self._categories)
+        from_idx = self._get_category_indexes(category_from)
+        to_idx = self._get_category_indexes(category_to)
+
+        if self._member_order is None:
+            self._build_member_index()
+
+        first_cell = (metric_idx * (len(self._years) - 1) + pair_idx) * num_cats * num_cats
+        cells = (first_cell + from_idx[:, None] * num_cats + to_idx[None, :]).ravel()
+        positions = np.concatenate([
+            self._member_order[self._member_offsets[cell]:self._member_offsets[cell + 1]] for cell in cells
+        ])
+        # Flat positions are (application, metric, pair) ordered: the application is the leading axis
+        app_idx = np.sort(positions // (len(self._metrics) * (len(self._years) - 1)))
+        return self._applications[app_idx].tolist()
+
+    def get_flow_data(self, metric: str, year_to: Optional[str] = None) -> Dict[str, List]:
+        """
+        Get the transitions of one metric and year pair as aggregated flows.
+
+        Args:
+            metric: Metric to read
+            year_to: Current year of the pair. If None, uses the last year.
+
+        Returns:
+            Dictionary with the two year columns and the 'Count' column, one entry per non-empty cell,
+            ready for QSnapParallelCategoriesBuilder.set_data()
+        """
+        metric_idx, pair_idx = self._get_metric_index(metric), self._get_pair_index(year_to)
+        matrix = self._counts[metric_idx, pair_idx]
+        from_idx, to_idx = np.nonzero(matrix)
+
+        return {
+            self._years[pair_idx]: self._categories[from_idx].tolist(),
+            self._years[pair_idx + 1]: self._categories[to_idx].tolist(),
+            self.COUNT_COLUMN: matrix[from_idx, to_idx].tolist()
+        }
+
+    def get_callout_trigrams(self, metric: str, categories: List[str],
+                             year_to: Optional[str] = None) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Get the applications of some categories in the current year, in the format of the bar chart metadata.
+
+        Args:
+            metric: Metric to read
+            categories: Categories to list, e.g. ['Unknown', 'None']
+            year_to: Year of the callouts. If None, uses the last year.
+
+        Returns:
+            {year: {category: [applications]}}, to give as QSnapBarChartBuilder 'trigrams' metadata
+        """
+        year = self._years[self._get_pair_index(year_to) + 1]
+        return {year: {category: self.get_members(metric, year, category_to=category) for category in categories}}
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        for col in (self.APPLICATION_COLUMN, self.METRIC_COLUMN):
+            if col not in df.columns:
+                raise ValueError(f"DataFrame must contain a '{col}' column")
+
+        if len(df.columns) < 3:
+            raise ValueError("DataFrame must contain at least one year column")
+
+        if df.duplicated([self.APPLICATION_COLUMN, self.METRIC_COLUMN]).any():
+            raise ValueError("DataFrame must contain one row per application and metric")
+
+    def _check_data(self) -> None:
+        if self._codes is None:
+            raise ValueError("Data must be set first. Call set_data() first.")
+
+    def _check_computed(self) -> None:
+        if self._counts is None:
+            raise ValueError("Transitions must be computed first. Call compute() first.")
+
+    # ========== HELPER METHODS ==========
+
+    def _build_member_index(self) -> None:
+        # One stable sort groups the (application, metric, pair) positions by cell, applications in data order;
+        # the offsets of a cell are the cumulated counts of the previous cells
+        present = np.flatnonzero(self._cells >= 0)
+        self._member_order = present[np.argsort(self._cells[present], kind='stable')]
+        self._member_offsets = np.concatenate([[0], np.cumsum(self._counts.ravel())])
+
+    def _get_metric_index(self, metric: str) -> int:
+        self._check_computed()
+        metric_idx = self._metrics.get_indexer([metric])[0]
+        if metric_idx < 0:
+            raise ValueError(f"Unknown metric '{metric}'. Available metrics: {self._metrics.tolist()}")
+        return metric_idx
+
+    def _get_pair_index(self, year_to: Optional[str]) -> int:
+        self._check_computed()
+        if year_to is None:
+            return len(self._years) - 2
+        if year_to not in self._years[1:]:
+            raise ValueError(f"Year '{year_to}' has no previous year. Available years: {self._years[1:]}")
+        return self._years.index(year_to) - 1
+
+    def _get_category_indexes(self, category: Optional[str]) -> np.ndarray:
+        if category is None:
+            return np.arange(len(self._categories))
+        category_idx = self._categories.get_indexer([category])[0]
+        if category_idx < 0:
+            raise ValueError(f"Unknown category '{category}'. Available categories: {self._categories.tolist()}")
+        return np.array([category_idx])
+
+    def _get_metric_categories(self, metric_idx: int) -> np.ndarray:
+        codes = self._codes[:, metric_idx, :]
+        return np.unique(codes[codes >= 0])
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    data = {
+        'Application': ['AAA', 'BBB', 'CCC', 'DDD', 'AAA', 'BBB', 'CCC', 'DDD'],
+        'Metric': ['Coverage score'] * 4 + ['Fix reactivity'] * 4,
+        '2023': ['Good', 'Good', 'Low', None, 'Good', 'Average', 'Bad', 'Good'],
+        '2024': ['Good', 'None', 'Low', 'Full', 'Average', 'Average', 'Bad', 'Good'],
+        '2025': ['Full', 'None', 'Good', 'Full', 'Good', 'Bad', 'Average', 'Good']
+    }
+
+    engine = QSnapTransitionEngine()
+    engine.set_data(data).compute()
+
+    print(engine.get_matrix('Coverage score', '2024'))
+    print(engine.get_transition_frame())
+    print(engine.get_members('Coverage score', '2024', category_from='Good', category_to='None'))
+    print(engine.get_flow_data('Fix reactivity'))
+    print(engine.get_callout_trigrams('Coverage score', ['Unknown', 'None'], '2024'))
@@ -0,0 +1,430 @@
+import pandas as pd
+import plotly.graph_objects as go
+import numpy as np
+from typing import List, Dict, Optional, Union
+from dataclasses import dataclass
+
+
+@dataclass
+class ChartMetadata:
+    img_name: str
+    y_label: str
+
+
+class QSnapYtdChartBuilder:
+    """
+    Builder class for creating QSnap "YTD monthly - Year after year" line charts.
+
+    The data holds one row per month (in season order) and one column per year. Monthly values are
+    turned into cumulative YTD curves for all years at once. Precomputed cumulative sums (e.g. from
+    compute_ytd_batch()) can be given as is with cumulative=True.
+
+    Usage:
+        builder = QSnapYtdChartBuilder()
+        fig = builder.set_data(df).set_metadata(metadata).set_image_size(800, 600).build()
+        builder.export_to_png('output_chart')
+
+        # Batch: one array operation for all KPIs, then one cheap build per chart
+        ytd = QSnapYtdChartBuilder.compute_ytd_batch(monthly_values)  # shape (kpis, months, years)
+    """
+
+    # ========== CONSTANTS - Easy to maintain and tweak ==========
+
+    MONTH_COLUMN = 'Month'
+
+    # Line styling: the most recent year stands out, the previous ones fade out
+    CURRENT_YEAR_COLOR = 'rgb(30, 144, 255)'
+    CURRENT_YEAR_LINE_WIDTH = 3
+    PREVIOUS_YEAR_COLORS = ['#6B7280', '#9CA3AF', '#D1D5DB']
+    PREVIOUS_YEAR_LINE_WIDTH = 2
+    PREVIOUS_YEAR_DASH = 'dot'
+    MARKER_SIZE = 6
+
+    AXIS_LINE_COLOR = 'black'
+    AXIS_LINE_WIDTH = 2
+    GRID_COLOR = '#E5E7EB'
+
+    # Layout constants
+    TITLE_Y_POSITION = 0.99
+    LEGEND_Y_POSITION = -0.12
+    TOP_MARGIN = 40
+
+    # Font styling
+    FONT_SIZE = 12
+
+    # Default image size
+    DEFAULT_IMAGE_WIDTH = 600
+    DEFAULT_IMAGE_HEIGHT = 600
+    DEFAULT_IMAGE_SCALE = 2
+
+    def __init__(self):
+        self._data_frame: Optional[pd.DataFrame] = None
+        self._original_data_frame: Optional[pd.DataFrame] = None
+        self._metadata: Optional[ChartMetadata] = None
+        self._figure: Optional[go.Figure] = None
+        self._image_width: int = self.DEFAULT_IMAGE_WIDTH
+        self._image_height: int = self.DEFAULT_IMAGE_HEIGHT
+        self._image_scale: int = self.DEFAULT_IMAGE_SCALE
+
+    # ========== PUBLIC API - Fluent Interface ==========
+
+    def set_data(self, data: Union[pd.DataFrame, Dict], cumulative: bool = False) -> 'QSnapYtdChartBuilder':
+        """
+        Set the data for the chart.
+
+        Args:
+            data: Either a pandas DataFrame or a dictionary that can be converted to DataFrame.
+                  Must contain a 'Month' column and year columns. Months not reached yet are None/NaN.
+            cumulative: True if the year columns already hold YTD cumulative sums
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If data format is invalid
+        """
+        if isinstance(data, dict):
+            df = pd.DataFrame(data)
+        elif isinstance(data, pd.DataFrame):
+            df = data.copy()
+        else:
+            raise ValueError("Data must be either a pandas DataFrame or a dictionary")
+
+        self._validate_data_frame(df)
+        self._original_data_frame = df.copy()
+
+        if cumulative:
+            self._data_frame = df
+        else:
+            years = self._get_x_axis_from_df(df)
+            ytd = self.compute_ytd(df[years].to_numpy(dtype=float))
+            self._data_frame = pd.concat(
+                [df[[self.MONTH_COLUMN]], pd.DataFrame(ytd, columns=years, index=df.index)], axis=1
+            )
+
+        return self
+
+    def set_metadata(self, metadata: Union[ChartMetadata, Dict]) -> 'QSnapYtdChartBuilder':
+        """
+        Set the metadata for the chart.
+
+        Args:
+            metadata: Either a ChartMetadata object or a dictionary with metadata fields
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If metadata format is invalid
+        """
+        if isinstance(metadata, dict):
+            self._metadata = ChartMetadata(**metadata)
+        elif isinstance(metadata, ChartMetadata):
+            self._metadata = metadata
+        else:
+            raise ValueError("Metadata must be either a ChartMetadata object or a dictionary")
+
+        self._validate_metadata()
+
+        return self
+
+    def set_image_size(self, width: int = None, height: int = None, scale: int = None) -> 'QSnapYtdChartBuilder':
+        """
+        Set the image export dimensions.
+
+        Args:
+            width: Image width in pixels (default: 600)
+            height: Image height in pixels (default: 600)
+            scale: Image scale factor (default: 2)
+
+        Returns:
+            Self for method chaining
+        """
+        if width is not None:
+            self._image_width = width
+        if height is not None:
+            self._image_height = height
+        if scale is not None:
+            self._image_scale = scale
+
+        return self
+
+    def build(self) -> go.Figure:
+        """
+        Build the chart with current data and metadata.
+
+        Returns:
+            Plotly Figure object
+
+        Raises:
+            ValueError: If data or metadata is not set
+        """
+        if self._data_frame is None:
+            raise ValueError("Data must be set before building. Call set_data() first.")
+        if self._metadata is None:
+            raise ValueError("Metadata must be set before building. Call set_metadata() first.")
+
+        self._figure = self._create_chart()
+        return self._figure
+
+    def export_to_png(self, filename: Optional[str] = None) -> None:
+        """
+        Export the chart to PNG file.
+
+        Args:
+            filename: Output filename (without extension). If None, uses metadata img_name.
+
+        Raises:
+            ValueError: If chart hasn't been built yet
+        """
+        if self._figure is None:
+            raise ValueError("Chart must be built before exporting. Call build() first.")
+
+        if filename is None:
+            filename = self._metadata.img_name
+
+        clean_filename = filename.strip().lower().replace(' ', '_') + ".png"
+
+        self._figure.write_image(
+            clean_filename,
+            width=self._image_width,
+            height=self._image_height,
+            scale=self._image_scale,
+            format="png"
+        )
+
+    def to_image(self, image_format: str = "png") -> bytes:
+        """
+        Encode the chart in memory, with the same size as export_to_png().
+
+        Args:
+            image_format: Image format supported by Plotly (png, svg, jpeg, webp, pdf)
+
+        Returns:
+            Encoded image
+
+        Raises:
+            ValueError: If chart hasn't been built yet
+        """
+        if self._figure is None:
+            raise ValueError("Chart must be built before exporting. Call build() first.")
+
+        return self._figure.to_image(
+            format=image_format,
+            width=self._image_width,
+            height=self._image_height,
+            scale=self._image_scale
+        )
+
+    def get_figure(self) -> Optional[go.Figure]:
+        """
+        Get the current figure object.
+
+        Returns:
+            The plotly Figure object or None if not built yet
+        """
+        return self._figure
+
+    # ========== YTD COMPUTATION ==========
+
+    @staticmethod
+    def compute_ytd(values: np.ndarray) -> np.ndarray:
+        """
+        Compute the YTD cumulative sums along the month axis (axis -2) for any number of series.
+
+        Missing months inside a year count as 0. Months after the last known value of a year
+        (i.e. not reached yet) stay NaN so the curve stops there.
+
+        Args:
+            values: Monthly values of shape (..., months, years)
+
+        Returns:
+            Array of the same shape with the cumulative YTD values
+        """
+        known = ~np.isnan(values)
+        ytd = np.nancumsum(values, axis=-2)
+
+        # A month is reached if it or any later month has a known value
+        reached = np.flip(np.logical_or.accumulate(np.flip(known, axis=-2), axis=-2), axis=-2)
+        ytd[~reached] = np.nan
+
+        return ytd
+
+    @classmethod
+    def compute_ytd_batch(cls, values: np.ndarray) -> np.ndarray:
+        """
+        Compute the YTD curves of many KPIs in one array operation.
+
+        Args:
+            values: Monthly values of shape (kpis, months, years)
+
+        Returns:
+            Array of shape (kpis, months, years) to slice and pass to set_data(..., cumulative=True)
+
+        Raises:
+            ValueError: If the array is not 3-dimensional
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 3:
+            raise ValueError(f"Batch values must have shape (kpis, months, years), got {values.shape}")
+
+        return cls.compute_ytd(values)
+
+    # ========== VALIDATION METHODS ==========
+
+    def _validate_data_frame(self, df: pd.DataFrame) -> None:
+        """Validate that the DataFrame has the required structure"""
+        if self.MONTH_COLUMN not in df.columns:
+            raise ValueError(f"DataFrame must contain a '{self.MONTH_COLUMN}' column")
+
+        if len(df.columns) < 2:
+            raise ValueError(f"DataFrame must contain at least one year column besides '{self.MONTH_COLUMN}'")
+
+        year_columns = [col for col in df.columns if col != self.MONTH_COLUMN]
+        for col in year_columns:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                raise ValueError(f"Year column '{col}' must contain numeric values")
+
+    def _validate_metadata(self) -> None:
+        """Validate that metadata has required fields"""
+        if not self._metadata.img_name:
+            raise ValueError("Metadata must include 'img_name'")
+        if not self._metadata.y_label:
+            raise ValueError("Metadata must include 'y_label'")
+
+    # ========== CHART CREATION METHODS ==========
+
+    def _create_chart(self) -> go.Figure:
+        """Main method to create the complete chart"""
+        years = self._get_x_axis()
+        months = self._get_y_axis()
+
+        fig = self._add_lines(years, months)
+        fig = self._apply_layout(fig)
+
+        return fig
+
+    def _add_lines(self, years: List[str], months: List[str]) -> go.Figure:
+        """Add one cumulative line per year, oldest first so the current year is drawn on top"""
+        fig = go.Figure()
+        previous_years = years[:-1]
+
+        for idx, year in enumerate(previous_years):
+            # Most recent previous year gets the darkest grey
+            color_idx = min(len(previous_years) - 1 - idx, len(self.PREVIOUS_YEAR_COLORS) - 1)
+            fig.add_trace(go.Scatter(
+                x=months,
+                y=self._data_frame[year].to_numpy(),
+                mode='lines+markers',
+                line={
+                    'color': self.PREVIOUS_YEAR_COLORS[color_idx],
+                    'width': self.PREVIOUS_YEAR_LINE_WIDTH,
+                    'dash': self.PREVIOUS_YEAR_DASH
+                },
+                marker={'size': self.MARKER_SIZE},
+                name=str(year),
+                connectgaps=False
+            ))
+
+        current_year = years[-1]
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=self._data_frame[current_year].to_numpy(),
+            mode='lines+markers',
+            line={'color': self.CURRENT_YEAR_COLOR, 'width': self.CURRENT_YEAR_LINE_WIDTH},
+            marker={'size': self.MARKER_SIZE + 2},
+            name=str(current_year),
+            connectgaps=False
+        ))
+
+        return fig
+
+    def _apply_layout(self, fig: go.Figure) -> go.Figure:
+        """Apply layout configuration to the figure"""
+        fig.update_layout(
+            title={
+                'text': self._metadata.img_name,
+                'x': 0.5,
+                'xanchor': 'center',
+                'y': self.TITLE_Y_POSITION,
+                'yanchor': 'top'
+            },
+            margin={'t': self.TOP_MARGIN},
+            xaxis_title={
+                'text': self.MONTH_COLUMN,
+                'font': {'weight': 'bold'}
+            },
+            xaxis={
+                'tickfont': {'weight': 'bold'},
+                'showline': True,
+                'linecolor': self.AXIS_LINE_COLOR,
+                'linewidth': self.AXIS_LINE_WIDTH
+            },
+            yaxis_title={
+                'text': self._metadata.y_label,
+                'font': {'weight': 'bold'}
+            },
+            yaxis={
+                'rangemode': 'tozero',
+                'tickfont': {'weight': 'bold'},
+                'gridcolor': self.GRID_COLOR,
+                'showline': True,
+                'linecolor': self.AXIS_LINE_COLOR,
+                'linewidth': self.AXIS_LINE_WIDTH
+            },
+            legend={
+                'orientation': 'h',
+                'yanchor': 'top',
+                'y': self.LEGEND_Y_POSITION,
+                'xanchor': 'center',
+                'x': 0.5,
+                'traceorder': 'normal',
+            },
+            font={'size': self.FONT_SIZE},
+            plot_bgcolor='white',
+            hovermode=False
+        )
+
+        return fig
+
+    # ========== HELPER METHODS ==========
+
+    def _get_x_axis(self) -> List[str]:
+        return self._data_frame.columns.drop(self.MONTH_COLUMN).tolist()
+
+    def _get_x_axis_from_df(self, df: pd.DataFrame) -> List[str]:
+        return df.columns.drop(self.MONTH_COLUMN).tolist()
+
+    def _get_y_axis(self) -> List[str]:
+        return self._data_frame[self.MONTH_COLUMN].astype(str).tolist()
+
+
+# ========== EXAMPLE USAGE ==========
+
+if __name__ == "__main__":
+
+    data = {
+        'Month': ['Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug'],
+        '2023': [2, 1, 3, 0, 2, 4, 1, 0, 2, 1, 0, 1],
+        '2024': [1, 2, 5, 4, 6, 3, 0, 2, 2, 1, 1, 1],
+        '2025': [1, 0, 2, 0, 0, 1, 0, 0, 1, None, None, None]
+    }
+
+    metadata = {
+        'img_name': 'Blocker or critical incidents YTD',
+        'y_label': '#incidents (critical or blocker)'
+    }
+
+    # Create and build chart
+    builder = QSnapYtdChartBuilder()
+    fig = builder.set_data(data).set_metadata(metadata).set_image_size(600, 600).build()
+    fig.show()
+    # builder.export_to_png()
+
+    # Batch of KPIs: cumulative sums computed once for all of them, then reused by every chart
+    monthly_values = np.stack([pd.DataFrame(data).drop(columns='Month').to_numpy(dtype=float)] * 3)
+    ytd_batch = QSnapYtdChartBuilder.compute_ytd_batch(monthly_values)
+    for kpi_idx, kpi_ytd in enumerate(ytd_batch):
+        kpi_data = pd.DataFrame(kpi_ytd, columns=['2023', '2024', '2025'])
+        kpi_data.insert(0, 'Month', data['Month'])
+        builder.set_data(kpi_data, cumulative=True).set_metadata({'img_name': f'KPI {kpi_idx}', 'y_label': 'YTD'}).build()